@@ -13,9 +13,21 @@ if __name__ == "__main__":
         help="Only print specified zkVMs to console (e.g., --print-only ZisK Miden)",
         default=None,
     )
+    parser.add_argument(
+        "--throughput-profile",
+        help="Calibrated throughput profile for prover time estimates (see python -m soundcalc.calibrate)",
+        default=None,
+    )
+
+    parser.add_argument(
+        "--regimes",
+        nargs="+",
+        help="Regimes to analyze, overriding the zkVM configs (e.g., --regimes UDR JBR CONJ)",
+        default=None,
+    )
 
     args = parser.parse_args()
-    main(print_only=args.print_only)
+    main(print_only=args.print_only, throughput_profile=args.throughput_profile, regimes=args.regimes)
 
 
 
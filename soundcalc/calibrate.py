@@ -0,0 +1,201 @@
+"""
+Throughput calibration for the prover/verifier cost models.
+
+Microbenchmarks the hash functions available in hashlib and modular multiplication
+for the base fields in `soundcalc.common.fields`, and writes a throughput profile
+that can be loaded with `ThroughputProfile.load` (or `python -m soundcalc --throughput-profile`).
+
+Run with `python -m soundcalc.calibrate`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import platform
+import random
+import statistics
+import time
+from pathlib import Path
+from typing import Callable
+
+from soundcalc.common.fields import BABYBEAR_P, GOLDILOCKS_P, KOALABEAR_P, M31_P
+from soundcalc.costs.throughput import ThroughputProfile
+
+# NumPy is optional: with it, modular multiplication is vectorized, which is much
+# closer to native throughput than the pure-Python fallback.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Hashes we can benchmark, by hashlib name
+HASHES = ["sha256", "blake2s", "sha3_256"]
+
+# Base fields we benchmark, by name
+BASE_FIELDS = {
+    "Goldilocks": GOLDILOCKS_P,
+    "BabyBear": BABYBEAR_P,
+    "KoalaBear": KOALABEAR_P,
+    "M31": M31_P,
+}
+
+
+def _median_seconds(run: Callable[[], object], repeats: int) -> float:
+    """Runs `run` once to warm up, then `repeats` times, and returns the median wall-clock time."""
+    run()
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def benchmark_hash(name: str, iterations: int, repeats: int) -> float:
+    """
+    Returns the number of 2-to-1 compressions per second for the given hashlib hash,
+    i.e., hashes of two digests' worth of input.
+    """
+    hash_fn = getattr(hashlib, name)
+    data = bytes(i % 256 for i in range(2 * hash_fn().digest_size))
+
+    def run():
+        for _ in range(iterations):
+            hash_fn(data).digest()
+
+    return iterations / _median_seconds(run, repeats)
+
+
+def _goldilocks_mul_numpy(a, b):
+    """
+    Vectorized multiplication modulo the Goldilocks prime p = 2^64 - 2^32 + 1 on uint64 arrays.
+
+    Computes the 128-bit product from 32-bit limbs, then reduces it using
+    2^64 = 2^32 - 1 (mod p) and 2^96 = -1 (mod p). The result is correct modulo p,
+    but not necessarily canonical (it may exceed p).
+    """
+    mask = np.uint64(0xFFFFFFFF)
+    shift = np.uint64(32)
+    epsilon = np.uint64(0xFFFFFFFF)  # 2^64 mod p
+
+    a0, a1 = a & mask, a >> shift
+    b0, b1 = b & mask, b >> shift
+    ll, lh, hl, hh = a0 * b0, a0 * b1, a1 * b0, a1 * b1
+
+    # 128-bit product hi * 2^64 + lo
+    mid = lh + hl
+    mid_carry = (mid < lh).astype(np.uint64)
+    lo = ll + (mid << shift)
+    lo_carry = (lo < ll).astype(np.uint64)
+    hi = hh + (mid >> shift) + (mid_carry << shift) + lo_carry
+
+    # lo + hi0 * 2^64 + hi1 * 2^96 = lo + hi0 * (2^32 - 1) - hi1 (mod p)
+    hi0, hi1 = hi & mask, hi >> shift
+    t0 = lo - hi1
+    t0 = t0 - epsilon * (t0 > lo).astype(np.uint64)
+    t1 = hi0 * epsilon
+    result = t0 + t1
+    return result + epsilon * (result < t1).astype(np.uint64)
+
+
+def benchmark_field_mults(p: int, iterations: int, repeats: int, seed: int) -> tuple[float, str]:
+    """
+    Returns the number of modular multiplications per second for the prime p,
+    together with the backend used ("numpy" or "python").
+
+    Operands are drawn from a seeded generator, so runs are reproducible.
+    """
+    rng = random.Random(seed)
+    a = [rng.randrange(p) for _ in range(iterations)]
+    b = [rng.randrange(p) for _ in range(iterations)]
+
+    if np is not None and p == GOLDILOCKS_P:
+        a_np = np.array(a, dtype=np.uint64)
+        b_np = np.array(b, dtype=np.uint64)
+
+        def run():
+            _goldilocks_mul_numpy(a_np, b_np)
+
+        backend = "numpy"
+    # Products of two elements below 2^32 fit into an unsigned 64-bit integer
+    elif np is not None and p < 2**32:
+        a_np = np.array(a, dtype=np.uint64)
+        b_np = np.array(b, dtype=np.uint64)
+        p_np = np.uint64(p)
+
+        def run():
+            np.remainder(a_np * b_np, p_np)
+
+        backend = "numpy"
+    else:
+        def run():
+            [x * y % p for x, y in zip(a, b)]
+
+        backend = "python"
+
+    return iterations / _median_seconds(run, repeats), backend
+
+
+def calibrate(hash_name: str, iterations: int, repeats: int, seed: int, verbose: bool = True) -> tuple[ThroughputProfile, dict]:
+    """
+    Runs all microbenchmarks and returns the resulting profile, together with metadata
+    describing the measurements. The profile keeps the rate of every benchmarked hash,
+    and uses `hash_name` as the default for hash compressions.
+    """
+    hash_rates = {}
+    for name in HASHES:
+        hash_rates[name] = benchmark_hash(name, iterations, repeats)
+        if verbose:
+            print(f"  {name:<12} : {hash_rates[name]:.3e} compressions/s")
+
+    field_rates = {}
+    backends = {}
+    for name, p in BASE_FIELDS.items():
+        field_rates[p], backends[name] = benchmark_field_mults(p, iterations, repeats, seed)
+        if verbose:
+            print(f"  {name:<12} : {field_rates[p]:.3e} mults/s ({backends[name]})")
+
+    profile = ThroughputProfile(
+        name=f"calibrated ({platform.node() or 'unknown host'})",
+        field_mults_per_second=field_rates,
+        hash_compressions_per_second=hash_rates[hash_name],
+        hash_compressions_per_second_by_hash=hash_rates,
+    )
+    metadata = {
+        "hash": hash_name,
+        "field_mult_backends": backends,
+        "iterations": iterations,
+        "repeats": repeats,
+        "seed": seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    return profile, metadata
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="soundcalc - Calibrate throughput constants for the cost models"
+    )
+    parser.add_argument("--output", type=Path, default=Path("calibration.json"),
+                        help="Where to write the calibration profile (default: calibration.json)")
+    parser.add_argument("--hash", choices=HASHES, default="sha256",
+                        help="Default hash, for configs that do not name the hash of their Merkle trees (default: sha256)")
+    parser.add_argument("--iterations", type=int, default=100_000,
+                        help="Operations per timed run (default: 100000)")
+    parser.add_argument("--repeats", type=int, default=5,
+                        help="Number of timed runs; the median is reported (default: 5)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="Seed for the field operands (default: 0)")
+    args = parser.parse_args()
+
+    print("Calibrating throughput:")
+    profile, metadata = calibrate(args.hash, args.iterations, args.repeats, args.seed)
+    profile.save(args.output, metadata)
+    print(f"wrote :: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Math functions for the soundness formulas that work on floats, and (with NumPy) elementwise on arrays.
+
+The regimes, FRI and DEEP-ALI formulas are written with these, so that the same code evaluates
+a single circuit, or many circuits at once (e.g., all rows of a `CircuitTable`). On floats,
+they are the functions of the `math` module.
+"""
+
+from __future__ import annotations
+
+import math
+
+# NumPy is optional: without it, only the float versions are available
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def is_array(value) -> bool:
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def log2(x):
+    return np.log2(x) if is_array(x) else math.log2(x)
+
+
+def sqrt(x):
+    return np.sqrt(x) if is_array(x) else math.sqrt(x)
+
+
+def ceil(x):
+    return np.ceil(x) if is_array(x) else math.ceil(x)
+
+
+def maximum(a, b):
+    return np.maximum(a, b) if is_array(a) or is_array(b) else max(a, b)
+
+
+def all_true(condition) -> bool:
+    """Returns whether the condition holds (for every element, for arrays)."""
+    return bool(np.all(condition)) if is_array(condition) else bool(condition)
@@ -5,7 +5,9 @@ Preset finite fields to be used by the zkEVM configs
 from __future__ import annotations
 
 import math
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
 @dataclass(frozen=True)
@@ -42,95 +44,117 @@ class FieldParams:
 
 
 def _F(p: int, ext_size: int) -> float:
-    # Keep as float to match existing zkEVMConfig expectations
-    return math.pow(p, ext_size)
+    # Keep as float to match existing zkEVMConfig expectations, but round the exact
+    # integer p^{ext_size} (rather than accumulating floating point errors)
+    return float(p**ext_size)
+
+
+def _is_probable_prime(n: int) -> bool:
+    """
+    Miller-Rabin test with the first 12 primes as bases. This is deterministic for
+    n < 3.3 ⋅ 10^24 (covering all 31- and 64-bit primes), and probabilistic beyond.
+    """
+    bases = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37]
+    if n < 2:
+        return False
+    for q in bases:
+        if n % q == 0:
+            return n == q
+
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in bases:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = pow(x, 2, n)
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _get_2_valuation(n: int) -> int:
+    """Returns the largest s such that 2^s divides n."""
+    return (n & -n).bit_length() - 1
+
+
+def get_two_adicity(p: int, ext_size: int = 1) -> int:
+    """
+    Returns the 2-adicity of the FFT domains available over F_p (of extension degree ext_size).
+
+    This is the largest s such that 2^s divides p - 1. For primes with p = 3 mod 4 (such as
+    M31), p - 1 has a single factor of 2, and FFTs instead use the circle group (of order
+    p + 1) or the extension field. There, the 2-adicity is that of p^{ext_size} - 1.
+    """
+    if p % 4 == 3:
+        return _get_2_valuation(p**ext_size - 1)
+    return _get_2_valuation(p - 1)
 
 
 # Base fields
 GOLDILOCKS_P = (1 << 64) - (1 << 32) + 1
-# Goldilocks 2-adicity: 2^64 - 2^32 = 2^32 * (2^32 - 1). 32 is the max power of 2.
-GOLDILOCKS_TWO_ADICITY = 32
-
 BABYBEAR_P = (1 << 31) - (1 << 27) + 1
-# BabyBear 2-adicity: 2^31 - 2^27 = 2^27 * (2^4 - 1). 27 is the max power of 2.
-BABYBEAR_TWO_ADICITY = 27
-
 KOALABEAR_P = (1 << 31) - (1 << 24) + 1
-# KoalaBear 2-adicity: 2^31 - 2^24 = 2^24 * (2^7 - 1). 24 is the max power of 2.
-KOALABEAR_TWO_ADICITY = 24
-
 M31_P = (1 << 31) - 1
-# M31 has Needs an extension field to have any 2-adicity > 1
-
 # BN254 scalar field
 BN254_P = 21888242871839275222246405745257275088548364400416034343698204186575808495617
-# BN254 2-adicity: 2^28 * (some odd number).
-BN254_TWO_ADICITY = 28
+
+# Names of the base fields, as used in field strings and field names
+BASE_FIELDS = {
+    "Goldilocks": GOLDILOCKS_P,
+    "BabyBear": BABYBEAR_P,
+    "KoalaBear": KOALABEAR_P,
+    "M31": M31_P,
+    "BN254": BN254_P,
+}
+
+# 2^64 - 2^32 = 2^32 * (2^32 - 1)
+GOLDILOCKS_TWO_ADICITY = get_two_adicity(GOLDILOCKS_P)
+# 2^31 - 2^27 = 2^27 * (2^4 - 1)
+BABYBEAR_TWO_ADICITY = get_two_adicity(BABYBEAR_P)
+# 2^31 - 2^24 = 2^24 * (2^7 - 1)
+KOALABEAR_TWO_ADICITY = get_two_adicity(KOALABEAR_P)
+# 2^28 * (some odd number)
+BN254_TWO_ADICITY = get_two_adicity(BN254_P)
+
+_SUPERSCRIPT_DIGITS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+@lru_cache(maxsize=None)
+def get_field(p: int, ext_size: int = 1) -> FieldParams:
+    """
+    Returns the extension of degree ext_size of the prime field F_p, with its size and
+    2-adicity computed from p. Fields are cached, so the same field is returned for the
+    same parameters. Raises ValueError if p is not a prime or ext_size is not positive.
+    """
+    if ext_size < 1:
+        raise ValueError(f"Extension degree must be positive, got {ext_size}")
+    if not _is_probable_prime(p):
+        raise ValueError(f"{p} is not a prime")
+
+    base_name = next((name for name, q in BASE_FIELDS.items() if q == p), f"F_{p}")
+    return FieldParams(
+        name=base_name if ext_size == 1 else base_name + str(ext_size).translate(_SUPERSCRIPT_DIGITS),
+        p=p,
+        field_extension_degree=ext_size,
+        F=_F(p, ext_size),
+        two_adicity=get_two_adicity(p, ext_size),
+    )
+
 
 # Preset extension fields
-GOLDILOCKS_2 = FieldParams(
-    name="Goldilocks²",
-    p=GOLDILOCKS_P,
-    field_extension_degree=2,
-    F=_F(GOLDILOCKS_P, 2),
-    two_adicity=GOLDILOCKS_TWO_ADICITY,
-)
-
-GOLDILOCKS_3 = FieldParams(
-    name="Goldilocks³",
-    p=GOLDILOCKS_P,
-    field_extension_degree=3,
-    F=_F(GOLDILOCKS_P, 3),
-    two_adicity=GOLDILOCKS_TWO_ADICITY,
-)
-
-BABYBEAR_4 = FieldParams(
-    name="BabyBear⁴",
-    p=BABYBEAR_P,
-    field_extension_degree=4,
-    F=_F(BABYBEAR_P, 4),
-    two_adicity=BABYBEAR_TWO_ADICITY,
-)
-
-BABYBEAR_5 = FieldParams(
-    name="BabyBear⁵",
-    p=BABYBEAR_P,
-    field_extension_degree=5,
-    F=_F(BABYBEAR_P, 5),
-    two_adicity=BABYBEAR_TWO_ADICITY,
-)
-
-KOALABEAR_4 = FieldParams(
-    name="KoalaBear⁴",
-    p=KOALABEAR_P,
-    field_extension_degree=4,
-    F=_F(KOALABEAR_P, 4),
-    two_adicity=KOALABEAR_TWO_ADICITY,
-)
-
-M31_4 = FieldParams(
-    name="M31⁴",
-    p=M31_P,
-    field_extension_degree=4,
-    F=_F(M31_P, 4),
-    two_adicity=33,
-)
-
-M31_6 = FieldParams(
-    name="M31⁶",
-    p=M31_P,
-    field_extension_degree=6,
-    F=_F(M31_P, 6),
-    two_adicity=32,
-)
-
-BN254_1 = FieldParams(
-    name="BN254",
-    p=BN254_P,
-    field_extension_degree=1,
-    F=_F(BN254_P, 1),
-    two_adicity=BN254_TWO_ADICITY,
-)
+GOLDILOCKS_2 = get_field(GOLDILOCKS_P, 2)
+GOLDILOCKS_3 = get_field(GOLDILOCKS_P, 3)
+BABYBEAR_4 = get_field(BABYBEAR_P, 4)
+BABYBEAR_5 = get_field(BABYBEAR_P, 5)
+KOALABEAR_4 = get_field(KOALABEAR_P, 4)
+M31_4 = get_field(M31_P, 4)
+M31_6 = get_field(M31_P, 6)
+BN254_1 = get_field(BN254_P, 1)
 
 # Map field strings (as used in TOML configs) to FieldParams
 FIELD_MAP = {
@@ -145,11 +169,30 @@ FIELD_MAP = {
 }
 
 
+def get_extension_field(field: FieldParams, degree: int) -> FieldParams:
+    """
+    Returns the extension of the given field's base prime of the given degree.
+    """
+    return get_field(field.p, degree)
+
+
+# Field strings are either "<base field>^k" (e.g. "BabyBear^6") or "p=<prime>^k"
+# (e.g. "p=2013265921^4" or "p=0x78000001^4"), where "^k" may be omitted for k = 1.
+_FIELD_STR_PATTERN = re.compile(r"^(?:p=(?P<p>0x[0-9a-fA-F]+|[0-9]+)|(?P<base>[A-Za-z][A-Za-z0-9]*))(?:\^(?P<k>[0-9]+))?$")
+
+
 def parse_field(field_str: str) -> FieldParams:
     """
     Parse a field string from a TOML config into a FieldParams object.
     """
     field = FIELD_MAP.get(field_str)
-    if field is None:
+    if field is not None:
+        return field
+
+    match = _FIELD_STR_PATTERN.match(field_str.replace(" ", ""))
+    if match is None or (match["base"] is not None and match["base"] not in BASE_FIELDS):
         raise ValueError(f"Unknown field: {field_str}")
-    return field
+
+    p = int(match["p"], 0) if match["p"] is not None else BASE_FIELDS[match["base"]]
+    ext_size = int(match["k"]) if match["k"] is not None else 1
+    return get_field(p, ext_size)
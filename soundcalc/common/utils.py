@@ -2,8 +2,23 @@ from __future__ import annotations
 
 import math
 
+# NumPy is optional: with it, the log-domain error helpers below also work elementwise on
+# arrays of log errors (e.g., for a sweep over the number of queries or grinding bits).
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 KIB = (1024 * 8) # Kilobytes
 
+# Security levels are capped at this many bits. In particular, an error of zero (e.g., when
+# batching a single function) has log2 error -inf, and maps to this level.
+MAX_SECURITY_BITS = 2**16
+
+
+def _is_array(value) -> bool:
+    return np is not None and isinstance(value, np.ndarray)
+
 
 def get_rho_plus(H: int, D: float, max_combo: int) -> float:
     """Compute rho+. See page 16 of Ha22"""
@@ -11,67 +26,264 @@ def get_rho_plus(H: int, D: float, max_combo: int) -> float:
     # TODO Figure out
     return (H + max_combo) / D
 
-def get_bits_of_security_from_error(error: float) -> int:
+def get_bits_of_security_from_log_error(log_error: float) -> int:
+    """
+    Returns the maximum k such that 2^{log_error} <= 2^{-k}, capped at MAX_SECURITY_BITS.
+
+    All errors are carried as log2 values, so that tiny errors (e.g., (1 - δ)^t for many queries t)
+    do not underflow to 0.0. For an array of log errors, returns an array of levels.
+    """
+    if _is_array(log_error):
+        return np.minimum(np.floor(-log_error), MAX_SECURITY_BITS).astype(np.int64)
+    if -log_error >= MAX_SECURITY_BITS:
+        return MAX_SECURITY_BITS
+    return int(math.floor(-log_error))
+
+
+def get_log_error(error: float) -> float:
+    """
+    Returns log2 of an error given as a float (or an array of errors). An error of zero maps to -inf.
+    """
+    if _is_array(error):
+        with np.errstate(divide="ignore"):
+            return np.log2(error.astype(np.float64))
+    return math.log2(error) if error > 0 else -math.inf
+
+
+def log2_sum(*log_terms: float) -> float:
     """
-    Returns the maximum k such that error <= 2^{-k}
+    Returns log2(2^{a} + 2^{b} + ...) for log2 values a, b, ..., i.e., the log2 of the sum of errors.
+
+    This uses the log-sum-exp trick: the largest term is factored out, so none of the 2^{...} underflow.
+    If any term is an array, the sum is taken elementwise (terms are broadcast against each other).
     """
-    return int(math.floor(-math.log2(error)))
+    if any(_is_array(term) for term in log_terms):
+        terms = np.stack(np.broadcast_arrays(*[np.asarray(term, dtype=np.float64) for term in log_terms]))
+        return np.logaddexp2.reduce(terms, axis=0)
+    max_term = max(log_terms)
+    if max_term == -math.inf:
+        return -math.inf
+    return max_term + math.log2(sum(2 ** (term - max_term) for term in log_terms))
 
 
-def apply_grinding(error: float, grinding_bits: int) -> float:
+def apply_grinding(log_error: float, grinding_bits: int) -> float:
     """
-    Take a soundness error as input, apply `grinding_bits` of grinding and return it.
+    Take a soundness error (as log2 value) as input, apply `grinding_bits` of grinding and return it.
 
     Grinding is proof-of-work that the prover performs, reducing the soundness error by a factor of 2^grinding_bits.
+    This also works elementwise on arrays of log errors and grinding bits.
+    """
+    return log_error - grinding_bits
+
+
+def get_grinding_work(grinding_bits: list[int]) -> float:
+    """
+    Returns the expected number of hashes the prover computes for the given list of grinding steps.
+
+    Each step with c > 0 bits of grinding takes 2^c hashes in expectation. Steps with c = 0 do no grinding.
+    """
+    return sum(2 ** c for c in grinding_bits if c > 0)
+
+
+def get_num_hash_compressions(input_size_bits: int, hash_size_bits: int) -> int:
+    """
+    Returns the number of compressions needed to hash input_size_bits of data.
+
+    We count in units of a 2-to-1 compression function, i.e., one compression
+    absorbs 2 * hash_size_bits of input. Hashing anything takes at least one compression.
+    """
+    return max(1, math.ceil(input_size_bits / (2 * hash_size_bits)))
+
+
+def get_merkle_tree_depth(num_leafs: int, arity: int = 2) -> int:
+    """
+    Returns the depth of a Merkle tree with the given arity over num_leafs leaves,
+    i.e., the smallest t such that arity^t >= num_leafs.
+    """
+    assert num_leafs > 0
+    assert arity >= 2
+    depth = 0
+    while arity**depth < num_leafs:
+        depth += 1
+    return depth
+
+
+def get_num_merkle_tree_inner_nodes(num_leafs: int, arity: int = 2) -> int:
+    """
+    Returns the number of inner nodes of a Merkle tree with the given arity over num_leafs leaves.
+    """
+    num_nodes = 0
+    level_size = num_leafs
+    while level_size > 1:
+        level_size = math.ceil(level_size / arity)
+        num_nodes += level_size
+    return num_nodes
+
+
+def get_merkle_cap_size_bits(num_leafs: int, hash_size_bits: int, arity: int = 2, cap_height: int = 0) -> int:
+    """
+    Returns the size of a Merkle cap in bits: all arity^cap_height nodes at depth cap_height.
+    A cap of height 0 is just the root.
     """
-    return error * (2 ** (-grinding_bits))
+    cap_height = min(cap_height, get_merkle_tree_depth(num_leafs, arity))
+    return arity**cap_height * hash_size_bits
 
 
-def get_size_of_merkle_proof_bits(num_leafs: int, tuple_size: int, element_size_bits: int, hash_size_bits: int) -> int:
+def get_size_of_merkle_proof_bits(num_leafs: int, tuple_size: int, element_size_bits: int, hash_size_bits: int, arity: int = 2, cap_height: int = 0) -> int:
     """
     Compute the size of a Merkle path in bits.
 
     We assume a Merkle tree that represents num_leafs tuples of elements
     where each element has size element_size_bits and one tuple contains tuple_size
     many elements. Each leaf of the tree contains one such tuple.
+    Every inner node has `arity` children, so every level of the path contains
+    arity - 1 siblings. If the top cap_height levels of the tree are sent as a
+    Merkle cap, the path stops at the cap.
 
     Note: the result counts both the leaf itself and the Merkle path.
     """
     assert num_leafs > 0
     leaf_size = tuple_size * element_size_bits
-    sibling = min(tuple_size * element_size_bits, hash_size_bits)
-    tree_depth = math.ceil(math.log2(num_leafs))
-    co_path = (tree_depth - 1) * hash_size_bits
-    return leaf_size + sibling + co_path
+    tree_depth = get_merkle_tree_depth(num_leafs, arity)
+    path_length = tree_depth - min(cap_height, tree_depth)
+    if path_length == 0:
+        return leaf_size
+    siblings = (arity - 1) * min(tuple_size * element_size_bits, hash_size_bits)
+    co_path = (path_length - 1) * (arity - 1) * hash_size_bits
+    return leaf_size + siblings + co_path
 
-def get_size_of_merkle_multi_proof_bits_expected(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int,  hash_size_bits: int) -> int:
+def get_expected_num_distinct_openings(num_leafs: int, num_openings: int) -> int:
+    """
+    Returns the expected number of distinct leaves (rounded up) among num_openings
+    uniformly random openings of a tree with num_leafs leaves.
+
+    Each leaf is opened at least once with probability 1 - (1 - 1/num_leafs)^{num_openings}.
+    Leaves that are opened repeatedly are only sent (and hashed) once.
+    """
+    assert num_leafs > 0
+    return math.ceil(num_leafs * (1 - (1 - 1 / num_leafs)**num_openings))
+
+
+def get_size_of_merkle_multi_proof_bits_expected(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int,  hash_size_bits: int, arity: int = 2, cap_height: int = 0) -> int:
     """
     Compute the *expected* size of a Merkle multi-proof in bits.
 
-    We assume a Merkle tree that represents num_leafs leaves.
+    We assume a Merkle tree with the given arity that represents num_leafs leaves.
 
-    Note: the result counts both the leafs and the Merkle path.
+    Note: the result counts both the leafs and the Merkle path. Leaves opened by several
+    openings are only counted once, see `get_expected_num_distinct_openings`.
 
     For derivation see: https://xn--2-umb.com/25/merkle-multi-proof/#expected-value-1
     """
     assert num_leafs > 0
 
-    leafs_size = num_openings * tuple_size * element_size_bits
+    leafs_size = get_expected_num_distinct_openings(num_leafs, num_openings) * tuple_size * element_size_bits
+    num_hashes = get_num_merkle_multi_proof_hashes_expected(num_leafs, num_openings, arity, cap_height)
+    return leafs_size + num_hashes * hash_size_bits
+
+
+def get_num_merkle_multi_proof_hashes_expected(num_leafs: int, num_openings: int, arity: int = 2, cap_height: int = 0) -> int:
+    """
+    Compute the *expected* number of sibling hashes in a Merkle multi-proof.
+
+    A node at depth d is included in the proof if one of its siblings lies on the path
+    of some opening, but the node itself does not. Equivalently, its parent lies on a path
+    but the node does not. There are arity^d nodes at depth d, each on some path with
+    probability 1 - (1 - arity^{-d})^{num_openings}. Siblings that lie on a path are shared
+    with the other openings, and are not part of the proof.
+
+    Nodes at depth <= cap_height are part of the Merkle cap, and not of the proof.
+    """
+    assert num_leafs > 0
 
-    tree_depth = math.ceil(math.log2(num_leafs))
+    tree_depth = get_merkle_tree_depth(num_leafs, arity)
 
     num_hashes = 0
-    for d in range(1, tree_depth +1):
-        prob_sibling_in_proof = ((1 - 2**(-d))**num_openings - (1 - 2**(1-d))**num_openings)
-        num_hashes += math.ceil(2**d * prob_sibling_in_proof)
-    return leafs_size + num_hashes * hash_size_bits
+    for d in range(cap_height + 1, tree_depth +1):
+        prob_sibling_in_proof = ((1 - arity**(-d))**num_openings - (1 - arity**(1-d))**num_openings)
+        num_hashes += math.ceil(arity**d * prob_sibling_in_proof)
+    return num_hashes
 
 
-def get_size_of_merkle_multi_proof_bits(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int,  hash_size_bits: int, expected: bool) -> int:
+def get_num_merkle_multi_proof_compressions(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int, hash_size_bits: int, expected: bool, arity: int = 2, cap_height: int = 0) -> int:
+    """
+    Compute the *worst case* or *expected* number of hash compressions a verifier spends
+    on checking a Merkle multi-proof.
+
+    The verifier hashes every opened leaf (a tuple of tuple_size elements), and then recomputes
+    every inner node on the union of the authentication paths, up to the root (or up to the
+    Merkle cap, whose nodes are compared against the cap).
+    An inner node hashes `arity` digests. In the worst case, the paths do not overlap.
+    In the expected case, leaves opened more than once are only hashed once.
+    """
+    assert num_leafs > 0
+
+    num_distinct_openings = get_expected_num_distinct_openings(num_leafs, num_openings) if expected else num_openings
+    leaf_compressions = num_distinct_openings * get_num_hash_compressions(tuple_size * element_size_bits, hash_size_bits)
+    node_compressions = get_num_hash_compressions(arity * hash_size_bits, hash_size_bits)
+
+    tree_depth = get_merkle_tree_depth(num_leafs, arity)
+    cap_height = min(cap_height, tree_depth)
+    if expected:
+        # There are arity^d nodes at depth d, and each lies on the path of some opening
+        # with probability 1 - (1 - arity^{-d})^{num_openings}.
+        num_nodes = 0
+        for d in range(cap_height, tree_depth):
+            num_nodes += math.ceil(arity**d * (1 - (1 - arity**(-d))**num_openings))
+    else:
+        num_nodes = num_openings * (tree_depth - cap_height)
+    return leaf_compressions + num_nodes * node_compressions
+
+
+def get_size_of_merkle_multi_proof_bits(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int,  hash_size_bits: int, expected: bool, arity: int = 2, cap_height: int = 0) -> int:
     """
     Compute the *worst case* or *expected* size of a Merkle multi-proof in bits.
+    The Merkle cap (or root) is not included, see `get_merkle_cap_size_bits`.
     """
     if expected:
-        return get_size_of_merkle_multi_proof_bits_expected(num_leafs, num_openings, tuple_size, element_size_bits, hash_size_bits)
+        return get_size_of_merkle_multi_proof_bits_expected(num_leafs, num_openings, tuple_size, element_size_bits, hash_size_bits, arity, cap_height)
     else:
-        return num_openings * get_size_of_merkle_proof_bits(num_leafs, tuple_size, element_size_bits, hash_size_bits)
+        return num_openings * get_size_of_merkle_proof_bits(num_leafs, tuple_size, element_size_bits, hash_size_bits, arity, cap_height)
+
+
+def get_optimal_merkle_cap_height(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int, hash_size_bits: int, arity: int = 2) -> int:
+    """
+    Returns the Merkle cap height minimizing the expected size of the cap plus the multi-proof.
+
+    A higher cap shortens every path, but doubles (for binary trees) the size of the cap.
+    Ties are broken towards the lower cap.
+
+    Note that the top of the tree is already shared between the paths of a multi-proof,
+    so with path pruning a cap rarely pays off. Caps mostly help provers that send
+    independent paths (as in the worst case estimate).
+    """
+    tree_depth = get_merkle_tree_depth(num_leafs, arity)
+
+    def size(cap_height: int) -> int:
+        return get_merkle_cap_size_bits(num_leafs, hash_size_bits, arity, cap_height) + get_size_of_merkle_multi_proof_bits_expected(
+            num_leafs, num_openings, tuple_size, element_size_bits, hash_size_bits, arity, cap_height)
+
+    return min(range(tree_depth + 1), key=size)
+
+
+def resolve_merkle_cap_height(cap_height: int | str, num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int, hash_size_bits: int, arity: int = 2) -> int:
+    """
+    Resolves a configured Merkle cap height for one tree: either an integer (clamped to the
+    depth of the tree), or "auto" to pick the height minimizing the expected proof size.
+    """
+    if cap_height == "auto":
+        return get_optimal_merkle_cap_height(num_leafs, num_openings, tuple_size, element_size_bits, hash_size_bits, arity)
+    return min(cap_height, get_merkle_tree_depth(num_leafs, arity))
+
+
+def get_size_of_merkle_commitment_bits(num_leafs: int, num_openings: int, tuple_size: int, element_size_bits: int, hash_size_bits: int, expected: bool, arity: int = 2, cap_height: int | str = 0) -> tuple[int, int]:
+    """
+    Compute the size of committing to a Merkle tree and opening it, in bits.
+
+    Returns the size of the Merkle cap (the root, if cap_height is 0) and the *worst case*
+    or *expected* size of the multi-proof. cap_height may be "auto", see `resolve_merkle_cap_height`.
+    """
+    cap_height = resolve_merkle_cap_height(cap_height, num_leafs, num_openings, tuple_size, element_size_bits, hash_size_bits, arity)
+    cap_size = get_merkle_cap_size_bits(num_leafs, hash_size_bits, arity, cap_height)
+    multi_proof_size = get_size_of_merkle_multi_proof_bits(num_leafs, num_openings, tuple_size, element_size_bits, hash_size_bits, expected, arity, cap_height)
+    return cap_size, multi_proof_size
@@ -0,0 +1,133 @@
+"""
+Prover cost and memory models.
+
+We count the dominant operations of a hash-based prover: NTTs for the low-degree
+extension (LDE), field arithmetic for batching/folding/sumchecks, hashing of
+Merkle trees, and proof-of-work grinding. All field arithmetic is expressed in
+base field multiplications, so that it can be converted into time using a
+per-field throughput (see `soundcalc.costs.throughput`).
+
+As with the proof size, this is an estimate and should be treated as such.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+
+from soundcalc.common.fields import FieldParams
+from soundcalc.common.utils import get_num_merkle_tree_inner_nodes
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
+
+
+def get_ntt_field_mults(size: int) -> float:
+    """
+    Returns the number of field multiplications of a radix-2 NTT of the given size,
+    i.e., one multiplication per butterfly.
+    """
+    if size <= 1:
+        return 0
+    return (size / 2) * math.log2(size)
+
+
+def get_extension_mult_cost(field: FieldParams) -> int:
+    """
+    Returns the cost of one extension field multiplication, in base field multiplications
+    (schoolbook multiplication).
+    """
+    return field.field_extension_degree ** 2
+
+
+def get_mixed_mult_cost(field: FieldParams) -> int:
+    """
+    Returns the cost of multiplying an extension field element by a base field element,
+    in base field multiplications.
+    """
+    return field.field_extension_degree
+
+
+@dataclass(frozen=True)
+class ProverCost:
+    """
+    Operation counts for producing one proof of one circuit.
+    """
+    # Base field multiplications for the NTTs of the low-degree extension
+    lde_field_mults: float = 0
+    # Base field multiplications after the LDE (batching, folding, sumchecks, OOD answers)
+    commit_field_mults: float = 0
+    # Hash compressions for hashing the Merkle leaves
+    merkle_leaf_compressions: float = 0
+    # Hash compressions for the inner Merkle nodes
+    merkle_node_compressions: float = 0
+    # Expected number of hashes for proof-of-work grinding
+    grinding_hashes: float = 0
+
+    def __add__(self, other: "ProverCost") -> "ProverCost":
+        return ProverCost(
+            lde_field_mults=self.lde_field_mults + other.lde_field_mults,
+            commit_field_mults=self.commit_field_mults + other.commit_field_mults,
+            merkle_leaf_compressions=self.merkle_leaf_compressions + other.merkle_leaf_compressions,
+            merkle_node_compressions=self.merkle_node_compressions + other.merkle_node_compressions,
+            grinding_hashes=self.grinding_hashes + other.grinding_hashes,
+        )
+
+    def get_field_mults(self) -> float:
+        return self.lde_field_mults + self.commit_field_mults
+
+    def get_hash_compressions(self) -> float:
+        return self.merkle_leaf_compressions + self.merkle_node_compressions
+
+    def get_seconds_breakdown(self, field: FieldParams, profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                              hash_name: str | None = None) -> dict[str, float]:
+        """
+        Returns the estimated single-core prover time in seconds, per component.
+
+        Merkle hashing is converted with the rate of `hash_name` (the default rate of the profile
+        if not given), grinding with the proof-of-work hash rate of the profile.
+        """
+        return {
+            "LDE": profile.field_mults_to_seconds(self.lde_field_mults, field),
+            "commit": profile.field_mults_to_seconds(self.commit_field_mults, field),
+            "Merkle": profile.hash_compressions_to_seconds(self.get_hash_compressions(), hash_name),
+            "grinding": profile.grinding_hashes_to_seconds(self.grinding_hashes, hash_name),
+        }
+
+    def get_seconds(self, field: FieldParams, profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                    hash_name: str | None = None) -> float:
+        """Returns the estimated single-core prover time in seconds."""
+        return sum(self.get_seconds_breakdown(field, profile, hash_name).values())
+
+
+@dataclass(frozen=True)
+class ProverMemory:
+    """
+    Estimated memory held by the prover for one proof of one circuit, in bits.
+
+    All committed codewords and their Merkle trees must be kept until the query phase,
+    so the peak is (roughly) reached right before answering the queries, and is the
+    sum of all components.
+    """
+    # The low-degree extension of the committed columns (base field)
+    lde_bits: float = 0
+    # All Merkle trees, storing leaf digests and inner nodes
+    merkle_bits: float = 0
+    # Intermediate (batched/folded) codewords over the extension field
+    codeword_bits: float = 0
+
+    def __add__(self, other: "ProverMemory") -> "ProverMemory":
+        return ProverMemory(
+            lde_bits=self.lde_bits + other.lde_bits,
+            merkle_bits=self.merkle_bits + other.merkle_bits,
+            codeword_bits=self.codeword_bits + other.codeword_bits,
+        )
+
+    def get_peak_bits(self) -> float:
+        return self.lde_bits + self.merkle_bits + self.codeword_bits
+
+
+def get_merkle_tree_storage_bits(num_leafs: int, hash_size_bits: int, arity: int = 2) -> int:
+    """
+    Returns the memory needed to store a Merkle tree with the given arity over num_leafs leaves:
+    one digest per leaf and one per inner node.
+    """
+    return (num_leafs + get_num_merkle_tree_inner_nodes(num_leafs, arity)) * hash_size_bits
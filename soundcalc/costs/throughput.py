@@ -0,0 +1,135 @@
+"""
+Machine throughput profiles, used to turn operation counts into seconds.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from soundcalc.common.fields import (
+    BABYBEAR_P,
+    BN254_P,
+    FieldParams,
+    GOLDILOCKS_P,
+    KOALABEAR_P,
+    M31_P,
+)
+
+
+# Machine word sizes that field elements are grouped by, for fields a profile has no entry for
+_WORD_SIZES_BITS = (32, 64)
+
+
+def _get_word_size_bits(p: int) -> int | None:
+    """Returns the smallest machine word an element of F_p fits into (None if larger than all)."""
+    return next((bits for bits in _WORD_SIZES_BITS if p.bit_length() <= bits), None)
+
+
+@dataclass(frozen=True)
+class ThroughputProfile:
+    """
+    Single-core throughput of the basic operations a prover performs.
+
+    All prover/verifier cost estimates are expressed in base field multiplications
+    and hash compressions, and converted into seconds using such a profile.
+    """
+    name: str
+    # Base field multiplications per second, keyed by the base field characteristic p
+    field_mults_per_second: dict[int, float] = field(default_factory=dict)
+    # Hash compressions per second, where one compression absorbs two digests' worth of input.
+    # This is the default rate, used for hashes without an entry below.
+    hash_compressions_per_second: float = 1.0
+    # Hash compressions per second, keyed by the name of the hash (e.g. "sha256", "blake2s")
+    hash_compressions_per_second_by_hash: dict[str, float] = field(default_factory=dict)
+    # Proof-of-work hashes per second. Provers often grind with a different (and parallelized)
+    # hash than the one of their Merkle trees. If not set, a grinding attempt costs one compression.
+    grinding_hashes_per_second: float | None = None
+
+    def get_field_mults_per_second(self, field: FieldParams) -> float:
+        """
+        Returns the base field multiplication throughput for the base field of `field`.
+
+        For primes without an entry (e.g., custom fields from a config), this falls back to
+        the slowest entry whose prime fits into the same machine word (32 bits, 64 bits, or larger).
+        """
+        rate = self.field_mults_per_second.get(field.p)
+        if rate is not None:
+            return rate
+        word_size = _get_word_size_bits(field.p)
+        rates = [rate for p, rate in self.field_mults_per_second.items() if _get_word_size_bits(p) == word_size]
+        if not rates:
+            raise ValueError(f"Throughput profile '{self.name}' has no entry for the base field of {field.to_string()}")
+        return min(rates)
+
+    def field_mults_to_seconds(self, num_mults: float, field: FieldParams) -> float:
+        return num_mults / self.get_field_mults_per_second(field)
+
+    def get_hash_compressions_per_second(self, hash_name: str | None = None) -> float:
+        """
+        Returns the compression throughput of the given hash, or the default one
+        if the hash is not given or the profile has no entry for it.
+        """
+        return self.hash_compressions_per_second_by_hash.get(hash_name, self.hash_compressions_per_second)
+
+    def hash_compressions_to_seconds(self, num_compressions: float, hash_name: str | None = None) -> float:
+        return num_compressions / self.get_hash_compressions_per_second(hash_name)
+
+    def grinding_hashes_to_seconds(self, num_hashes: float, hash_name: str | None = None) -> float:
+        if self.grinding_hashes_per_second is None:
+            return self.hash_compressions_to_seconds(num_hashes, hash_name)
+        return num_hashes / self.grinding_hashes_per_second
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            # JSON keys must be strings
+            "field_mults_per_second": {str(p): rate for p, rate in self.field_mults_per_second.items()},
+            "hash_compressions_per_second": self.hash_compressions_per_second,
+            "hash_compressions_per_second_by_hash": self.hash_compressions_per_second_by_hash,
+            "grinding_hashes_per_second": self.grinding_hashes_per_second,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ThroughputProfile":
+        return cls(
+            name=data["name"],
+            field_mults_per_second={int(p): rate for p, rate in data["field_mults_per_second"].items()},
+            hash_compressions_per_second=data["hash_compressions_per_second"],
+            hash_compressions_per_second_by_hash=data.get("hash_compressions_per_second_by_hash", {}),
+            grinding_hashes_per_second=data.get("grinding_hashes_per_second"),
+        )
+
+    def save(self, path: Path, metadata: dict | None = None) -> None:
+        """
+        Write the profile as JSON. Optional metadata (e.g. how it was measured) is stored
+        alongside, and ignored when loading.
+        """
+        data = self.to_dict()
+        if metadata:
+            data["metadata"] = metadata
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+    @classmethod
+    def load(cls, path: Path) -> "ThroughputProfile":
+        """Load a profile written by `save` (e.g. by `python -m soundcalc.calibrate`)."""
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+# Indicative single-core numbers for a modern x86 machine.
+# These are only meant as a starting point; machine-specific numbers should be measured.
+DEFAULT_THROUGHPUT = ThroughputProfile(
+    name="default",
+    field_mults_per_second={
+        GOLDILOCKS_P: 4e8,
+        BABYBEAR_P: 8e8,
+        KOALABEAR_P: 8e8,
+        M31_P: 1e9,
+        BN254_P: 2e7,
+    },
+    hash_compressions_per_second=4e6,
+)
@@ -0,0 +1,41 @@
+"""
+Verifier cost model.
+
+We count the two operations that dominate a hash-based verifier, both natively and
+when arithmetized in a recursive verifier circuit: hash compressions (mostly for
+Merkle multi-proofs) and extension field multiplications (folding checks, DEEP/OOD
+and sumcheck rounds).
+
+As with the proof size, this is an estimate and should be treated as such.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from soundcalc.common.fields import FieldParams
+from soundcalc.costs.prover import get_extension_mult_cost
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
+
+
+@dataclass(frozen=True)
+class VerifierCost:
+    """
+    Operation counts for verifying one proof of one circuit.
+    """
+    # Hash compressions (leaf hashing and inner Merkle nodes)
+    hash_compressions: float = 0
+    # Extension field multiplications
+    ext_field_mults: float = 0
+
+    def __add__(self, other: "VerifierCost") -> "VerifierCost":
+        return VerifierCost(
+            hash_compressions=self.hash_compressions + other.hash_compressions,
+            ext_field_mults=self.ext_field_mults + other.ext_field_mults,
+        )
+
+    def get_seconds(self, field: FieldParams, profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                    hash_name: str | None = None) -> float:
+        """Returns the estimated native verifier time in seconds, hashing with `hash_name` (see `ThroughputProfile`)."""
+        field_mults = self.ext_field_mults * get_extension_mult_cost(field)
+        return profile.field_mults_to_seconds(field_mults, field) + profile.hash_compressions_to_seconds(self.hash_compressions, hash_name)
@@ -3,23 +3,39 @@ from __future__ import annotations
 import math
 
 from soundcalc.common.fields import FieldParams
+from soundcalc.common.utils import get_log_error
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
-def get_gkr_soundness_error(field: FieldParams, alphabet_size: int, num_lookups_M: int) -> float:
+
+def get_gkr_log_soundness_error(field: FieldParams, alphabet_size: int, num_lookups_M: int) -> float:
     """
-    Computes soundness error for the GKR protocol as:
+    Computes soundness error (as log2 value) for the GKR protocol as:
         (1/2) * (n + m) * (3 * (n + m) + 1) / |F|
     where:
         |F| is the field size,
         2^n is the alphabet size,
         m = log2(M), and M is the number of lookups.
+
+    With NumPy, this also works elementwise on arrays of alphabet sizes and numbers of lookups.
     """
-    if alphabet_size <= 0:
-        raise ValueError("alphabet_size must be positive")
-    if num_lookups_M <= 0:
-        raise ValueError("num_lookups_M must be positive")
+    if np is not None and isinstance(alphabet_size, np.ndarray):
+        if np.any(alphabet_size <= 0):
+            raise ValueError("alphabet_size must be positive")
+        if np.any(np.asarray(num_lookups_M) <= 0):
+            raise ValueError("num_lookups_M must be positive")
+        log2 = np.log2
+    else:
+        if alphabet_size <= 0:
+            raise ValueError("alphabet_size must be positive")
+        if num_lookups_M <= 0:
+            raise ValueError("num_lookups_M must be positive")
+        log2 = math.log2
 
-    n = math.log2(alphabet_size)
-    m = math.log2(num_lookups_M)
+    n = log2(alphabet_size)
+    m = log2(num_lookups_M)
     nm = n + m
-    return 0.5 * nm * (3 * nm + 1) / field.F
+    return get_log_error(0.5 * nm * (3 * nm + 1)) - math.log2(field.F)
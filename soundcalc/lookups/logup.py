@@ -2,11 +2,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 import math
+from typing import Sequence
 
 from soundcalc.common.fields import FieldParams
-from soundcalc.common.utils import get_bits_of_security_from_error
+from soundcalc.common.utils import apply_grinding, get_bits_of_security_from_log_error, get_log_error, log2_sum
 import soundcalc.lookups.gkr as gkr
 
+# NumPy is optional: with it, `get_soundness_bits_batch` evaluates all lookups in one array pass
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class LogUpType(Enum):
     UNIVARIATE = "univariate"
     MULTIVARIATE = "multivariate"
@@ -43,60 +50,204 @@ class LogUpConfig:
     # Reduction error for the Multivariate case (case i or ii)
     reduction_error: float = 0.0
 
+def _get_univariate_log_error(F: int, T: int, L: int, S: int, M: int) -> float:
+    """
+    Calculates univariate LogUp soundness error (as log2 value).
+    L, T may be equal to domain size if padded.
+    Single/Multi-column: (L + T) * S / F
+    Aggregation: M * (L + T) * S / F
+    """
+    return math.log2(M * (L + T) * S) - math.log2(F)
+
+
+def _get_multivariate_log_error(
+        field: FieldParams,
+        T: int,
+        L: int,
+        S: int,
+        M: int,
+        alphabet_size_H: int | None,
+        multilinear_fingerprint: bool,
+        reduction_error: float,
+) -> float:
+    """
+    Calculates multivariate LogUp soundness error (as log2 value).
+
+    alphabet_size is max{TS, LS} or padded height.
+    Single/Multi column (treated as tensors): 2 * alphabet_size / F
+    Aggregation: M * 2 * alphabet_size / F
+    """
+    batch_multiple = max(math.ceil(math.log2(S)), 1) if multilinear_fingerprint else S
+    alphabet_size = (L + T) / 2 * batch_multiple
+    alphabet_size_gkr_soundness = max(L, T) * batch_multiple
+    if alphabet_size_H is not None:
+        alphabet_size = alphabet_size_H
+        alphabet_size_gkr_soundness = alphabet_size_H
+    multivariate_error = math.log2(M * 2 * alphabet_size) - math.log2(field.F)
+
+    epsilon_gkr = gkr.get_gkr_log_soundness_error(field, alphabet_size_gkr_soundness, M)
+    return log2_sum(multivariate_error, get_log_error(reduction_error), epsilon_gkr)
+
+
+def _get_soundness_bits(
+        field: FieldParams,
+        multivariate: bool,
+        T: int,
+        L: int,
+        S: int,
+        M: int,
+        alphabet_size_H: int | None,
+        grinding_bits_lookup: int,
+        multilinear_fingerprint: bool,
+        reduction_error: float,
+) -> int:
+    """
+    Calculates epsilon_sum as seen in math companion: "Lookup soundness calculation" section,
+    applies grinding, and returns it in bits of security.
+    """
+    if multivariate:
+        error = _get_multivariate_log_error(field, T, L, S, M, alphabet_size_H, multilinear_fingerprint, reduction_error)
+    else:
+        error = _get_univariate_log_error(field.F, T, L, S, M)
+    error = apply_grinding(error, grinding_bits_lookup)
+    return get_bits_of_security_from_log_error(error)
+
+
+def _get_soundness_bits_numpy(
+        field: FieldParams,
+        multivariate: Sequence[bool],
+        T: Sequence[int],
+        L: Sequence[int],
+        S: Sequence[int],
+        M: Sequence[int],
+        alphabet_size_H: Sequence[int | None],
+        grinding_bits_lookup: Sequence[int],
+        multilinear_fingerprint: Sequence[bool],
+        reduction_error: Sequence[float],
+) -> list[int]:
+    """
+    Same as `_get_soundness_bits`, evaluated over columns at once (requires NumPy).
+    Entries of `alphabet_size_H` that are None or negative are missing.
+    """
+    multivariate = np.asarray(multivariate, dtype=bool)
+    T = np.asarray(T, dtype=np.float64)
+    L = np.asarray(L, dtype=np.float64)
+    S = np.asarray(S, dtype=np.float64)
+    M = np.asarray(M, dtype=np.float64)
+    # None becomes NaN, which (like negative entries) is not a given alphabet size
+    H = np.asarray(alphabet_size_H, dtype=np.float64)
+    log_F = math.log2(field.F)
+
+    # As in `_get_univariate_log_error`
+    univariate_error = np.log2(M * (L + T) * S) - log_F
+
+    # As in `_get_multivariate_log_error`. Univariate rows get a dummy alphabet size,
+    # so that the GKR error is defined everywhere.
+    batch_multiple = np.where(multilinear_fingerprint, np.maximum(np.ceil(np.log2(S)), 1), S)
+    has_H = np.nan_to_num(H, nan=-1) >= 0
+    alphabet_size = np.where(has_H, H, (L + T) / 2 * batch_multiple)
+    alphabet_size_gkr_soundness = np.where(multivariate, np.where(has_H, H, np.maximum(L, T) * batch_multiple), 1)
+    with np.errstate(divide="ignore"):
+        multivariate_error = np.log2(M * 2 * alphabet_size) - log_F
+    epsilon_gkr = gkr.get_gkr_log_soundness_error(field, alphabet_size_gkr_soundness, M)
+    multivariate_error = log2_sum(
+        multivariate_error, get_log_error(np.asarray(reduction_error, dtype=np.float64)), epsilon_gkr
+    )
+
+    error = np.where(multivariate, multivariate_error, univariate_error)
+    error = apply_grinding(error, np.asarray(grinding_bits_lookup, dtype=np.float64))
+    return get_bits_of_security_from_log_error(error).tolist()
+
+
 class LogUp:
     def __init__(self, config: LogUpConfig):
         self.config = config
 
-    def _calculate_univariate_error(self, F: int, T: int, L: int, S: int, M: int) -> float:
-        """
-        Calculates univariate LogUp soundness error.
-        L, T may be equal to domain size if padded.
-        Single/Multi-column: (L + T) * S / F
-        Aggregation: M * (L + T) * S / F
-        """
-        return (M * (L + T) * S) / F
-
-    def _calculate_multivariate_error(self, F: int, T: int, L: int, S: int, M: int) -> float:
-        """
-        Calculates multivariate LogUp soundness error.
-
-        alphabet_size is max{TS, LS} or padded height.
-        Single/Multi column (treated as tensors): 2 * alphabet_size / F
-        Aggregation: M * 2 * alphabet_size / F
-        """
-        batch_multiple = max(math.ceil(math.log2(S)), 1) if self.config.multilinear_fingerprint else S
-        alphabet_size = (L + T) / 2 * batch_multiple
-        alphabet_size_gkr_soundness = max(L, T) * batch_multiple
-        if self.config.alphabet_size_H is not None:
-            alphabet_size = self.config.alphabet_size_H
-            alphabet_size_gkr_soundness = self.config.alphabet_size_H
-        multivariate_error = (M * 2 * alphabet_size) / F + self.config.reduction_error
-
-        epsilon_gkr = gkr.get_gkr_soundness_error(self.config.field, alphabet_size_gkr_soundness, M)
-        return multivariate_error + epsilon_gkr
-
-    def _calculate_soundness_error(self) -> float:
-        """
-        Calculates epsilon_sum as seen in math companion: "Lookup soundness calculation" section
-        """
-        F = self.config.field.F
-        T = self.config.rows_T
-        L = self.config.rows_L
-        S = self.config.num_columns_S
-        M = self.config.num_lookups_M
-
-        if self.config.logup_type == LogUpType.UNIVARIATE:
-            return self._calculate_univariate_error(F, T, L, S, M)
-        else:
-            assert self.config.logup_type == LogUpType.MULTIVARIATE
-            return self._calculate_multivariate_error(F, T, L, S, M)
-
     def get_soundness_bits(self) -> int:
         """Returns LogUp soundness in bits of security."""
-        total_error = self._calculate_soundness_error()
-        # Add grinding
-        total_error *= 2 ** (-self.config.grinding_bits_lookup)
-        return get_bits_of_security_from_error(total_error)
+        config = self.config
+        assert config.logup_type in (LogUpType.UNIVARIATE, LogUpType.MULTIVARIATE)
+        return _get_soundness_bits(
+            config.field,
+            config.logup_type == LogUpType.MULTIVARIATE,
+            config.rows_T,
+            config.rows_L,
+            config.num_columns_S,
+            config.num_lookups_M,
+            config.alphabet_size_H,
+            config.grinding_bits_lookup,
+            config.multilinear_fingerprint,
+            config.reduction_error,
+        )
 
     def get_name(self) -> str:
         return self.config.name
+
+
+def get_soundness_bits_batch(
+        field: FieldParams,
+        multivariate: Sequence[bool],
+        rows_T: Sequence[int],
+        rows_L: Sequence[int],
+        num_columns_S: Sequence[int],
+        num_lookups_M: Sequence[int],
+        alphabet_size_H: Sequence[int | None],
+        grinding_bits_lookup: Sequence[int],
+        multilinear_fingerprint: Sequence[bool],
+        reduction_error: Sequence[float],
+) -> list[int]:
+    """
+    Computes LogUp soundness in bits of security for many lookups at once.
+
+    Each argument is a column with one entry per lookup (entries of `alphabet_size_H`
+    may be None, or negative, to derive the alphabet size from the table sizes).
+    The result agrees entry-wise with `LogUp.get_soundness_bits`, but the columns are processed
+    without building `LogUpConfig`/`LogUp` objects. With NumPy, all lookups are evaluated in
+    one array pass; otherwise, one at a time.
+    """
+    n = len(rows_L)
+    columns = (multivariate, rows_T, num_columns_S, num_lookups_M, alphabet_size_H,
+               grinding_bits_lookup, multilinear_fingerprint, reduction_error)
+    assert all(len(column) == n for column in columns), "All lookup columns must have the same length"
+
+    if np is not None and n > 0:
+        return _get_soundness_bits_numpy(
+            field, multivariate, rows_T, rows_L, num_columns_S, num_lookups_M, alphabet_size_H,
+            grinding_bits_lookup, multilinear_fingerprint, reduction_error,
+        )
+
+    bits = []
+    for i in range(n):
+        # Negative alphabet sizes mark missing entries, as None does
+        H = alphabet_size_H[i]
+        if H is not None and H < 0:
+            H = None
+        bits.append(_get_soundness_bits(
+            field, multivariate[i], rows_T[i], rows_L[i], num_columns_S[i], num_lookups_M[i], H,
+            grinding_bits_lookup[i], multilinear_fingerprint[i], reduction_error[i],
+        ))
+    return bits
+
+
+def get_soundness_bits_for_lookups(lookups: Sequence[LogUp]) -> list[int]:
+    """
+    Returns the soundness bits of a list of LogUp instances (over the same field),
+    computed with `get_soundness_bits_batch`.
+    """
+    if not lookups:
+        return []
+    configs = [lookup.config for lookup in lookups]
+    field = configs[0].field
+    assert all(config.field == field for config in configs), "All lookups must be over the same field"
+    return get_soundness_bits_batch(
+        field=field,
+        multivariate=[config.logup_type == LogUpType.MULTIVARIATE for config in configs],
+        rows_T=[config.rows_T for config in configs],
+        rows_L=[config.rows_L for config in configs],
+        num_columns_S=[config.num_columns_S for config in configs],
+        num_lookups_M=[config.num_lookups_M for config in configs],
+        alphabet_size_H=[config.alphabet_size_H for config in configs],
+        grinding_bits_lookup=[config.grinding_bits_lookup for config in configs],
+        multilinear_fingerprint=[config.multilinear_fingerprint for config in configs],
+        reduction_error=[config.reduction_error for config in configs],
+    )
@@ -6,8 +6,12 @@ Loads zkVMs and produces soundness reports
 
 from __future__ import annotations
 
-from soundcalc.zkvms import risc0, miden, zisk, dummy_whir, pico, openvm, airbender, sp1
+from dataclasses import replace
+
+from soundcalc.zkvms import risc0, miden, zisk, dummy_whir, dummy_stir, pico, openvm, airbender, sp1
 from soundcalc import report_cli, report_md
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
+from soundcalc.zkvms.zkvm import zkVM
 
 # All zkVM loaders
 _LOADERS = [
@@ -15,6 +19,7 @@ _LOADERS = [
     ("Miden", miden.load),
     ("RISC0", risc0.load),
     ("DummyWHIR", dummy_whir.load),
+    ("DummySTIR", dummy_stir.load),
     ("Pico", pico.load),
     ("OpenVM", openvm.load),
     ("Airbender", airbender.load),
@@ -44,14 +49,44 @@ def _load_zkvms():
     return zkvms
 
 
-def main(print_only: list[str] | None = None) -> None:
+def load_zkvm(name: str) -> zkVM:
+    """
+    Load a single zkVM by the name of its loader (e.g., "ZisK"), without loading the others.
+    Raises ValueError for unknown names, and KeyError for incomplete configurations.
+    """
+    loaders = dict(_LOADERS)
+    if name not in loaders:
+        raise ValueError(f"Unknown zkVM '{name}', available: {', '.join(loaders)}")
+    return loaders[name]()
+
+
+def _load_throughput_profile(path: str | None) -> ThroughputProfile:
+    """
+    Load a calibrated throughput profile (see `python -m soundcalc.calibrate`).
+    Fields the profile does not cover fall back to the default profile.
+    """
+    if path is None:
+        return DEFAULT_THROUGHPUT
+
+    profile = ThroughputProfile.load(path)
+    return replace(
+        profile,
+        field_mults_per_second=DEFAULT_THROUGHPUT.field_mults_per_second | profile.field_mults_per_second,
+    )
+
+
+def main(print_only: list[str] | None = None, throughput_profile: str | None = None,
+         regimes: list[str] | None = None) -> None:
     """
     Main entry point for soundcalc.
 
-    Analyze multiple zkVMs across different security regimes,
-    generate reports, and save results to disk.
+    Analyze multiple zkVMs across different security regimes (by default, those of
+    the zkVM configs), generate reports, and save results to disk.
     """
+    profile = _load_throughput_profile(throughput_profile)
     all_zkvms = _load_zkvms()
+    if regimes:
+        all_zkvms = [zkvm.with_regimes(regimes) for zkvm in all_zkvms]
 
     if print_only:
         filter_names = [p.lower() for p in print_only]
@@ -59,8 +94,8 @@ def main(print_only: list[str] | None = None) -> None:
     else:
         zkvms = all_zkvms
 
-    report_cli.print_summaries(zkvms)
-    report_md.generate_and_save_reports(zkvms)
+    report_cli.print_summaries(zkvms, profile)
+    report_md.generate_and_save_reports(zkvms, profile)
 
 
 if __name__ == "__main__":
@@ -4,13 +4,27 @@ from dataclasses import dataclass
 from math import log2
 from typing import Optional
 
+from soundcalc.common import elementwise
 from soundcalc.common.fields import FieldParams
-from soundcalc.common.utils import apply_grinding, get_bits_of_security_from_error, get_size_of_merkle_multi_proof_bits, get_size_of_merkle_proof_bits
+from soundcalc.common.utils import apply_grinding, get_bits_of_security_from_log_error, get_expected_num_distinct_openings, get_grinding_work, get_num_hash_compressions, get_num_merkle_multi_proof_compressions, get_num_merkle_tree_inner_nodes, get_size_of_merkle_commitment_bits, get_size_of_merkle_proof_bits, resolve_merkle_cap_height
+from soundcalc.costs.prover import ProverCost, ProverMemory, get_extension_mult_cost, get_merkle_tree_storage_bits, get_mixed_mult_cost, get_ntt_field_mults
+from soundcalc.costs.verifier import VerifierCost
 from soundcalc.pcs.pcs import PCS
 from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
 
 
-def get_FRI_proof_size_bits(
+@dataclass(frozen=True)
+class CommitmentGroup:
+    """
+    A set of columns committed to in one Merkle tree, e.g., the preprocessed, main,
+    auxiliary (permutation/lookup) or quotient columns of a STARK.
+    """
+    name: str
+    # Number of functions (columns) committed to in this tree
+    width: int
+
+
+def get_FRI_proof_size_breakdown(
         hash_size_bits: int,
         field_size_bits: int,
         batch_size: int,
@@ -18,12 +32,21 @@ def get_FRI_proof_size_bits(
         domain_size: int,
         folding_factors: list[int],
         rate: int,
-        expected: bool
-) -> int:
+        expected: bool,
+        merkle_arity: int = 2,
+        merkle_cap_height: int | str = 0,
+        commitment_groups: Optional[list[CommitmentGroup]] = None
+) -> dict[str, int]:
     """
-    Compute the proof size or expected proof size of a (BCS-transformed) FRI interaction in bits.
+    Compute the proof size or expected proof size of a (BCS-transformed) FRI interaction in bits,
+    broken down into its components: Merkle roots (or caps), the openings of the initial layer
+    and of each folding round, and the final polynomial. All Merkle trees have the given arity
+    and cap height (which may be "auto", to minimize the expected size of every tree).
+
+    If commitment groups are given, the initial functions are committed to in one tree per
+    group, and the openings of each group are listed separately. Otherwise, all batch_size
+    initial functions share one tree.
     """
-
     # TODO: the following things are not yet considered.
     #   - is there really a Merkle root (and paths) for the final round? Or just the codeword itself?
 
@@ -32,44 +55,144 @@ def get_FRI_proof_size_bits(
     #
     # We use the same loop as in `get_num_FRI_folding_rounds`, and count the size that
     # this layer contributes, which includes the root and all Merkle paths.
+    breakdown = {"roots": 0}
 
-    size_bits = 0
-
-    # Initial Round: one root and opening the queries
-    # We assume that for the initial functions, there is only one Merkle root, and
-    # each leaf i for that root contains symbols i for all initial functions.
+    # Initial Round: one root per commitment group and opening the queries
+    # Each leaf i of a group's tree contains symbols i for all functions of that group.
+    # Without commitment groups, there is only one Merkle root for all initial functions.
     n = int(domain_size)
     num_leafs = n
-    tuple_size = batch_size
-    size_bits += hash_size_bits # root
-    size_bits += get_size_of_merkle_multi_proof_bits(num_leafs, num_queries, tuple_size, field_size_bits, hash_size_bits, expected) # queries
+    if commitment_groups is None:
+        cap_size, multi_proof_size = get_size_of_merkle_commitment_bits(num_leafs, num_queries, batch_size, field_size_bits, hash_size_bits, expected, merkle_arity, merkle_cap_height)
+        breakdown["roots"] += cap_size
+        breakdown["initial openings"] = multi_proof_size
+    else:
+        for group in commitment_groups:
+            cap_size, multi_proof_size = get_size_of_merkle_commitment_bits(num_leafs, num_queries, group.width, field_size_bits, hash_size_bits, expected, merkle_arity, merkle_cap_height)
+            breakdown["roots"] += cap_size
+            breakdown[f"initial openings ({group.name})"] = multi_proof_size
 
     # Now we have folded these batch_size initial functions into one
     # Next, we start with the folding rounds.
-
     # We assume that "siblings" for the following layers are grouped together
     # in one leaf. This is natural as they always need to be opened together.
-
     rounds = len(folding_factors)
     for i in range(rounds):
-
         # in our current domain, we group together all siblings (sometimes denoted Block(z) in the literature)
         num_leafs = n // int(folding_factors[i])
         tuple_size = folding_factors[i]
-
-        # one root and one path per query
-        size_bits += hash_size_bits # root
-        size_bits += get_size_of_merkle_multi_proof_bits(num_leafs, num_queries, tuple_size, field_size_bits, hash_size_bits, expected) # queries
-
+        # one root (or cap) and one path per query
+        cap_size, multi_proof_size = get_size_of_merkle_commitment_bits(num_leafs, num_queries, tuple_size, field_size_bits, hash_size_bits, expected, merkle_arity, merkle_cap_height)
+        breakdown["roots"] += cap_size
+        breakdown[f"round {i+1} openings"] = multi_proof_size
         # next domain size is given by applying folding
         n = n // int(folding_factors[i])
 
     # for the final round, we send the function in the clear.
     # note that we don't need to send the full function, but can just send
     # the polynomial that describes it
-    size_bits += rate * n * field_size_bits
+    breakdown["final polynomial"] = rate * n * field_size_bits
+
+    return breakdown
+
+
+def get_FRI_proof_size_bits(
+        hash_size_bits: int,
+        field_size_bits: int,
+        batch_size: int,
+        num_queries: int,
+        domain_size: int,
+        folding_factors: list[int],
+        rate: int,
+        expected: bool,
+        merkle_arity: int = 2,
+        merkle_cap_height: int | str = 0,
+        commitment_groups: Optional[list[CommitmentGroup]] = None
+) -> int:
+    """
+    Compute the proof size or expected proof size of a (BCS-transformed) FRI interaction in bits.
+    This is the sum of the components in `get_FRI_proof_size_breakdown`.
+    """
+    return sum(get_FRI_proof_size_breakdown(
+        hash_size_bits, field_size_bits, batch_size, num_queries, domain_size, folding_factors, rate, expected, merkle_arity, merkle_cap_height, commitment_groups
+    ).values())
+
+
+def get_FRI_expected_num_distinct_positions(domain_size: int, folding_factors: list[int], num_queries: int) -> list[int]:
+    """
+    Returns the expected number of distinct positions that num_queries random queries open
+    in every layer of FRI: first in the initial domain, then in the tree of every folding round.
+
+    A query at position x of the initial domain opens leaf x mod (n / f) in a folding round
+    on a domain of size n with folding factor f. The leaves of that tree are the positions of
+    the folded domain, so the last entry also counts the positions in the final domain.
+    Queries that land in the same coset collapse, so later layers open fewer distinct positions.
+    As folding maps uniformly random positions to uniformly random positions, the number of
+    distinct positions of a layer only depends on its size.
+    """
+    n = int(domain_size)
+    positions = [get_expected_num_distinct_openings(n, num_queries)]
+    for folding_factor in folding_factors:
+        n //= int(folding_factor)
+        positions.append(get_expected_num_distinct_openings(n, num_queries))
+    return positions
+
 
-    return size_bits
+def get_FRI_batching_log_error(
+        regime: ProximityGapsRegime,
+        rate: float,
+        dimension: int,
+        batch_size: int,
+        power_batching: bool,
+        multilinear_batching: bool,
+        grinding_bits: int
+) -> float:
+    """
+    Returns the error (as log2 value) of batching batch_size functions, after grinding.
+    This depends on whether batching is done with powers, eq coefficients or random coefficients.
+
+    Like all FRI error terms below, this works elementwise on arrays of parameters (for a fixed
+    regime and batching strategy), e.g., to evaluate many circuits at once.
+    """
+    if power_batching:
+        epsilon = regime.get_log_error_powers(rate, dimension, batch_size)
+    elif multilinear_batching:
+        epsilon = regime.get_log_error_multilinear(rate, dimension, batch_size)
+    else:
+        epsilon = regime.get_log_error_linear(rate, dimension)
+
+    return apply_grinding(epsilon, grinding_bits)
+
+
+def get_FRI_commit_phase_log_error(
+        regime: ProximityGapsRegime,
+        rate: float,
+        dimension: float,
+        folding_factor: int,
+        grinding_bits: int
+) -> float:
+    """
+    Returns the error (as log2 value) of a round of the commit phase, after grinding, where
+    dimension is the dimension of the code after folding.
+    """
+    epsilon = regime.get_log_error_powers(rate, dimension, folding_factor)
+    return apply_grinding(epsilon, grinding_bits)
+
+
+def get_FRI_query_phase_log_error(
+        regime: ProximityGapsRegime,
+        rate: float,
+        dimension: int,
+        num_queries: int,
+        grinding_bits: int
+) -> float:
+    """
+    Returns the error (as log2 value) of the query phase, after grinding.
+    """
+    # error is (1-pp)^number of queries
+    pp = regime.get_proximity_parameter(rate, dimension)
+    epsilon = num_queries * elementwise.log2(1 - pp)
+    return apply_grinding(epsilon, grinding_bits)
 
 
 @dataclass(frozen=True)
@@ -132,6 +255,15 @@ class FRIConfig:
     # Optional override for the bound *gap*.
     # (This is useful to pin fixed parameters in TOML configs.)
     gap_to_radius: Optional[float] = None
+    # Number of children of every inner node of the Merkle trees (2 for binary trees)
+    merkle_arity: int = 2
+    # Number of top layers of every Merkle tree sent as a "cap" instead of the root (0 sends the root).
+    # "auto" picks, per tree, the height minimizing the expected proof size.
+    merkle_cap_height: int | str = 0
+    # Optional split of the batch_size initial functions into separately committed groups
+    # (e.g. preprocessed, main, auxiliary and quotient columns). The widths must add up to
+    # batch_size. If not set, all initial functions are committed to in a single tree.
+    commitment_groups: Optional[list[CommitmentGroup]] = None
 
 class FRI(PCS):
     """
@@ -140,6 +272,8 @@ class FRI(PCS):
 
     def __init__(self, config: FRIConfig):
         self.hash_size_bits = config.hash_size_bits
+        self.merkle_arity = config.merkle_arity
+        self.merkle_cap_height = config.merkle_cap_height
         self.rho = config.rho
         self.trace_length = config.trace_length
         self.batch_size = config.batch_size
@@ -152,6 +286,14 @@ class FRI(PCS):
         self.grinding_commit_phase = config.grinding_commit_phase
         self.grinding_batching_phase = config.grinding_batching_phase
         self.gap_to_radius = config.gap_to_radius
+        self.commitment_groups = config.commitment_groups
+
+        if self.commitment_groups is not None:
+            total_width = sum(group.width for group in self.commitment_groups)
+            if total_width != self.batch_size:
+                raise ValueError(
+                    f"Commitment group widths add up to {total_width}, but batch_size is {self.batch_size}"
+                )
 
         # Negative log of rate
         self.k = int(round(-log2(self.rho)))
@@ -166,9 +308,14 @@ class FRI(PCS):
         # Extension field size |F| = p^{ext_size}
         self.field = config.field
         self.field_size = config.field.F
+        # Keep the config around, so that variants of this instance can be derived
+        self.config = config
 
         # Compute number of FRI folding rounds
         self.FRI_rounds_n = self._get_num_folding_rounds()
+        # Dimension of the code after each folding round. These do not depend on the regime,
+        # so they are shared by the security analysis of all regimes.
+        self.commit_round_dimensions = self._get_commit_round_dimensions()
 
     def get_pcs_security_levels(self, regime: ProximityGapsRegime) -> dict[str, int]:
         """
@@ -177,66 +324,41 @@ class FRI(PCS):
         bits = {}
 
         # Compute FRI errors for batching
-        bits["batching"] = get_bits_of_security_from_error(self._get_batching_error(regime))
+        bits["batching"] = get_bits_of_security_from_log_error(self._get_batching_log_error(regime))
 
         # Compute FRI error for folding / commit phase
         FRI_rounds = self.FRI_rounds_n
         for i in range(FRI_rounds):
-            bits[f"commit round {i+1}"] = get_bits_of_security_from_error(self._get_commit_phase_error(i, regime))
+            bits[f"commit round {i+1}"] = get_bits_of_security_from_log_error(self._get_commit_phase_log_error(i, regime))
 
         # Compute FRI error for query phase
-        bits["query phase"] = get_bits_of_security_from_error(self._get_query_phase_error(regime))
+        bits["query phase"] = get_bits_of_security_from_log_error(self._get_query_phase_log_error(regime))
 
         return bits
 
-    def _get_batching_error(self, regime: ProximityGapsRegime) -> float:
+    def _get_batching_log_error(self, regime: ProximityGapsRegime) -> float:
         """
-        Returns the error due to the batching step. This depends on whether batching is done
+        Returns the error (as log2 value) due to the batching step. This depends on whether batching is done
         with powers or with random coefficients.
         """
-        rate = self.rho
-        dimension = self.trace_length
-
-        if self.power_batching:
-            epsilon = regime.get_error_powers(rate, dimension, self.batch_size)
-        elif self.multilinear_batching:
-            epsilon = regime.get_error_multilinear(rate, dimension, self.batch_size)
-        else:
-            epsilon = regime.get_error_linear(rate, dimension)
-
-        return apply_grinding(epsilon, self.grinding_batching_phase)
+        return get_FRI_batching_log_error(
+            regime, self.rho, self.trace_length, self.batch_size,
+            self.power_batching, self.multilinear_batching, self.grinding_batching_phase
+        )
 
-    def _get_commit_phase_error(self, round: int, regime: ProximityGapsRegime) -> float:
+    def _get_commit_phase_log_error(self, round: int, regime: ProximityGapsRegime) -> float:
         """
-        Returns the error from a round of the commit phase.
+        Returns the error (as log2 value) from a round of the commit phase.
         """
-        rate = self.rho
-
-        acc_folding_factor = 1
-        for i in range(round + 1):
-            acc_folding_factor *= self.FRI_folding_factors[i]
-
-        dimension = self.trace_length / acc_folding_factor
-
-        epsilon = regime.get_error_powers(rate, dimension, self.FRI_folding_factors[round])
-
-        return apply_grinding(epsilon, self.grinding_commit_phase)
+        return get_FRI_commit_phase_log_error(
+            regime, self.rho, self.commit_round_dimensions[round], self.FRI_folding_factors[round], self.grinding_commit_phase
+        )
 
-    def _get_query_phase_error(self, regime: ProximityGapsRegime) -> float:
+    def _get_query_phase_log_error(self, regime: ProximityGapsRegime) -> float:
         """
-        Returns the error from the FRI query phase, including grinding.
+        Returns the error (as log2 value) from the FRI query phase, including grinding.
         """
-        rate = self.rho
-        dimension = self.trace_length
-
-        # error is (1-pp)^number of queries
-        pp = regime.get_proximity_parameter(rate, dimension)
-        epsilon = (1 - pp) ** self.num_queries
-
-        # add grinding
-        epsilon = apply_grinding(epsilon, self.grinding_query_phase)
-
-        return epsilon
+        return get_FRI_query_phase_log_error(regime, self.rho, self.trace_length, self.num_queries, self.grinding_query_phase)
 
     def _get_num_folding_rounds(self) -> int:
         """
@@ -257,14 +379,33 @@ class FRI(PCS):
         )
         return rounds
 
-    def get_proof_size_bits(self) -> int:
+    def _get_commit_round_dimensions(self) -> list[float]:
         """
-        Returns an estimate for the proof size, given in bits.
+        Returns the dimension of the code after each folding round.
+        """
+        dimensions = []
+        acc_folding_factor = 1
+        for folding_factor in self.FRI_folding_factors:
+            acc_folding_factor *= folding_factor
+            dimensions.append(self.trace_length / acc_folding_factor)
+        return dimensions
+
+    def _get_initial_tree_widths(self) -> list[int]:
+        """
+        Returns the number of initial functions committed to in each initial Merkle tree.
+        """
+        if self.commitment_groups is None:
+            return [self.batch_size]
+        return [group.width for group in self.commitment_groups]
+
+    def get_proof_size_breakdown(self, expected: bool = False) -> dict[str, int]:
+        """
+        Returns an estimate for the (worst case or expected) proof size in bits, per component.
         """
         # XXX (BW): note that it is not clear that this is the
         # proof size for every zkEVM we can think of
         # XXX (BW): we should probably also add something for the OOD samples and plookup, lookup etc.
-        return get_FRI_proof_size_bits(
+        return get_FRI_proof_size_breakdown(
             hash_size_bits=self.hash_size_bits,
             field_size_bits=self.field.extension_field_element_size_bits(),
             batch_size=self.batch_size,
@@ -272,25 +413,139 @@ class FRI(PCS):
             domain_size=int(self.D),
             folding_factors=self.FRI_folding_factors,
             rate=self.rho,
-            expected=False
+            expected=expected,
+            merkle_arity=self.merkle_arity,
+            merkle_cap_height=self.merkle_cap_height,
+            commitment_groups=self.commitment_groups
         )
 
+    def get_proof_size_bits(self) -> int:
+        """
+        Returns an estimate for the proof size, given in bits.
+        """
+        return sum(self.get_proof_size_breakdown(expected=False).values())
+
     def get_expected_proof_size_bits(self) -> int:
         """Returns estimated *expected* proof size in bits."""
-        # XXX (BW): note that it is not clear that this is the
-        # proof size for every zkEVM we can think of
-        # XXX (BW): we should probably also add something for the OOD samples and plookup, lookup etc.
-        return get_FRI_proof_size_bits(
-            hash_size_bits=self.hash_size_bits,
-            field_size_bits=self.field.extension_field_element_size_bits(),
-            batch_size=self.batch_size,
-            num_queries=self.num_queries,
-            domain_size=int(self.D),
-            folding_factors=self.FRI_folding_factors,
-            rate=self.rho,
-            expected=True
+        return sum(self.get_proof_size_breakdown(expected=True).values())
+
+    def get_grinding_bits(self) -> list[int]:
+        """
+        Returns the bits of every grinding step of one proof: batching, every commit round, and the query phase.
+        """
+        return [self.grinding_batching_phase] + [self.grinding_commit_phase] * self.FRI_rounds_n + [self.grinding_query_phase]
+
+    def get_prover_cost(self) -> ProverCost:
+        """
+        Returns an estimate of the prover's work for one proof.
+        """
+        base_field_bits = self.field.base_field_element_size_bits()
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        n = int(self.D)
+
+        # LDE: interpolate each of the batch_size columns and evaluate it on the domain of size D
+        lde_field_mults = self.batch_size * (get_ntt_field_mults(self.trace_length) + get_ntt_field_mults(n))
+
+        # Initial Merkle trees (one per commitment group): one leaf per domain point, containing
+        # the columns of the group. Every inner node hashes merkle_arity digests
+        node_cost = get_num_hash_compressions(self.merkle_arity * self.hash_size_bits, self.hash_size_bits)
+        leaf_compressions = 0
+        node_compressions = 0
+        for width in self._get_initial_tree_widths():
+            leaf_compressions += n * get_num_hash_compressions(width * base_field_bits, self.hash_size_bits)
+            node_compressions += get_num_merkle_tree_inner_nodes(n, self.merkle_arity) * node_cost
+
+        # Batching: combine the base field columns with extension field coefficients
+        commit_field_mults = self.batch_size * n * get_mixed_mult_cost(self.field)
+
+        # Folding rounds: commit to the current codeword (siblings grouped in one leaf), then fold it
+        for folding_factor in self.FRI_folding_factors:
+            num_leafs = n // folding_factor
+            leaf_compressions += num_leafs * get_num_hash_compressions(folding_factor * ext_field_bits, self.hash_size_bits)
+            node_compressions += get_num_merkle_tree_inner_nodes(num_leafs, self.merkle_arity) * node_cost
+            commit_field_mults += n * get_extension_mult_cost(self.field)
+            n = num_leafs
+
+        # Final round: interpolate the final codeword to obtain the polynomial sent in the clear
+        commit_field_mults += get_ntt_field_mults(n) * get_mixed_mult_cost(self.field)
+
+        return ProverCost(
+            lde_field_mults=lde_field_mults,
+            commit_field_mults=commit_field_mults,
+            merkle_leaf_compressions=leaf_compressions,
+            merkle_node_compressions=node_compressions,
+            grinding_hashes=get_grinding_work(self.get_grinding_bits()),
         )
 
+    def get_prover_memory(self) -> ProverMemory:
+        """
+        Returns an estimate of the prover's peak memory for one proof.
+        """
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        n = int(self.D)
+
+        # LDE of all batch_size columns, and the initial Merkle trees over it
+        lde_bits = n * self.batch_size * self.field.base_field_element_size_bits()
+        merkle_bits = len(self._get_initial_tree_widths()) * get_merkle_tree_storage_bits(n, self.hash_size_bits, self.merkle_arity)
+
+        # Every folding round commits to the current codeword (the batched codeword in the first round)
+        codeword_bits = 0
+        for folding_factor in self.FRI_folding_factors:
+            codeword_bits += n * ext_field_bits
+            merkle_bits += get_merkle_tree_storage_bits(n // folding_factor, self.hash_size_bits, self.merkle_arity)
+            n //= folding_factor
+
+        return ProverMemory(lde_bits=lde_bits, merkle_bits=merkle_bits, codeword_bits=codeword_bits)
+
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        """
+        Returns an estimate of the verifier's work for one proof.
+
+        Merkle multi-proofs are accounted for as in `get_FRI_proof_size_bits`.
+        """
+        # As in the proof size, every opened symbol is counted as an extension field element,
+        # so that every tree resolves to the same cap height in both estimates.
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        n = int(self.D)
+
+        # Initial round: check the openings of all batch_size columns (in every initial tree),
+        # and combine them (DEEP quotients and batching) into one value per query.
+        # In the expected case, all work per query is only done once per distinct position.
+        if expected:
+            num_positions = get_FRI_expected_num_distinct_positions(n, self.FRI_folding_factors, self.num_queries)
+        else:
+            num_positions = [self.num_queries] * (self.FRI_rounds_n + 1)
+
+        hash_compressions = 0
+        for width in self._get_initial_tree_widths():
+            cap_height = resolve_merkle_cap_height(
+                self.merkle_cap_height, n, self.num_queries, width, ext_field_bits, self.hash_size_bits, self.merkle_arity)
+            hash_compressions += get_num_merkle_multi_proof_compressions(
+                n, self.num_queries, width, ext_field_bits, self.hash_size_bits, expected, self.merkle_arity, cap_height)
+        ext_field_mults = num_positions[0] * self.batch_size
+
+        # Folding rounds: check the openings, and fold each coset of size f at the challenge,
+        # which is an inverse NTT of size f plus an evaluation.
+        for i, folding_factor in enumerate(self.FRI_folding_factors):
+            num_leafs = n // folding_factor
+            cap_height = resolve_merkle_cap_height(
+                self.merkle_cap_height, num_leafs, self.num_queries, folding_factor, ext_field_bits, self.hash_size_bits, self.merkle_arity)
+            hash_compressions += get_num_merkle_multi_proof_compressions(
+                num_leafs, self.num_queries, folding_factor, ext_field_bits, self.hash_size_bits, expected, self.merkle_arity, cap_height)
+            ext_field_mults += num_positions[i + 1] * folding_factor * (1 + log2(folding_factor))
+            n = num_leafs
+
+        # Final round: evaluate the final polynomial at every (distinct) query position
+        ext_field_mults += num_positions[-1] * self.rho * n
+
+        return VerifierCost(hash_compressions=hash_compressions, ext_field_mults=ext_field_mults)
+
+    def get_commitment_groups_label(self) -> str:
+        """Returns the commitment groups as e.g. "main (40), quotient (8)", or "single tree"."""
+        if self.commitment_groups is None:
+            return "single tree"
+        return ", ".join(f"{group.name} ({group.width})" for group in self.commitment_groups)
+
     def get_rate(self) -> float:
         return self.rho
 
@@ -310,12 +565,15 @@ class FRI(PCS):
 
         params = {
             "hash_size_bits": self.hash_size_bits,
+            "merkle_arity": self.merkle_arity,
+            "merkle_cap_height": self.merkle_cap_height,
             "rho": self.rho,
             "k = -log2(rho)": self.k,
             "trace_length": self.trace_length,
             "h = log2(trace_length)": self.h,
             "domain_size D = trace_length / rho": self.D,
             "batch_size": self.batch_size,
+            "commitment_groups": self.get_commitment_groups_label(),
             "power_batching": self.power_batching,
             "num_queries": self.num_queries,
             "gap_to_radius": self.gap_to_radius,
@@ -0,0 +1,118 @@
+"""
+Folding schedule optimizer for FRI.
+
+The folding factors and the early stop degree of a FRI config are usually hand-picked.
+Given a config, we search over all folding schedules that fold the domain of size D
+down to the same final domain, i.e., all ordered factorizations of D / FRI_early_stop_degree
+into powers of two. We keep the schedules where every commit round reaches the required
+security, and return the one with the smallest (expected) proof size or verifier hash count.
+
+The cost of a folding round only depends on the size of the domain it folds and its
+folding factor, and so does its commit-phase error. We can therefore solve this with
+a memoized recursion over the remaining domain size, which takes at most
+log2(D)^2 steps (instantly, even for domains of size 2^30).
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import lru_cache
+from math import log2
+
+from soundcalc.common.utils import get_bits_of_security_from_log_error, get_num_merkle_multi_proof_compressions, get_size_of_merkle_commitment_bits, resolve_merkle_cap_height
+from soundcalc.pcs.fri import FRIConfig, get_FRI_commit_phase_log_error
+from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
+
+# What the optimizer minimizes
+FRI_SCHEDULE_OBJECTIVES = ("proof_size", "verifier_hashes")
+
+
+def get_FRI_round_cost(config: FRIConfig, domain_size: int, folding_factor: int, objective: str, expected: bool = True) -> int:
+    """
+    Returns the cost of a folding round with the given folding factor on a domain of the
+    given size: the size of its Merkle cap and openings in bits, or the number of hash
+    compressions the verifier spends on its openings. The accounting matches
+    `get_FRI_proof_size_breakdown` and `FRI.get_verifier_cost`.
+    """
+    ext_field_bits = config.field.extension_field_element_size_bits()
+    num_leafs = domain_size // folding_factor
+
+    if objective == "proof_size":
+        return sum(get_size_of_merkle_commitment_bits(
+            num_leafs, config.num_queries, folding_factor, ext_field_bits, config.hash_size_bits,
+            expected, config.merkle_arity, config.merkle_cap_height))
+    if objective == "verifier_hashes":
+        cap_height = resolve_merkle_cap_height(
+            config.merkle_cap_height, num_leafs, config.num_queries, folding_factor, ext_field_bits, config.hash_size_bits, config.merkle_arity)
+        return get_num_merkle_multi_proof_compressions(
+            num_leafs, config.num_queries, folding_factor, ext_field_bits, config.hash_size_bits,
+            expected, config.merkle_arity, cap_height)
+    raise ValueError(f"Unknown objective '{objective}', expected one of {FRI_SCHEDULE_OBJECTIVES}")
+
+
+def get_FRI_commit_round_bits(config: FRIConfig, regime: ProximityGapsRegime, domain_size: int, folding_factor: int) -> int:
+    """
+    Returns the bits of security of a commit round folding a domain of the given size,
+    as in `get_FRI_commit_phase_log_error` (including commit-phase grinding).
+    """
+    dimension = (domain_size // folding_factor) * config.rho
+    return get_bits_of_security_from_log_error(
+        get_FRI_commit_phase_log_error(regime, config.rho, dimension, folding_factor, config.grinding_commit_phase)
+    )
+
+
+def optimize_FRI_folding_schedule(
+        config: FRIConfig,
+        regime: ProximityGapsRegime,
+        min_commit_bits: int,
+        objective: str = "proof_size",
+        max_folding_factor: int = 256,
+        expected: bool = True,
+) -> FRIConfig:
+    """
+    Returns a copy of the FRI config with the folding schedule minimizing the objective
+    ("proof_size" or "verifier_hashes", worst case or expected), subject to every commit
+    round having at least `min_commit_bits` bits of security in the given regime.
+
+    The final domain (FRI_early_stop_degree) and all other parameters are kept. Ties are
+    broken towards fewer rounds. Raises ValueError if no schedule meets the requirement.
+    """
+    if objective not in FRI_SCHEDULE_OBJECTIVES:
+        raise ValueError(f"Unknown objective '{objective}', expected one of {FRI_SCHEDULE_OBJECTIVES}")
+
+    domain_size = int(config.trace_length / config.rho)
+    final_domain_size = config.FRI_early_stop_degree
+    if domain_size % final_domain_size != 0 or not log2(domain_size // final_domain_size).is_integer():
+        raise ValueError(f"Domain size {domain_size} does not fold down to FRI_early_stop_degree={final_domain_size}")
+
+    max_log_factor = int(log2(max_folding_factor))
+
+    # best(log_n) = (cost, number of rounds, folding factors) to fold the domain of size 2^log_n
+    # down to the final domain, or None if no schedule meets the security requirement.
+    @lru_cache(maxsize=None)
+    def best(log_n: int) -> tuple[int, int, tuple[int, ...]] | None:
+        n = 2**log_n
+        if n == final_domain_size:
+            return 0, 0, ()
+
+        candidates = []
+        for log_factor in range(1, min(max_log_factor, log_n - int(log2(final_domain_size))) + 1):
+            folding_factor = 2**log_factor
+            if get_FRI_commit_round_bits(config, regime, n, folding_factor) < min_commit_bits:
+                continue
+            rest = best(log_n - log_factor)
+            if rest is None:
+                continue
+            cost = get_FRI_round_cost(config, n, folding_factor, objective, expected) + rest[0]
+            candidates.append((cost, rest[1] + 1, (folding_factor,) + rest[2]))
+
+        return min(candidates, default=None)
+
+    solution = best(int(log2(domain_size)))
+    if solution is None:
+        raise ValueError(
+            f"No folding schedule with factors up to {max_folding_factor} reaches "
+            f"{min_commit_bits} bits in every commit round ({regime.identifier()})"
+        )
+
+    return replace(config, FRI_folding_factors=list(solution[2]))
@@ -5,7 +5,9 @@ from math import log2, ceil
 from typing import Optional
 
 from soundcalc.common.fields import FieldParams
-from soundcalc.common.utils import get_bits_of_security_from_error, get_size_of_merkle_multi_proof_bits, get_size_of_merkle_proof_bits
+from soundcalc.common.utils import get_bits_of_security_from_log_error, get_size_of_merkle_proof_bits
+from soundcalc.costs.prover import ProverCost, ProverMemory, get_extension_mult_cost
+from soundcalc.costs.verifier import VerifierCost
 from soundcalc.pcs.pcs import PCS
 from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
 from soundcalc.pcs.fri import FRI
@@ -47,20 +49,21 @@ class JaggedPCS(PCS):
         Returns PCS-specific security levels for a given regime.
         """
         bits = self.dense_pcs.get_pcs_security_levels(regime)
-        bits["reduce to dense PCS"] = get_bits_of_security_from_error(self._get_reduction_error())
+        bits["reduce to dense PCS"] = get_bits_of_security_from_log_error(self._get_reduction_log_error())
         return bits
 
-    def _get_reduction_error(self) -> float:
+    def _get_reduction_log_error(self) -> float:
         """
-        Returns the error from the zerocheck evaluation claims to the dense PCS.
+        Returns the error (as log2 value) from the zerocheck evaluation claims to the dense PCS.
         """
         log_trace = ceil(log2(self.dense_pcs.trace_length)) + ceil(log2(self.dense_pcs.batch_size))
-        epsilon_RLC = ceil(log2(self.trace_width)) / self.dense_pcs.field.F
-        epsilon_jagged_sumcheck = (2 * log_trace) / self.dense_pcs.field.F
-        epsilon_jagged_evaluation_sumcheck = (2 * (2 * log_trace + 2)) / self.dense_pcs.field.F
-        return epsilon_RLC + epsilon_jagged_sumcheck + epsilon_jagged_evaluation_sumcheck
+        # All three errors are over |F|, so we add up the numerators
+        epsilon_RLC = ceil(log2(self.trace_width))
+        epsilon_jagged_sumcheck = 2 * log_trace
+        epsilon_jagged_evaluation_sumcheck = 2 * (2 * log_trace + 2)
+        return log2(epsilon_RLC + epsilon_jagged_sumcheck + epsilon_jagged_evaluation_sumcheck) - log2(self.dense_pcs.field.F)
 
-    def _reduction_proof_size_bits(self) -> int:
+    def _reduction_proof_size_breakdown(self) -> dict[str, int]:
         log_trace = ceil(log2(self.dense_pcs.trace_length)) + ceil(log2(self.dense_pcs.batch_size))
         field_bits = self.dense_pcs.field.extension_field_element_size_bits()
 
@@ -76,8 +79,20 @@ class JaggedPCS(PCS):
             field_size_bits = field_bits
         )
 
-        return jagged_sumcheck_size + jagged_evaluation_sumcheck_size
+        return {
+            "jagged sumcheck": jagged_sumcheck_size,
+            "jagged evaluation sumcheck": jagged_evaluation_sumcheck_size,
+        }
 
+    def _reduction_proof_size_bits(self) -> int:
+        return sum(self._reduction_proof_size_breakdown().values())
+
+    def get_proof_size_breakdown(self, expected: bool = False) -> dict[str, int]:
+        """
+        Returns an estimate for the (worst case or expected) proof size in bits, per component:
+        the components of the dense PCS, followed by the jagged reduction.
+        """
+        return self.dense_pcs.get_proof_size_breakdown(expected) | self._reduction_proof_size_breakdown()
 
     def get_proof_size_bits(self) -> int:
         """
@@ -89,6 +104,40 @@ class JaggedPCS(PCS):
         """Returns estimated *expected* proof size in bits."""
         return self.dense_pcs.get_expected_proof_size_bits() + self._reduction_proof_size_bits()
 
+    def get_grinding_bits(self) -> list[int]:
+        """Returns the bits of every grinding step of one proof. The jagged reduction does not grind."""
+        return self.dense_pcs.get_grinding_bits()
+
+    def get_prover_cost(self) -> ProverCost:
+        """
+        Returns an estimate of the prover's work for one proof.
+
+        This is the dense PCS cost plus the jagged reduction sumchecks. We (roughly) assume the
+        sumcheck provers run in time linear in the dense trace, with (degree + 1) evaluations
+        of a degree-2 polynomial per entry and round pair.
+        """
+        dense_size = self.dense_pcs.trace_length * self.dense_pcs.batch_size
+        reduction_field_mults = 2 * (2 + 1) * dense_size * get_extension_mult_cost(self.dense_pcs.field)
+        return self.dense_pcs.get_prover_cost() + ProverCost(commit_field_mults=reduction_field_mults)
+
+    def get_prover_memory(self) -> ProverMemory:
+        """
+        Returns an estimate of the prover's peak memory for one proof, which is dominated by the dense PCS.
+        """
+        return self.dense_pcs.get_prover_memory()
+
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        """
+        Returns an estimate of the verifier's work for one proof.
+
+        This is the dense PCS cost plus the two reduction sumchecks, where each round
+        evaluates a degree-2 polynomial at the challenge.
+        """
+        log_trace = ceil(log2(self.dense_pcs.trace_length)) + ceil(log2(self.dense_pcs.batch_size))
+        num_sumcheck_rounds = log_trace + (2 * log_trace + 2)
+        reduction_cost = VerifierCost(ext_field_mults=num_sumcheck_rounds * (2 + 1))
+        return self.dense_pcs.get_verifier_cost(expected) + reduction_cost
+
     def get_rate(self) -> float:
         return self.dense_pcs.get_rate()
 
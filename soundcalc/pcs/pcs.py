@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 
+from soundcalc.costs.prover import ProverCost, ProverMemory
+from soundcalc.costs.verifier import VerifierCost
 from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
 
 
@@ -30,6 +32,40 @@ class PCS(ABC):
         """Returns estimated *expected* proof size in bits."""
         ...
 
+    def get_proof_size_breakdown(self, expected: bool = False) -> dict[str, int]:
+        """
+        Returns the (worst case or expected) proof size in bits, per component.
+        The components sum up to the proof size. By default, there is a single component.
+        """
+        if expected:
+            return {"proof": self.get_expected_proof_size_bits()}
+        return {"proof": self.get_proof_size_bits()}
+
+    @abstractmethod
+    def get_grinding_bits(self) -> list[int]:
+        """
+        Returns the bits of every proof-of-work grinding step of one proof (0 if a step does not grind).
+        """
+        ...
+
+    @abstractmethod
+    def get_prover_cost(self) -> ProverCost:
+        """Returns an estimate of the prover's work for one proof."""
+        ...
+
+    @abstractmethod
+    def get_prover_memory(self) -> ProverMemory:
+        """Returns an estimate of the prover's peak memory for one proof."""
+        ...
+
+    @abstractmethod
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        """
+        Returns an estimate of the verifier's work for one proof.
+        If expected is set, accounts for shared Merkle paths (as in the expected proof size).
+        """
+        ...
+
     @abstractmethod
     def get_rate(self) -> float:
         """Returns the code rate (rho)."""
@@ -0,0 +1,477 @@
+from __future__ import annotations
+
+import math
+from typing import Optional
+from dataclasses import dataclass
+
+from soundcalc.common.fields import FieldParams
+from soundcalc.common.utils import (
+    apply_grinding,
+    get_bits_of_security_from_log_error,
+    get_grinding_work,
+    get_num_hash_compressions,
+    get_num_merkle_multi_proof_compressions,
+    get_num_merkle_tree_inner_nodes,
+    get_size_of_merkle_commitment_bits,
+    log2_sum,
+    resolve_merkle_cap_height,
+)
+from soundcalc.costs.prover import ProverCost, ProverMemory, get_extension_mult_cost, get_merkle_tree_storage_bits, get_mixed_mult_cost, get_ntt_field_mults
+from soundcalc.costs.verifier import VerifierCost
+from soundcalc.pcs.pcs import PCS
+from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
+
+
+@dataclass(frozen=True)
+class STIRConfig:
+    """
+    Configuration for STIR PCS.
+
+    We follow the STIR paper (https://eprint.iacr.org/2024/390), Construction 5.2 and
+    Theorem 5.1 (round-by-round soundness), and the reference script
+    https://github.com/WizardOfMenlo/stir-whir-scripts/blob/main/src/stir.rs
+
+    The protocol tests proximity of f_0 to RS[F, L_0, d] with d = 2^log_degree.
+    In each of the M iterations i = 1, ..., M, the prover folds f_{i-1} by k = 2^folding_factor,
+    and commits to the folded function g_i on a new domain L_i of half the size of L_{i-1}.
+    The verifier then makes OOD samples on g_i, and shift queries to (the folding of) f_{i-1},
+    and both parties obtain f_i, of degree d_i = d / k^i, via quotienting and degree correction.
+    Finally, the prover sends the folding of f_M in the clear, and the verifier makes t_M
+    queries to f_M.
+    """
+
+    # The output length of the hash function that is used in bits
+    # Note: this concerns the hash function used for Merkle trees
+    hash_size_bits: int
+
+    # The base-2 logarithm of the inverse rate of the initial code RS[F, L_0, d].
+    #
+    # As in WHIR, the domain only halves in each iteration, while the degree shrinks by
+    # a factor k, so the rate of f_i is ρ_i = ρ_0 ⋅ (2 / k)^i. That is, the log inverse rate
+    # grows by (folding_factor - 1) per iteration.
+    log_inv_rate: int
+
+    # The number of STIR iterations M.
+    num_iterations: int
+
+    # The base-2 logarithm of the folding parameter k (as in WHIR and the reference script).
+    # Every fold reduces the degree by a factor of 2^folding_factor.
+    folding_factor: int
+
+    # The field that is used
+    field: FieldParams
+
+    # The base-2 logarithm of the initial degree bound d.
+    log_degree: int
+
+    # The number of functions that are batched into f_0 (as in WHIR).
+    batch_size: int
+
+    # Whether batching coefficients are powers of a single challenge (True),
+    # or independent random values (False).
+    power_batching: bool
+
+    # Grinding bits for the batching step.
+    grinding_batching_phase: int
+
+    # Number of queries t_0, ..., t_M. For i < M, t_i shift queries are made to f_i in
+    # iteration i + 1. The last t_M queries are the final queries to f_M.
+    # This list has length M + 1.
+    num_queries: list[int]
+
+    # Number of OOD samples s_1, ..., s_M on the committed functions g_i.
+    # This list has length M.
+    num_ood_samples: list[int]
+
+    # Grinding bits for the folding steps: one for each of the M + 1 folds.
+    grinding_bits_folding: list[int]
+
+    # Grinding bits for the queries: one for each of the M + 1 query phases.
+    grinding_bits_queries: list[int]
+
+    # Grinding bits for the OOD samples: one for each of the M iterations.
+    grinding_bits_ood: list[int]
+
+    # Optional override for the bound *gap*.
+    # (This is useful to pin fixed parameters in TOML configs.)
+    gap_to_radius: Optional[float] = None
+
+    # Number of children of every inner node of the Merkle trees (2 for binary trees).
+    # This is independent of the folding factor: a leaf always holds one folding block.
+    merkle_arity: int = 2
+
+    # Number of top layers of every Merkle tree sent as a "cap" instead of the root (0 sends the root).
+    # "auto" picks, per tree, the height minimizing the expected proof size.
+    merkle_cap_height: int | str = 0
+
+
+class STIR(PCS):
+    """
+    STIR Polynomial Commitment Scheme.
+    """
+
+    def __init__(self, config: STIRConfig):
+        """
+        Given a config, compute all the parameters relevant for the PCS.
+        """
+        # Keep the config around, so that variants of this instance can be derived
+        self.config = config
+
+        self.hash_size_bits = config.hash_size_bits
+        self.merkle_arity = config.merkle_arity
+        self.merkle_cap_height = config.merkle_cap_height
+        self.folding_factor = config.folding_factor
+        self.num_iterations = config.num_iterations
+        self.field = config.field
+        self.log_degree = config.log_degree
+        self.batch_size = config.batch_size
+        self.power_batching = config.power_batching
+        self.grinding_batching_phase = config.grinding_batching_phase
+        self.num_queries = config.num_queries
+        self.num_ood_samples = config.num_ood_samples
+        self.grinding_bits_folding = config.grinding_bits_folding
+        self.grinding_bits_queries = config.grinding_bits_queries
+        self.grinding_bits_ood = config.grinding_bits_ood
+        self.gap_to_radius = config.gap_to_radius
+
+        # Parameter validity checks
+        assert self.batch_size >= 1, "Batch size must be at least 1"
+        assert config.log_inv_rate > 0, "Log inverse rate must be > 0 (rate < 1.0)"
+        assert self.folding_factor >= 1, "Folding factor must be >= 1 to reduce degree"
+        assert self.num_iterations >= 1, "Must have at least 1 iteration"
+
+        # f_0, ..., f_M are folded M + 1 times in total, and the final polynomial
+        # (the folding of f_M) must still have a non-negative log degree.
+        final_reduction = (self.num_iterations + 1) * self.folding_factor
+        assert final_reduction <= self.log_degree, (
+            f"Configuration invalid: Folding {self.log_degree} log degree "
+            f"{self.num_iterations + 1} times by {self.folding_factor} results in a negative degree."
+        )
+
+        # Log degree d_i and log inverse rate of f_i for i = 0..M
+        self.log_degrees = [
+            self.log_degree - i * self.folding_factor
+            for i in range(self.num_iterations + 1)
+        ]
+        self.log_inv_rates = [
+            config.log_inv_rate + i * (self.folding_factor - 1)
+            for i in range(self.num_iterations + 1)
+        ]
+        # Log size of the domain L_i (halving in each iteration)
+        self.log_domain_sizes = [d + r for d, r in zip(self.log_degrees, self.log_inv_rates)]
+
+        # Folding is done over cosets of size k, so FFTs run on domains of size |L_i| / k.
+        required_two_adicity = self.log_domain_sizes[0] - self.folding_factor
+        assert required_two_adicity <= self.field.two_adicity, (
+            f"Field {self.field.name} 2-adicity ({self.field.two_adicity}) is too low "
+            f"(required: {required_two_adicity})"
+        )
+
+        # Array length consistency checks
+        assert len(self.num_queries) == self.num_iterations + 1, (
+            f"Expected {self.num_iterations + 1} query counts, got {len(self.num_queries)}"
+        )
+        assert len(self.num_ood_samples) == self.num_iterations, (
+            f"Expected {self.num_iterations} OOD sample configs, got {len(self.num_ood_samples)}"
+        )
+        assert len(self.grinding_bits_folding) == self.num_iterations + 1
+        assert len(self.grinding_bits_queries) == self.num_iterations + 1
+        assert len(self.grinding_bits_ood) == self.num_iterations
+        assert self.grinding_batching_phase >= 0, "Batching grinding bits must be >= 0"
+        assert all(g >= 0 for g in self.grinding_bits_folding + self.grinding_bits_queries + self.grinding_bits_ood), (
+            "Grinding bits must be >= 0"
+        )
+
+    def get_pcs_security_levels(self, regime: ProximityGapsRegime) -> dict[str, int]:
+        """
+        Returns PCS-specific security levels for a given regime.
+        """
+        levels: dict[str, int] = {}
+
+        if self.batch_size > 1:
+            levels["batching"] = get_bits_of_security_from_log_error(self._get_batching_log_error(regime))
+
+        # Initial fold of f_0
+        levels["fold(i=0)"] = get_bits_of_security_from_log_error(self._log_epsilon_fold(0, regime))
+
+        # Main loop: OOD samples on g_i, shift queries to f_{i-1}, then fold f_i
+        for iteration in range(1, self.num_iterations + 1):
+            levels[f"OOD(i={iteration})"] = get_bits_of_security_from_log_error(self._log_epsilon_out(iteration, regime))
+            levels[f"Shift(i={iteration})"] = get_bits_of_security_from_log_error(self._log_epsilon_shift(iteration, regime))
+            levels[f"fold(i={iteration})"] = get_bits_of_security_from_log_error(self._log_epsilon_fold(iteration, regime))
+
+        levels["fin"] = get_bits_of_security_from_log_error(self._log_epsilon_final(regime))
+
+        return levels
+
+    def _get_code_for_iteration(self, iteration: int) -> tuple[float, int]:
+        """
+        Returns (rate, dimension) of the code RS[F, L_i, d_i] of f_i, where i = iteration.
+        """
+        assert 0 <= iteration <= self.num_iterations, f"Iteration {iteration} out of bounds"
+        return 2 ** (-self.log_inv_rates[iteration]), 2 ** self.log_degrees[iteration]
+
+    def _get_delta_for_iteration(self, iteration: int, regime: ProximityGapsRegime) -> float:
+        """
+        Returns delta_i, small enough for the proximity gaps regime on the code of f_i
+        and on the folded code RS[F, L_i^k, d_i / k] (which has the same rate).
+        """
+        rate, dimension = self._get_code_for_iteration(iteration)
+        return min(
+            regime.get_proximity_parameter(rate, dimension),
+            regime.get_proximity_parameter(rate, dimension // 2**self.folding_factor),
+        )
+
+    def _get_batching_log_error(self, regime: ProximityGapsRegime) -> float:
+        """
+        Returns the error (as log2 value) due to the batching step, as in WHIR.
+        """
+        rate, dimension = self._get_code_for_iteration(0)
+        if self.power_batching:
+            epsilon = regime.get_log_error_powers(rate, dimension, self.batch_size)
+        else:
+            epsilon = regime.get_log_error_linear(rate, dimension)
+        return apply_grinding(epsilon, self.grinding_batching_phase)
+
+    def _log_epsilon_fold(self, iteration: int, regime: ProximityGapsRegime) -> float:
+        """
+        Returns the error (as log2 value) of folding f_i, which is err*(d_i / k, ρ_i, δ_i, k) in Theorem 5.1:
+        folding takes a random combination (with powers) of k functions over RS[F, L_i^k, d_i / k].
+        """
+        rate, dimension = self._get_code_for_iteration(iteration)
+        k = 2**self.folding_factor
+        epsilon = regime.get_log_error_powers(rate, dimension // k, k)
+        return apply_grinding(epsilon, self.grinding_bits_folding[iteration])
+
+    def _log_epsilon_out(self, iteration: int, regime: ProximityGapsRegime) -> float:
+        """
+        Returns the error epsilon^out_i (as log2 value) of Theorem 5.1: ℓ_i^2 / 2 ⋅ (d_i / |F|)^{s_i}.
+        """
+        assert 1 <= iteration <= self.num_iterations, "OOD error applies to iterations 1..M"
+        rate, dimension = self._get_code_for_iteration(iteration)
+        list_size = regime.get_max_list_size(rate, dimension)
+        s = self.num_ood_samples[iteration - 1]
+        epsilon = 2 * math.log2(list_size) - 1 + s * (math.log2(dimension) - math.log2(self.field.F))
+        return apply_grinding(epsilon, self.grinding_bits_ood[iteration - 1])
+
+    def _log_epsilon_shift(self, iteration: int, regime: ProximityGapsRegime) -> float:
+        """
+        Returns the error epsilon^shift_i (as log2 value) of Theorem 5.1:
+        (1 - δ_{i-1})^{t_{i-1}} + ℓ_i ⋅ (t_{i-1} + s_i) / |F|.
+        """
+        assert 1 <= iteration <= self.num_iterations, "Shift error applies to iterations 1..M"
+        t = self.num_queries[iteration - 1]
+        s = self.num_ood_samples[iteration - 1]
+
+        delta = self._get_delta_for_iteration(iteration - 1, regime)
+        rate, dimension = self._get_code_for_iteration(iteration)
+        list_size = regime.get_max_list_size(rate, dimension)
+
+        epsilon = log2_sum(t * math.log2(1.0 - delta), math.log2(list_size * (t + s)) - math.log2(self.field.F))
+        return apply_grinding(epsilon, self.grinding_bits_queries[iteration - 1])
+
+    def _log_epsilon_final(self, regime: ProximityGapsRegime) -> float:
+        """
+        Returns the error epsilon^fin (as log2 value) of Theorem 5.1: (1 - δ_M)^{t_M}.
+        """
+        delta = self._get_delta_for_iteration(self.num_iterations, regime)
+        assert 0 < delta < 1.0, f"Invalid delta {delta} for final round"
+        epsilon = self.num_queries[-1] * math.log2(1.0 - delta)
+        return apply_grinding(epsilon, self.grinding_bits_queries[-1])
+
+    def _get_tree_shape(self, i: int) -> tuple[int, int, int]:
+        """
+        Returns (num_leafs, tuple_size, element_size_bits) of the Merkle tree committing to f_0
+        (for i = 0), or to g_i (for i >= 1). A leaf holds one folding block of size k,
+        for all batch_size functions in case of f_0.
+        """
+        block_size = 2**self.folding_factor
+        num_leafs = 2 ** self.log_domain_sizes[i] // block_size
+        if i == 0:
+            return num_leafs, block_size * self.batch_size, self.field.base_field_element_size_bits()
+        return num_leafs, block_size, self.field.extension_field_element_size_bits()
+
+    def get_proof_size_breakdown(self, expected: bool = False) -> dict[str, int]:
+        """
+        Returns an estimate for the (worst case or expected) proof size in bits, per component:
+        Merkle roots, OOD answers, the final polynomial, and the openings of f_0 and of each g_i.
+
+        Note: we assume that the verifier interpolates the answer polynomials itself, i.e.,
+        the prover does not send Ans_i and the "shake" polynomials (Remark 5.3 of the paper).
+        """
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        breakdown = {"roots": 0, "OOD answers": 0}
+
+        # Every iteration sends s_i answers to the OOD samples on g_i
+        breakdown["OOD answers"] = sum(self.num_ood_samples) * ext_field_bits
+
+        # The prover sends the folding of f_M (of degree d_M / k) in the clear
+        breakdown["final polynomial"] = 2 ** (self.log_degrees[-1] - self.folding_factor) * ext_field_bits
+
+        # The committed functions f_0, g_1, ..., g_M are opened at t_0, ..., t_M blocks.
+        # The queries to f_i (i >= 1) are answered from the openings of g_i.
+        for i in range(self.num_iterations + 1):
+            num_leafs, tuple_size, element_size_bits = self._get_tree_shape(i)
+            cap_size, multi_proof_size = get_size_of_merkle_commitment_bits(
+                num_leafs, self.num_queries[i], tuple_size, element_size_bits, self.hash_size_bits,
+                expected, self.merkle_arity, self.merkle_cap_height)
+            breakdown["roots"] += cap_size
+            label = "initial openings" if i == 0 else f"round {i} openings"
+            breakdown[label] = multi_proof_size
+
+        return breakdown
+
+    def get_proof_size_bits(self) -> int:
+        """Returns estimated proof size in bits."""
+        return sum(self.get_proof_size_breakdown(expected=False).values())
+
+    def get_expected_proof_size_bits(self) -> int:
+        """Returns estimated *expected* proof size in bits."""
+        return sum(self.get_proof_size_breakdown(expected=True).values())
+
+    def get_grinding_bits(self) -> list[int]:
+        """
+        Returns the bits of every grinding step of one proof: batching, folding, queries and OOD samples.
+        """
+        return [self.grinding_batching_phase] + self.grinding_bits_folding + self.grinding_bits_queries + self.grinding_bits_ood
+
+    def get_prover_cost(self) -> ProverCost:
+        """
+        Returns an estimate of the prover's work for one proof.
+        """
+        lde_field_mults = 0
+        commit_field_mults = 0
+        leaf_compressions = 0
+        node_compressions = 0
+        # Every inner node hashes merkle_arity digests
+        node_cost = get_num_hash_compressions(self.merkle_arity * self.hash_size_bits, self.hash_size_bits)
+
+        for i in range(self.num_iterations + 1):
+            domain_size = 2 ** self.log_domain_sizes[i]
+            num_leafs, tuple_size, element_size_bits = self._get_tree_shape(i)
+
+            if i == 0:
+                # Evaluate the batch_size base field polynomials on L_0, then batch them
+                lde_field_mults += self.batch_size * get_ntt_field_mults(domain_size)
+                commit_field_mults += self.batch_size * domain_size * get_mixed_mult_cost(self.field)
+            else:
+                # Fold f_{i-1} (coefficients), and evaluate g_i (degree d_i) on L_i
+                commit_field_mults += 2 ** self.log_degrees[i - 1] * get_extension_mult_cost(self.field)
+                lde_field_mults += get_ntt_field_mults(domain_size) * get_mixed_mult_cost(self.field)
+                # Answer the OOD samples, and compute f_i by quotienting g_i by the t_{i-1} + s_i
+                # points and correcting the degree
+                num_points = self.num_queries[i - 1] + self.num_ood_samples[i - 1]
+                commit_field_mults += (self.num_ood_samples[i - 1] + num_points) * 2 ** self.log_degrees[i] * get_extension_mult_cost(self.field)
+
+            leaf_compressions += num_leafs * get_num_hash_compressions(tuple_size * element_size_bits, self.hash_size_bits)
+            node_compressions += get_num_merkle_tree_inner_nodes(num_leafs, self.merkle_arity) * node_cost
+
+        # Final round: fold f_M
+        commit_field_mults += 2 ** self.log_degrees[-1] * get_extension_mult_cost(self.field)
+
+        return ProverCost(
+            lde_field_mults=lde_field_mults,
+            commit_field_mults=commit_field_mults,
+            merkle_leaf_compressions=leaf_compressions,
+            merkle_node_compressions=node_compressions,
+            grinding_hashes=get_grinding_work(self.get_grinding_bits()),
+        )
+
+    def get_prover_memory(self) -> ProverMemory:
+        """
+        Returns an estimate of the prover's peak memory for one proof.
+        """
+        ext_field_bits = self.field.extension_field_element_size_bits()
+
+        lde_bits = 0
+        merkle_bits = 0
+        codeword_bits = 0
+        for i in range(self.num_iterations + 1):
+            domain_size = 2 ** self.log_domain_sizes[i]
+            num_leafs, _, _ = self._get_tree_shape(i)
+            merkle_bits += get_merkle_tree_storage_bits(num_leafs, self.hash_size_bits, self.merkle_arity)
+            if i == 0:
+                # Evaluations of all batch_size initial polynomials
+                lde_bits += domain_size * self.batch_size * self.field.base_field_element_size_bits()
+            else:
+                # Evaluations of the committed function g_i
+                codeword_bits += domain_size * ext_field_bits
+
+        return ProverMemory(lde_bits=lde_bits, merkle_bits=merkle_bits, codeword_bits=codeword_bits)
+
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        """
+        Returns an estimate of the verifier's work for one proof.
+
+        Merkle multi-proofs are accounted for as in `get_proof_size_breakdown`.
+        """
+        block_size = 2**self.folding_factor
+
+        hash_compressions = 0
+        # Batching: combine the batch_size opened values per block entry and query
+        ext_field_mults = self.num_queries[0] * block_size * self.batch_size
+
+        for i in range(self.num_iterations + 1):
+            num_leafs, tuple_size, element_size_bits = self._get_tree_shape(i)
+            cap_height = resolve_merkle_cap_height(
+                self.merkle_cap_height, num_leafs, self.num_queries[i], tuple_size, element_size_bits, self.hash_size_bits, self.merkle_arity)
+            hash_compressions += get_num_merkle_multi_proof_compressions(
+                num_leafs, self.num_queries[i], tuple_size, element_size_bits, self.hash_size_bits, expected, self.merkle_arity, cap_height)
+
+            # Fold every queried block of size k at the folding challenge
+            ext_field_mults += self.num_queries[i] * block_size * (1 + self.folding_factor)
+
+            if i >= 1:
+                # Evaluate f_i from g_i at every queried point: quotient by the t_{i-1} + s_i points
+                # (interpolating the answer polynomial), and correct the degree
+                num_points = self.num_queries[i - 1] + self.num_ood_samples[i - 1]
+                ext_field_mults += self.num_queries[i] * block_size * num_points
+
+        # Final check: evaluate the final polynomial at the final queries
+        ext_field_mults += self.num_queries[-1] * 2 ** (self.log_degrees[-1] - self.folding_factor)
+
+        return VerifierCost(hash_compressions=hash_compressions, ext_field_mults=ext_field_mults)
+
+    def get_rate(self) -> float:
+        return 2 ** (-self.log_inv_rates[0])
+
+    def get_dimension(self) -> int:
+        return 2 ** self.log_degrees[0]
+
+    def get_trace_length(self) -> int:
+        return 2 ** self.log_degrees[0]
+
+    def get_parameter_summary(self) -> str:
+        lines: list[str] = []
+        lines.append("")
+        lines.append("```")
+
+        params = {
+            "hash_size_bits": self.hash_size_bits,
+            "merkle_arity": self.merkle_arity,
+            "merkle_cap_height": self.merkle_cap_height,
+            "folding_factor": self.folding_factor,
+            "batch_size": self.batch_size,
+            "gap_to_radius": self.gap_to_radius,
+            "power_batching": self.power_batching,
+            "grinding_batching_phase": self.grinding_batching_phase,
+            "num_iterations": self.num_iterations,
+            "field": self.field.to_string(),
+        }
+
+        key_width = max(len(k) for k in params)
+        for k, v in params.items():
+            lines.append(f"  {k:<{key_width}} : {v}")
+
+        lines.append("")
+        lines.append("  Per-round parameters:")
+        lines.append(f"    log_degrees           : {self.log_degrees}")
+        lines.append(f"    log_inv_rates         : {self.log_inv_rates}")
+        lines.append(f"    num_queries           : {self.num_queries}")
+        lines.append(f"    num_ood_samples       : {self.num_ood_samples}")
+        lines.append(f"    grinding_bits_folding : {self.grinding_bits_folding}")
+        lines.append(f"    grinding_bits_queries : {self.grinding_bits_queries}")
+        lines.append(f"    grinding_bits_ood     : {self.grinding_bits_ood}")
+
+        lines.append("```")
+        return "\n".join(lines)
@@ -1,15 +1,27 @@
+from __future__ import annotations
+
 
 import math
 from typing import Optional
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 
 from soundcalc.common.fields import FieldParams
 from soundcalc.common.utils import (
     apply_grinding,
-    get_bits_of_security_from_error,
+    get_bits_of_security_from_log_error,
+    get_log_error,
+    log2_sum,
+    get_grinding_work,
+    get_num_hash_compressions,
+    get_num_merkle_multi_proof_compressions,
+    get_merkle_cap_size_bits,
+    get_num_merkle_tree_inner_nodes,
     get_size_of_merkle_multi_proof_bits,
     get_size_of_merkle_proof_bits,
+    resolve_merkle_cap_height,
 )
+from soundcalc.costs.prover import ProverCost, ProverMemory, get_extension_mult_cost, get_merkle_tree_storage_bits, get_mixed_mult_cost, get_ntt_field_mults
+from soundcalc.costs.verifier import VerifierCost
 from soundcalc.pcs.pcs import PCS
 from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
 
@@ -308,6 +320,77 @@ class WHIRConfig:
     # (This is useful to pin fixed parameters in TOML configs.)
     gap_to_radius: Optional[float] = None
 
+    # Number of children of every inner node of the Merkle trees (2 for binary trees).
+    # This is independent of the folding factor: a leaf always holds one folding block.
+    merkle_arity: int = 2
+
+    # Number of top layers of every Merkle tree sent as a "cap" instead of the root (0 sends the root).
+    # "auto" picks, per tree, the height minimizing the expected proof size.
+    merkle_cap_height: int | str = 0
+
+@dataclass(frozen=True)
+class WHIRRoundParams:
+    """
+    Parameters of the code C_{RS}^{i,s} = RS[F, L_i^{(2^s)}, m_i - s] of iteration i and round s
+    (in notation of Theorem 5.2 in WHIR paper).
+    """
+    iteration: int
+    round: int
+    # log2 of the size of the evaluation domain L_i^{(2^s)}
+    log_domain_size: int
+    rate: float
+    dimension: int
+    # delta_i (shared by all rounds of iteration i), and the list size ell_{i,s} of the code.
+    # These depend on the regime, and are None in the regime-independent schedule.
+    delta: Optional[float] = None
+    list_size: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class WHIRRoundSchedule:
+    """
+    Immutable table of the codes of all iterations 0 <= i <= M-1 and rounds 0 <= s <= k,
+    optionally with the delta_i and list sizes of a regime.
+    """
+    folding_factor: int
+    rows: tuple[WHIRRoundParams, ...]
+    # Identifier of the regime, or None for the regime-independent schedule
+    regime: Optional[str] = None
+
+    def get(self, iteration: int, round: int) -> WHIRRoundParams:
+        """Returns the parameters of iteration i = iteration and round s = round."""
+        assert 0 <= round <= self.folding_factor, f"Round {round} out of bounds"
+        index = iteration * (self.folding_factor + 1) + round
+        assert 0 <= iteration and index < len(self.rows), f"Iteration {iteration} out of bounds"
+        return self.rows[index]
+
+    def get_domain_size(self, iteration: int) -> int:
+        """Returns the size of the domain L_i of iteration i = iteration."""
+        return 2 ** self.get(iteration, 0).log_domain_size
+
+    def with_regime(self, regime: ProximityGapsRegime) -> "WHIRRoundSchedule":
+        """
+        Returns the schedule with the delta_i and list sizes of the given regime.
+
+        delta_i is chosen small enough for the proximity gaps regime on all codes C_{RS}^{i,s}, s <= k,
+        i.e., it is the smallest delta supported by the regime over all rounds of iteration i.
+        """
+        rows = []
+        rounds_per_iteration = self.folding_factor + 1
+        for start in range(0, len(self.rows), rounds_per_iteration):
+            iteration_rows = self.rows[start:start + rounds_per_iteration]
+            delta = min(regime.get_proximity_parameter(row.rate, row.dimension) for row in iteration_rows)
+            rows.extend(
+                replace(row, delta=delta, list_size=regime.get_max_list_size(row.rate, row.dimension))
+                for row in iteration_rows
+            )
+        return WHIRRoundSchedule(self.folding_factor, tuple(rows), regime.identifier())
+
+    def to_dicts(self) -> list[dict]:
+        """Returns the rows as plain dicts, e.g., to dump them as JSON or CSV for debugging."""
+        return [asdict(row) for row in self.rows]
+
+
 class WHIR(PCS):
     """
     WHIR Polynomial Commitment Scheme.
@@ -317,8 +400,13 @@ class WHIR(PCS):
         """
         Given a config, compute all the parameters relevant for the PCS.
         """
+        # Keep the config around, so that variants of this instance can be derived
+        self.config = config
+
         # Inherit parameters from the given config
         self.hash_size_bits = config.hash_size_bits
+        self.merkle_arity = config.merkle_arity
+        self.merkle_cap_height = config.merkle_cap_height
         self.folding_factor = config.folding_factor
         self.num_iterations = config.num_iterations
         self.field = config.field
@@ -384,6 +472,10 @@ class WHIR(PCS):
             for i in range(self.num_iterations + 1)
         ]
 
+        # The codes of all iterations and rounds do not depend on the regime,
+        # so we compute them once. See `get_round_schedule`.
+        self.round_schedule = self._build_round_schedule()
+
         # Domain validity check
 
         # Calculate the initial domain size in bits: |L| = 2^{m + log_inv_rate}
@@ -457,18 +549,21 @@ class WHIR(PCS):
         """
         levels: dict[str, int] = {}
 
+        # delta_i and the list sizes of all codes, computed once for this regime
+        schedule = self.get_round_schedule(regime)
+
         # add an error from the batching step
         if self.batch_size > 1:
-            epsilon_batch = self._get_batching_error(regime)
-            levels["batching"] = get_bits_of_security_from_error(epsilon_batch)
+            epsilon_batch = self._get_batching_log_error(regime)
+            levels["batching"] = get_bits_of_security_from_log_error(epsilon_batch)
 
         # Initial Iteration (i=0)
         #
         # Construction 5.1: "1. Initial sumcheck... For l = 1...k0"
         # This iteration only contains folding (sumcheck), no OOD/Shift.
         for round_s in range(1, self.folding_factor + 1):
-            epsilon = self._epsilon_fold(iteration=0, round=round_s, regime=regime)
-            levels[f"fold(i=0,s={round_s})"] = get_bits_of_security_from_error(epsilon)
+            epsilon = self._log_epsilon_fold(iteration=0, round=round_s, regime=regime, schedule=schedule)
+            levels[f"fold(i=0,s={round_s})"] = get_bits_of_security_from_log_error(epsilon)
 
         # Main Loop (i=1 to M-1)
         #
@@ -476,118 +571,75 @@ class WHIR(PCS):
         # For each iteration i = 1, ... M - 1: OOD errors, shift errors, fold errors
         for iteration in range(1, self.num_iterations):
             # out of domain samples
-            epsilon_ood = self._epsilon_out(iteration, regime)
-            levels[f"OOD(i={iteration})"] = get_bits_of_security_from_error(epsilon_ood)
+            epsilon_ood = self._log_epsilon_out(iteration, schedule)
+            levels[f"OOD(i={iteration})"] = get_bits_of_security_from_log_error(epsilon_ood)
 
             # shift queries
-            epsilon_shift = self._epsilon_shift(iteration, regime)
-            levels[f"Shift(i={iteration})"] = get_bits_of_security_from_error(
+            epsilon_shift = self._log_epsilon_shift(iteration, schedule)
+            levels[f"Shift(i={iteration})"] = get_bits_of_security_from_log_error(
                 epsilon_shift
             )
 
             # sum check (one error for each round)
             for round in range(1, self.folding_factor + 1):
-                epsilon = self._epsilon_fold(iteration, round, regime)
+                epsilon = self._log_epsilon_fold(iteration, round, regime, schedule)
                 levels[f"fold(i={iteration},s={round})"] = (
-                    get_bits_of_security_from_error(epsilon)
+                    get_bits_of_security_from_log_error(epsilon)
                 )
 
         # final error
         # Construction 5.1: "3. Check final polynomial..."
-        epsilon_final = self._epsilon_final(regime)
-        levels["fin"] = get_bits_of_security_from_error(epsilon_final)
+        epsilon_final = self._log_epsilon_final(schedule)
+        levels["fin"] = get_bits_of_security_from_log_error(epsilon_final)
 
         return levels
 
-    def _get_code_for_iteration_and_round(
-        self, iteration: int, round: int
-    ) -> tuple[float, int]:
+    def _build_round_schedule(self) -> WHIRRoundSchedule:
         """
-        Returns the code for the given iteration and round. That is, this returns a pair (rate, dimension)
-        of the code C_{RS}^{i,s} (in notation of Theorem 5.2 in WHIR paper).
-        Here, 0<= i <= M-1 is the iteration and 0 <= s <= k is the round.
+        Returns the regime-independent schedule: the code C_{RS}^{i,s} (in notation of Theorem 5.2
+        in WHIR paper) for every iteration 0 <= i <= M-1 and round 0 <= s <= k.
         """
-
-        # Bound checks
-        assert 0 <= iteration < self.num_iterations, (
-            f"Iteration {iteration} out of bounds"
-        )
-        assert 0 <= round <= self.folding_factor, f"Round {round} out of bounds"
-
-        # The code is C_{RS}^{i,s} = RS[F, L_i^{(2^s)}, m_i - s]
-        # So the dimension is 2^{m_i - s}
-        log_dimension = self.log_degrees[iteration] - round
-        assert log_dimension >= 0, "Log dimension cannot be negative"
-        dimension = 2**log_dimension
-
-        # We know what the rate of C_{RS}^{i,0} = RS[F, L_i, m_i] is.
-        # Namely, it is 2**(-self.log_inv_rates[i]).
-        # The rate of C_{RS}^{i,s} is:
-        # 2^{m_i-s} / |L_i^{(2^s)}| =(2^{m_i} / |L_i|) * (2^{-s}/2^{-s}) = 2^{m_i} / |L_i|.
-        # So this code has the same rate.
-        rate = 2 ** (-self.log_inv_rates[iteration])
-        return (rate, dimension)
-
-    def _get_delta_for_iteration(
-        self, iteration: int, regime: ProximityGapsRegime
-    ) -> float:
-        """
-        Returns delta_i, in the notation of the paper, where i = iteration.
-
-        This is determined so that it is small enough for the proximity gaps regime on
-        all codes C_{RS}^{i,s}, s <= k.
-        """
-
-        # we iterate over all codes, i.e., over all rounds s
-        # and for each code, we determine the max delta that is supported,
-        # and then take the smallest of them, so that the condition is satisfied.
-
-        assert 0 <= iteration < self.num_iterations, "Iteration out of bounds"
-
-        delta = 1.0
-
-        # The range must be 0 <= s <= k (inclusive).
-        for round in range(0, self.folding_factor + 1):
-            (rate, dimension) = self._get_code_for_iteration_and_round(iteration, round)
-            delta_round = regime.get_proximity_parameter(rate, dimension)
-            delta = min(delta, delta_round)
-
-        return delta
-
-    def _get_list_size_for_iteration_and_round(
-        self, iteration: int, round: int, regime: ProximityGapsRegime
-    ) -> float:
+        rows = []
+        for iteration in range(self.num_iterations):
+            for round in range(self.folding_factor + 1):
+                # The code is C_{RS}^{i,s} = RS[F, L_i^{(2^s)}, m_i - s]
+                # So the dimension is 2^{m_i - s}
+                log_dimension = self.log_degrees[iteration] - round
+                assert log_dimension >= 0, "Log dimension cannot be negative"
+
+                # We know what the rate of C_{RS}^{i,0} = RS[F, L_i, m_i] is.
+                # Namely, it is 2**(-self.log_inv_rates[i]).
+                # The rate of C_{RS}^{i,s} is:
+                # 2^{m_i-s} / |L_i^{(2^s)}| =(2^{m_i} / |L_i|) * (2^{-s}/2^{-s}) = 2^{m_i} / |L_i|.
+                # So this code has the same rate.
+                rows.append(WHIRRoundParams(
+                    iteration=iteration,
+                    round=round,
+                    log_domain_size=log_dimension + self.log_inv_rates[iteration],
+                    rate=2 ** (-self.log_inv_rates[iteration]),
+                    dimension=2**log_dimension,
+                ))
+        return WHIRRoundSchedule(self.folding_factor, tuple(rows))
+
+    def get_round_schedule(self, regime: Optional[ProximityGapsRegime] = None) -> WHIRRoundSchedule:
         """
-        Returns ell_{i,s}, so that code C_{RS}^{i,s} is (ell_{i,s},delta_i)-list decodable.
-        This uses the proximity gaps regime to determine the list size.
-
-        Here, delta_i = get_delta_for_iteration(iteration,regime), i = iteration, s = round.
+        Returns the schedule of the codes of all iterations and rounds. If a regime is given,
+        this includes delta_i and the list sizes ell_{i,s} of the regime.
         """
+        if regime is None:
+            return self.round_schedule
+        return self.round_schedule.with_regime(regime)
 
-        assert 0 <= iteration < self.num_iterations, "Iteration out of bounds"
-        assert 0 <= round <= self.folding_factor, "Round out of bounds"
-
-        # Get Code Parameters
-        #
-        # We need the Rate and Dimension of C_{RS}^{i,s}
-        (rate, dimension) = self._get_code_for_iteration_and_round(iteration, round)
-
-        # Determine List Size
-        #
-        # We ask the regime for the maximum list size possible for this specific code.
-        list_size = regime.get_max_list_size(rate, dimension)
-
-        return list_size
-
-    def _get_batching_error(self, regime: ProximityGapsRegime) -> float:
+    def _get_batching_log_error(self, regime: ProximityGapsRegime) -> float:
         """
-        Returns the error due to the batching step. This depends on whether batching is done
+        Returns the error (as log2 value) due to the batching step. This depends on whether batching is done
         with powers or with random coefficients.
 
         This follows https://github.com/WizardOfMenlo/stir-whir-scripts/blob/main/src/whir.rs#L144
         """
 
-        (rate, dimension) = self._get_code_for_iteration_and_round(0, 0)
+        code = self.round_schedule.get(0, 0)
+        (rate, dimension) = (code.rate, code.dimension)
 
         # Calculate Base Error
         #
@@ -595,11 +647,11 @@ class WHIR(PCS):
         if self.power_batching:
             # Power Batching: sum c^i * f_i
             # Error is typically proportional to (batch_size - 1) * list_size / |F|
-            epsilon = regime.get_error_powers(rate, dimension, self.batch_size)
+            epsilon = regime.get_log_error_powers(rate, dimension, self.batch_size)
         else:
             # Linear Batching: sum r_i * f_i (where r_i are independent)
             # Error is typically list_size / |F| (independent of batch_size)
-            epsilon = regime.get_error_linear(rate, dimension)
+            epsilon = regime.get_log_error_linear(rate, dimension)
 
         # Apply Grinding
         #
@@ -607,11 +659,11 @@ class WHIR(PCS):
         epsilon = apply_grinding(epsilon, self.grinding_batching_phase)
         return epsilon
 
-    def _epsilon_fold(
-        self, iteration: int, round: int, regime: ProximityGapsRegime
+    def _log_epsilon_fold(
+        self, iteration: int, round: int, regime: ProximityGapsRegime, schedule: WHIRRoundSchedule
     ) -> float:
         """
-        Returns the error of a folding round. This is epsilon^fold_{i,s} in the notation
+        Returns the error (as log2 value) of a folding round. This is epsilon^fold_{i,s} in the notation
         of the paper (Theorem 5.2 in WHIR paper), where i is the iteration and s <= k is the round.
         """
 
@@ -621,20 +673,18 @@ class WHIR(PCS):
         )
 
         # the error has two terms
-        epsilon = 0
 
         # first term is d * ell_{i,s-1} / F
-        list_size = self._get_list_size_for_iteration_and_round(
-            iteration, round - 1, regime
-        )
-        epsilon += self.constraint_degree * list_size / self.field.F
+        list_size = schedule.get(iteration, round - 1).list_size
+        log_list_term = math.log2(self.constraint_degree * list_size) - math.log2(self.field.F)
 
         # second term is the proximity gaps error err(C_{RS}^{i,s}, 2, delta_i)
         # the WHIR theorem assumes that powers is a prox generator,
         # so we use the error for powers here.
         num_functions = 2
-        (rate, dimension) = self._get_code_for_iteration_and_round(iteration, round)
-        epsilon += regime.get_error_powers(rate, dimension, num_functions)
+        code = schedule.get(iteration, round)
+        log_gap_term = regime.get_log_error_powers(code.rate, code.dimension, num_functions)
+        epsilon = log2_sum(log_list_term, log_gap_term)
 
         # Apply Grinding
         # Reducing error by expending computational work.
@@ -644,9 +694,9 @@ class WHIR(PCS):
 
         return epsilon
 
-    def _epsilon_out(self, iteration: int, regime: ProximityGapsRegime) -> float:
+    def _log_epsilon_out(self, iteration: int, schedule: WHIRRoundSchedule) -> float:
         """
-        Returns the error epsilon^out_i from the paper (Theorem 5.2 in WHIR paper), where i is the iteration.
+        Returns the error epsilon^out_i (as log2 value) from the paper (Theorem 5.2 in WHIR paper), where i is the iteration.
 
         Follows https://github.com/WizardOfMenlo/stir-whir-scripts/blob/main/src/errors.rs#L146, as WHIR paper
         does not cover the case of having more than one OOD sample.
@@ -659,57 +709,57 @@ class WHIR(PCS):
 
         # term is ell_{i,0}^2 * 2^{m_i} / (2F) for one OOD sample.
         # for w many OOD samples, the 2^{m_i} / (2F) part is raised to the power w
-        list_size = self._get_list_size_for_iteration_and_round(iteration, 0, regime)
+        list_size = schedule.get(iteration, 0).list_size
         mi = self.log_degrees[iteration]
         w = self.num_ood_samples[iteration - 1]
-        epsilon = list_size * list_size * ((2**mi) / (2 * self.field.F)) ** w
+        epsilon = 2 * math.log2(list_size) + w * (mi - 1 - math.log2(self.field.F))
 
         # grinding
         epsilon = apply_grinding(epsilon, self.grinding_bits_ood[iteration - 1])
 
         return epsilon
 
-    def _epsilon_shift(self, iteration: int, regime: ProximityGapsRegime) -> float:
+    def _log_epsilon_shift(self, iteration: int, schedule: WHIRRoundSchedule) -> float:
         """
-        Returns the error epsilon^shift_i from the paper (Theorem 5.2 in WHIR paper), where i is the iteration.
+        Returns the error epsilon^shift_i (as log2 value) from the paper (Theorem 5.2 in WHIR paper), where i is the iteration.
         """
 
         # Bound check
         assert 1 <= iteration < self.num_iterations, "Shift Error applies to Main Loop"
 
         # the error has two terms, both depend on number of queries t_{M-1}
-        epsilon = 0
         t = self.num_queries[iteration - 1]
 
         # first term is (1-delta_{M-1})^{t_{M-1}}
-        delta = self._get_delta_for_iteration(iteration - 1, regime)
-        epsilon += (1.0 - delta) ** t
+        delta = schedule.get(iteration - 1, 0).delta
+        log_query_term = t * get_log_error(1.0 - delta)
 
         # second term is ell_{i,0} * (t_{i-1}+1)/F
-        list_size = self._get_list_size_for_iteration_and_round(iteration, 0, regime)
-        epsilon += list_size * (t + 1) / self.field.F
+        list_size = schedule.get(iteration, 0).list_size
+        log_list_term = math.log2(list_size * (t + 1)) - math.log2(self.field.F)
+        epsilon = log2_sum(log_query_term, log_list_term)
 
         # grinding
         epsilon = apply_grinding(epsilon, self.grinding_bits_queries[iteration - 1])
 
         return epsilon
 
-    def _epsilon_final(self, regime: ProximityGapsRegime) -> float:
+    def _log_epsilon_final(self, schedule: WHIRRoundSchedule) -> float:
         """
-        Returns the error epsilon^fin from the paper (Theorem 5.2 in WHIR paper).
+        Returns the error epsilon^fin (as log2 value) from the paper (Theorem 5.2 in WHIR paper).
         """
 
         t_final = self.num_queries[-1]
         grinding_bits = self.grinding_bits_queries[-1]
 
         # the error is (1-delta_{M-1})^{t_{M-1}}
-        delta = self._get_delta_for_iteration(self.num_iterations - 1, regime)
+        delta = schedule.get(self.num_iterations - 1, 0).delta
 
         # Sanity Check: If delta is 1.0, the code has no redundancy, and security is 0.
         # (Technically error=0, but this implies a broken config).
         assert 0 < delta < 1.0, f"Invalid delta {delta} for final round"
 
-        epsilon = (1.0 - delta) ** t_final
+        epsilon = t_final * math.log2(1.0 - delta)
 
         # grinding
         epsilon = apply_grinding(epsilon, grinding_bits)
@@ -739,7 +789,34 @@ class WHIR(PCS):
 
         return round(math.log2(grinding_sum), 2)
 
-    def _get_proof_size_bits(self, expected: bool) -> int:
+    def _get_merkle_cap_height(self, i: int) -> int:
+        """
+        Returns the Merkle cap height of the tree committing to f_i.
+        """
+        block_size = 2**self.folding_factor
+        num_leafs = self.round_schedule.get_domain_size(i) // block_size
+        if i == 0:
+            tuple_size = block_size * self.batch_size
+            element_bits = self.field.base_field_element_size_bits()
+        else:
+            tuple_size = block_size
+            element_bits = self.field.extension_field_element_size_bits()
+        return resolve_merkle_cap_height(
+            self.merkle_cap_height, num_leafs, self.num_queries[i], tuple_size, element_bits, self.hash_size_bits, self.merkle_arity)
+
+    def _get_merkle_cap_size_bits(self, i: int) -> int:
+        """
+        Returns the size of the Merkle cap (or root) of the tree committing to f_i.
+        """
+        num_leafs = self.round_schedule.get_domain_size(i) // 2**self.folding_factor
+        return get_merkle_cap_size_bits(num_leafs, self.hash_size_bits, self.merkle_arity, self._get_merkle_cap_height(i))
+
+    def get_proof_size_breakdown(self, expected: bool = False) -> dict[str, int]:
+        """
+        Returns an estimate for the (worst case or expected) proof size in bits, per component:
+        Merkle roots, sumcheck messages, OOD answers, the final polynomial, and the openings
+        of the initial function and of each folded function.
+        """
         # We estimate the proof size by looking at the WHIR paper, counting sizes of prover messages.
         # Note that verifier messages do not count into proof size, as they are obtained from Fiat-Shamir.
         # Here, messages are either field elements, polynomials, functions, or function evaluations.
@@ -759,12 +836,12 @@ class WHIR(PCS):
         ext_field_bits = self.field.extension_field_element_size_bits()
 
         # We start with a fresh proof size
-        proof_size = 0
+        breakdown = {"roots": 0, "sumcheck": 0, "OOD answers": 0}
 
         # Initial commitment
         #
-        # Prover sends the initial function (Merkle root)
-        proof_size += self.hash_size_bits
+        # Prover sends the initial function (Merkle root, or cap)
+        breakdown["roots"] += self._get_merkle_cap_size_bits(0)
 
         # Initial Sumcheck (Iteration 0)
         #
@@ -790,7 +867,7 @@ class WHIR(PCS):
         #     h(1) = claim - h(0)
         #
         # Therefore, we transmit exactly (d-1) elements instead of d.
-        proof_size += (
+        breakdown["sumcheck"] += (
             self.folding_factor * (self.constraint_degree - 1) * ext_field_bits
         )
 
@@ -802,19 +879,19 @@ class WHIR(PCS):
             # - Do sumcheck rounds.
 
             # Send function commitment (f_i)
-            proof_size += self.hash_size_bits
+            breakdown["roots"] += self._get_merkle_cap_size_bits(i)
 
             # Send evaluations for the OOD samples
             #
             # Prover sends y = f_i(z). Since z is an extension field element, y is too.
-            proof_size += self.num_ood_samples[i - 1] * ext_field_bits
+            breakdown["OOD answers"] += self.num_ood_samples[i - 1] * ext_field_bits
 
             # Sumcheck rounds
             #
             # The Prover sends 'folding_factor' (k) univariate polynomials per iteration.
             #
             # See above for NOTATION and OPTIMIZATION used here
-            proof_size += (
+            breakdown["sumcheck"] += (
                 self.folding_factor * (self.constraint_degree - 1) * ext_field_bits
             )
 
@@ -822,7 +899,7 @@ class WHIR(PCS):
         #
         # This is a multi-linear polynomial in m_M variables, i.e., it has 2^{m_M} coefficients.
         assert self.log_degrees
-        proof_size += (2 ** self.log_degrees[-1]) * ext_field_bits
+        breakdown["final polynomial"] = (2 ** self.log_degrees[-1]) * ext_field_bits
 
         # Decision phase: we query each function f_0,...,f_{M-1} that the prover sent
         # at t_i groups of points. Each group is a set of "folding siblings", also
@@ -833,7 +910,7 @@ class WHIR(PCS):
         # We query t_i paths for every iteration i from 0 to M-1.
         assert len(self.num_queries) == self.num_iterations
         for i in range(self.num_iterations):
-            domain_size = 2 ** (self.log_degrees[i] + self.log_inv_rates[i])
+            domain_size = self.round_schedule.get_domain_size(i)
             block_size = 2**self.folding_factor
             num_leafs = domain_size / block_size
 
@@ -857,18 +934,148 @@ class WHIR(PCS):
             else:
                 tuple_size = block_size
 
-            merkle_multi_proof_size = get_size_of_merkle_multi_proof_bits(num_leafs, self.num_queries[i], tuple_size, current_element_bits, self.hash_size_bits, expected)
-            proof_size += merkle_multi_proof_size
+            merkle_multi_proof_size = get_size_of_merkle_multi_proof_bits(num_leafs, self.num_queries[i], tuple_size, current_element_bits, self.hash_size_bits, expected, self.merkle_arity, self._get_merkle_cap_height(i))
+            label = "initial openings" if i == 0 else f"round {i} openings"
+            breakdown[label] = merkle_multi_proof_size
 
-        return proof_size
+        return breakdown
 
     def get_proof_size_bits(self) -> int:
         """Returns estimated proof size in bits."""
-        return self._get_proof_size_bits(expected=False)
+        return sum(self.get_proof_size_breakdown(expected=False).values())
 
     def get_expected_proof_size_bits(self) -> int:
         """Returns estimated *expected* proof size in bits."""
-        return self._get_proof_size_bits(expected=True)
+        return sum(self.get_proof_size_breakdown(expected=True).values())
+
+    def get_grinding_bits(self) -> list[int]:
+        """
+        Returns the bits of every grinding step of one proof: batching, every folding round, queries and OOD samples.
+        """
+        grinding_bits = [self.grinding_batching_phase] + self.grinding_bits_queries + self.grinding_bits_ood
+        for grinding_bits_folding_iter in self.grinding_bits_folding:
+            grinding_bits += grinding_bits_folding_iter
+        return grinding_bits
+
+    def get_prover_cost(self) -> ProverCost:
+        """
+        Returns an estimate of the prover's work for one proof.
+        """
+        base_field_bits = self.field.base_field_element_size_bits()
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        block_size = 2**self.folding_factor
+
+        lde_field_mults = 0
+        commit_field_mults = 0
+        leaf_compressions = 0
+        node_compressions = 0
+        # Every inner node hashes merkle_arity digests
+        node_cost = get_num_hash_compressions(self.merkle_arity * self.hash_size_bits, self.hash_size_bits)
+
+        for i in range(self.num_iterations):
+            domain_size = self.round_schedule.get_domain_size(i)
+            num_leafs = domain_size // block_size
+
+            # Commit to f_i: evaluate it on L_i (coefficients are known), and build the Merkle tree
+            # whose leaves are the folding blocks.
+            # - Iteration 0: batch_size base field polynomials, which are then batched.
+            # - Iteration >0: one extension field polynomial (twiddles are in the base field).
+            if i == 0:
+                lde_field_mults += self.batch_size * get_ntt_field_mults(domain_size)
+                commit_field_mults += self.batch_size * domain_size * get_mixed_mult_cost(self.field)
+                leaf_bits = block_size * self.batch_size * base_field_bits
+            else:
+                lde_field_mults += get_ntt_field_mults(domain_size) * get_mixed_mult_cost(self.field)
+                # Answer the OOD samples: evaluate the 2^{m_i} coefficients at each sample
+                commit_field_mults += self.num_ood_samples[i - 1] * (2 ** self.log_degrees[i]) * get_extension_mult_cost(self.field)
+                leaf_bits = block_size * ext_field_bits
+            leaf_compressions += num_leafs * get_num_hash_compressions(leaf_bits, self.hash_size_bits)
+            node_compressions += get_num_merkle_tree_inner_nodes(num_leafs, self.merkle_arity) * node_cost
+
+            # Sumcheck: round s evaluates a degree-d polynomial over a hypercube of 2^{m_i - s + 1} points
+            for s in range(1, self.folding_factor + 1):
+                num_points = 2 ** (self.log_degrees[i] - s + 1)
+                commit_field_mults += num_points * self.constraint_degree * get_extension_mult_cost(self.field)
+
+        return ProverCost(
+            lde_field_mults=lde_field_mults,
+            commit_field_mults=commit_field_mults,
+            merkle_leaf_compressions=leaf_compressions,
+            merkle_node_compressions=node_compressions,
+            grinding_hashes=get_grinding_work(self.get_grinding_bits()),
+        )
+
+    def get_prover_memory(self) -> ProverMemory:
+        """
+        Returns an estimate of the prover's peak memory for one proof.
+        """
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        block_size = 2**self.folding_factor
+
+        lde_bits = 0
+        merkle_bits = 0
+        codeword_bits = 0
+        for i in range(self.num_iterations):
+            domain_size = self.round_schedule.get_domain_size(i)
+            merkle_bits += get_merkle_tree_storage_bits(domain_size // block_size, self.hash_size_bits, self.merkle_arity)
+            if i == 0:
+                # Evaluations of all batch_size initial polynomials
+                lde_bits += domain_size * self.batch_size * self.field.base_field_element_size_bits()
+            else:
+                # Evaluations of the folded function f_i
+                codeword_bits += domain_size * ext_field_bits
+
+        # The sumcheck prover keeps the (batched) polynomial and the weight polynomial
+        # as tables of 2^{m_0} extension field elements each.
+        codeword_bits += 2 * (2 ** self.log_degrees[0]) * ext_field_bits
+
+        return ProverMemory(lde_bits=lde_bits, merkle_bits=merkle_bits, codeword_bits=codeword_bits)
+
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        """
+        Returns an estimate of the verifier's work for one proof.
+
+        Merkle multi-proofs are accounted for as in `get_proof_size_breakdown`.
+        """
+        base_field_bits = self.field.base_field_element_size_bits()
+        ext_field_bits = self.field.extension_field_element_size_bits()
+        block_size = 2**self.folding_factor
+
+        hash_compressions = 0
+        ext_field_mults = 0
+
+        # Batching: combine the batch_size opened values per block entry and query
+        ext_field_mults += self.num_queries[0] * block_size * self.batch_size
+
+        for i in range(self.num_iterations):
+            domain_size = self.round_schedule.get_domain_size(i)
+            num_leafs = domain_size // block_size
+            if i == 0:
+                tuple_size = block_size * self.batch_size
+                element_bits = base_field_bits
+            else:
+                tuple_size = block_size
+                element_bits = ext_field_bits
+            hash_compressions += get_num_merkle_multi_proof_compressions(
+                num_leafs, self.num_queries[i], tuple_size, element_bits, self.hash_size_bits, expected, self.merkle_arity, self._get_merkle_cap_height(i))
+
+            # Sumcheck: each of the k rounds evaluates a degree-d polynomial at the challenge
+            ext_field_mults += self.folding_factor * self.constraint_degree
+
+            # Folding checks: fold every queried block of size 2^k with the k sumcheck challenges
+            ext_field_mults += self.num_queries[i] * block_size
+
+            # Every OOD sample and shift query adds a term to the weight polynomial of the next
+            # iteration, which the verifier evaluates in m_{i+1} multiplications (an eq evaluation)
+            num_new_constraints = self.num_queries[i]
+            if i < self.num_iterations - 1:
+                num_new_constraints += self.num_ood_samples[i]
+            ext_field_mults += num_new_constraints * self.log_degrees[i + 1]
+
+        # Final check: evaluate the final polynomial at the final queries
+        ext_field_mults += self.num_queries[-1] * (2 ** self.log_degrees[-1])
+
+        return VerifierCost(hash_compressions=hash_compressions, ext_field_mults=ext_field_mults)
 
     def get_rate(self) -> float:
         return 2 ** (-self.log_inv_rates[0])
@@ -887,6 +1094,8 @@ class WHIR(PCS):
         # Collect scalar parameters
         params = {
             "hash_size_bits": self.hash_size_bits,
+            "merkle_arity": self.merkle_arity,
+            "merkle_cap_height": self.merkle_cap_height,
             "folding_factor": self.folding_factor,
             "batch_size": self.batch_size,
             "gap_to_radius": self.gap_to_radius,
@@ -913,6 +1122,13 @@ class WHIR(PCS):
         lines.append(f"    grinding_bits_ood     : {self.grinding_bits_ood}")
         lines.append(f"    grinding_bits_folding : {self.grinding_bits_folding}")
         lines.append("")
+        lines.append("  Round schedule (iteration i, round s):")
+        for row in self.round_schedule.rows:
+            lines.append(
+                f"    i={row.iteration}, s={row.round} : |L| = 2^{row.log_domain_size}, "
+                f"rate = 2^{round(math.log2(row.rate))}, dimension = 2^{round(math.log2(row.dimension))}"
+            )
+        lines.append("")
         lines.append(
             f"  Total grinding overhead (sum of 2^grinding_bits) = 2^({self.log_grinding_overhead})"
         )
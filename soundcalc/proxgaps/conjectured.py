@@ -0,0 +1,79 @@
+import math
+from typing import Callable, Optional
+
+from soundcalc.common import elementwise
+from soundcalc.common.utils import get_log_error
+from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
+
+
+def get_capacity_list_size(rate: float, dimension: int, eta: float) -> float:
+    """
+    List size under the up-to-capacity list-decoding conjecture, as used for the
+    "ConjectureList" soundness type of WHIR: n / eta.
+    """
+    return (dimension / rate) / eta
+
+
+def get_capacity_error_linear(rate: float, dimension: int, eta: float) -> float:
+    """
+    Numerator of the MCA error (i.e., the error times |F|) under the up-to-capacity
+    proximity gaps conjecture (see Conjecture 8.4 in BCIKS20), for independent coefficients:
+    n / eta, as used for the "ConjectureList" soundness type of WHIR.
+    """
+    return (dimension / rate) / eta
+
+
+class ConjecturedRegime(ProximityGapsRegime):
+    """
+    A regime based on a conjecture that proximity gaps (and list decoding) hold up to capacity,
+    i.e., for proximity parameters up to 1 - rate - eta.
+
+    The list size and the MCA error are given by pluggable formulas, taking the rate, the
+    dimension and eta. The MCA error formula returns the numerator, i.e., the error times |F|.
+    By default, we use the formulas of the "ConjectureList" soundness type of WHIR.
+
+    Note: recent work refutes some of these conjectures for some parameters, so security levels
+    in this regime are not proven. We only use it to estimate what a conjecture would buy.
+    """
+
+    def __init__(
+            self,
+            field,
+            eta: Optional[float] = None,
+            list_size_formula: Callable[[float, int, float], float] = get_capacity_list_size,
+            error_formula: Callable[[float, int, float], float] = get_capacity_error_linear,
+            name: str = "CONJ",
+    ):
+        super().__init__(field)
+        # Optional override for the gap to capacity. If not set, we use rate / 20.
+        self.eta = eta
+        self.list_size_formula = list_size_formula
+        self.error_formula = error_formula
+        self.name = name
+
+    def identifier(self) -> str:
+        return self.name
+
+    def is_proven(self) -> bool:
+        return False
+
+    def get_eta(self, rate: float) -> float:
+        """Returns the gap between the proximity parameter and the capacity 1 - rate."""
+        eta = self.eta if self.eta is not None else rate / 20
+        assert elementwise.all_true((0 < eta) & (eta < 1 - rate))
+        return eta
+
+    def get_proximity_parameter(self, rate: float, dimension: int) -> float:
+        return 1 - rate - self.get_eta(rate)
+
+    def get_max_list_size(self, rate: float, dimension: int) -> float:
+        return self.list_size_formula(rate, dimension, self.get_eta(rate))
+
+    def get_log_error_powers(self, rate: float, dimension: int, num_functions: int) -> float:
+        return self.get_log_error_linear(rate, dimension) + get_log_error(num_functions - 1)
+
+    def get_log_error_linear(self, rate: float, dimension: int) -> float:
+        return elementwise.log2(self.error_formula(rate, dimension, self.get_eta(rate))) - math.log2(self.field.F)
+
+    def get_log_error_multilinear(self, rate: float, dimension: int, num_functions: int) -> float:
+        return self.get_log_error_linear(rate, dimension) + get_log_error(elementwise.ceil(elementwise.log2(num_functions)))
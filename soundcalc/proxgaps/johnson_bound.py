@@ -1,6 +1,8 @@
 import math
 from typing import Optional
 
+from soundcalc.common import elementwise
+from soundcalc.common.utils import get_log_error
 from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
 
 class JohnsonBoundRegime(ProximityGapsRegime):
@@ -19,7 +21,7 @@ class JohnsonBoundRegime(ProximityGapsRegime):
 
     def get_proximity_parameter(self, rate: float, dimension: int) -> float:
         # The proximity parameter defines how close we are to the Johnson Bound 1-sqrt(rate).
-        sqrt_rate = math.sqrt(rate)
+        sqrt_rate = elementwise.sqrt(rate)
 
         # Config override (primarily for FRI-based systems that want fixed params).
         if self.gap_to_radius is not None:
@@ -31,17 +33,17 @@ class JohnsonBoundRegime(ProximityGapsRegime):
         if self.field.F > 2**150:
             gap = sqrt_rate / 100
         else:
-            gap = max(rate / 20, sqrt_rate / 100)
+            gap = elementwise.maximum(rate / 20, sqrt_rate / 100)
 
         return 1 - sqrt_rate - gap
 
     def get_max_list_size(self, rate: float, dimension: int) -> int:
         # Reed-Solomon codes are (1 - sqrt(rate) - gap, (2*gap*sqrt(rate))⁻¹)-list decodable.
-        sqrt_rate = math.sqrt(rate)
+        sqrt_rate = elementwise.sqrt(rate)
         pp = self.get_proximity_parameter(rate, dimension)
 
         gap = 1 - sqrt_rate - pp
-        assert gap > 0
+        assert elementwise.all_true(gap > 0)
 
         return 1.0 / (2 * gap * sqrt_rate)
 
@@ -49,23 +51,23 @@ class JohnsonBoundRegime(ProximityGapsRegime):
         """
         Set m according to Theorem 4.2 of BCHKS25
         """
-        sqrt_rate = math.sqrt(rate)
+        sqrt_rate = elementwise.sqrt(rate)
         pp = self.get_proximity_parameter(rate, dimension)
-        assert pp < 1 - sqrt_rate
+        assert elementwise.all_true(pp < 1 - sqrt_rate)
 
         # Theorem 4.2 of BCHKS25 says:
         #    m = max{ ceil( sqrt(rate) / (1 - sqrt(rate) - pp) ), 3 }
         denominator = 1 - sqrt_rate - pp
-        m = math.ceil(sqrt_rate / denominator)
-        return max(m, 3)
+        m = elementwise.ceil(sqrt_rate / denominator)
+        return elementwise.maximum(m, 3)
 
-    def get_error_powers(self, rate: float, dimension: int, num_functions: int) -> float:
-        return self.get_error_linear(rate, dimension) * (num_functions - 1)
+    def get_log_error_powers(self, rate: float, dimension: int, num_functions: int) -> float:
+        return self.get_log_error_linear(rate, dimension) + get_log_error(num_functions - 1)
 
-    def get_error_linear(self, rate: float, dimension: int) -> float:
+    def get_log_error_linear(self, rate: float, dimension: int) -> float:
         """ Use Theorem 4.2 from BCHKS25 to compute the error"""
 
-        sqrt_rate = math.sqrt(rate)
+        sqrt_rate = elementwise.sqrt(rate)
 
         pp = self.get_proximity_parameter(rate, dimension)
         m = self.get_m(rate, dimension)
@@ -80,7 +82,7 @@ class JohnsonBoundRegime(ProximityGapsRegime):
         # Now the second one
         second_fraction = m_shifted / sqrt_rate
 
-        return (first_fraction + second_fraction) / self.field.F
+        return elementwise.log2(first_fraction + second_fraction) - math.log2(self.field.F)
 
-    def get_error_multilinear(self, rate: float, dimension: int, num_functions: int) -> float:
-        return self.get_error_linear(rate, dimension) * math.ceil(math.log2(num_functions))
+    def get_log_error_multilinear(self, rate: float, dimension: int, num_functions: int) -> float:
+        return self.get_log_error_linear(rate, dimension) + get_log_error(elementwise.ceil(elementwise.log2(num_functions)))
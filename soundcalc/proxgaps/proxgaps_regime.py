@@ -17,6 +17,10 @@ class ProximityGapsRegime(ABC):
         """Returns the name of the regime."""
         ...
 
+    def is_proven(self) -> bool:
+        """Returns whether the bounds of this regime are proven (rather than conjectured)."""
+        return True
+
     @abstractmethod
     def get_proximity_parameter(self, rate: float, dimension: int) -> float:
         """
@@ -34,9 +38,9 @@ class ProximityGapsRegime(ABC):
         ...
 
     @abstractmethod
-    def get_error_powers(self, rate: float, dimension: int, batch_size: int) -> float:
+    def get_log_error_powers(self, rate: float, dimension: int, batch_size: int) -> float:
         """
-        Returns an upper bound on the MCA error when applying a random linear combination.
+        Returns an upper bound on the MCA error (as log2 value) when applying a random linear combination.
         The coefficients are assumed to be powers here.
 
         Note: the errors for correlated agreement in the following two cases differ,
@@ -60,9 +64,9 @@ class ProximityGapsRegime(ABC):
         ...
 
     @abstractmethod
-    def get_error_linear(self, rate: float, dimension: int) -> float:
+    def get_log_error_linear(self, rate: float, dimension: int) -> float:
         """
-        Returns an upper bound on the MCA error when applying a random linear combination.
+        Returns an upper bound on the MCA error (as log2 value) when applying a random linear combination.
         The coefficients are assumed to be independent here.
 
         See the comment above about the difference between powers, linear, and multilinear.
@@ -70,9 +74,9 @@ class ProximityGapsRegime(ABC):
         ...
 
     @abstractmethod
-    def get_error_multilinear(self, rate: float, dimension: int, batch_size: int) -> float:
+    def get_log_error_multilinear(self, rate: float, dimension: int, batch_size: int) -> float:
         """
-        Returns an upper bound on the MCA error when applying a random linear combination.
+        Returns an upper bound on the MCA error (as log2 value) when applying a random linear combination.
         The coefficients are assumed to be from the eq polynomial.
 
         See the comment above about the difference between powers, linear, and multilinear.
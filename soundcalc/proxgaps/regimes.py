@@ -0,0 +1,40 @@
+"""
+Regime strings, as used in TOML configs and on the command line.
+
+A regime string is "UDR", "JBR" or "CONJ" (see `ConjecturedRegime`). The conjectured
+regime optionally takes its gap to capacity, as in "CONJ:0.01".
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from soundcalc.common.fields import FieldParams
+from soundcalc.proxgaps.conjectured import ConjecturedRegime
+from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
+from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
+from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
+
+# The regimes analyzed if a config does not list any
+DEFAULT_REGIMES = ["UDR", "JBR"]
+
+
+def parse_regime(regime_str: str, field: FieldParams, gap_to_radius: Optional[float] = None) -> ProximityGapsRegime:
+    """
+    Parse a regime string into a ProximityGapsRegime over the given field.
+    The gap_to_radius (of a circuit config) is used for JBR.
+    """
+    name, _, parameter = regime_str.replace(" ", "").partition(":")
+    if name == "UDR" and not parameter:
+        return UniqueDecodingRegime(field)
+    if name == "JBR" and not parameter:
+        return JohnsonBoundRegime(field, gap_to_radius=gap_to_radius)
+    if name == "CONJ":
+        if not parameter:
+            return ConjecturedRegime(field)
+        try:
+            eta = float(parameter)
+        except ValueError:
+            raise ValueError(f"Unknown regime: {regime_str}") from None
+        return ConjecturedRegime(field, eta=eta, name=f"CONJ:{parameter}")
+    raise ValueError(f"Unknown regime: {regime_str}")
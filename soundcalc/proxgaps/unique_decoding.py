@@ -1,6 +1,9 @@
-from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
 import math
 
+from soundcalc.common import elementwise
+from soundcalc.common.utils import get_log_error
+from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
+
 class UniqueDecodingRegime(ProximityGapsRegime):
     """
     Unique decoding Regime (UDR).
@@ -14,14 +17,14 @@ class UniqueDecodingRegime(ProximityGapsRegime):
     def get_max_list_size(self, rate: float, dimension: int) -> int:
         return 1
 
-    def get_error_powers(self, rate: float, dimension: int, num_functions: int) -> float:
-        return self.get_error_linear(rate, dimension) * (num_functions - 1)
+    def get_log_error_powers(self, rate: float, dimension: int, num_functions: int) -> float:
+        return self.get_log_error_linear(rate, dimension) + get_log_error(num_functions - 1)
 
-    def get_error_linear(self, rate: float, dimension: int) -> float:
+    def get_log_error_linear(self, rate: float, dimension: int) -> float:
         # Using Corollary 1.4 (which points to Theorem 1.3) from BCHKS25
         gamma = (1 - rate) / 2
         n = dimension / rate
-        return (gamma * n + 1) / self.field.F
+        return elementwise.log2(gamma * n + 1) - math.log2(self.field.F)
 
-    def get_error_multilinear(self, rate: float, dimension: int, num_functions: int) -> float:
-        return self.get_error_linear(rate, dimension) * math.ceil(math.log2(num_functions))
+    def get_log_error_multilinear(self, rate: float, dimension: int, num_functions: int) -> float:
+        return self.get_log_error_linear(rate, dimension) + get_log_error(elementwise.ceil(elementwise.log2(num_functions)))
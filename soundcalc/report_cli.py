@@ -9,11 +9,12 @@ from __future__ import annotations
 import json
 
 from soundcalc.common.utils import KIB
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
 from soundcalc.zkvms.circuit import Circuit
 from soundcalc.zkvms.zkvm import zkVM
 
 
-def _print_summary_for_circuit(circuit: Circuit) -> None:
+def _print_summary_for_circuit(circuit: Circuit, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> None:
     """
     Print a summary of security results for a single circuit.
     """
@@ -23,13 +24,23 @@ def _print_summary_for_circuit(circuit: Circuit) -> None:
     proof_size_expected_kib = circuit.get_expected_proof_size_bits() // KIB
     print(f"proof size estimate (expected): {proof_size_expected_kib} KiB, where 1 KiB = 1024 bytes")
     print("")
+    prover_seconds = circuit.get_prover_seconds(profile)
+    print(f"prover time estimate (single core, {profile.name} profile): {prover_seconds:.3f} s")
+    print("")
+    prover_memory_mib = circuit.get_prover_memory().get_peak_bits() / 8 / 2**20
+    print(f"prover memory estimate (peak): {prover_memory_mib:.1f} MiB")
+    print("")
+    verifier_cost = circuit.get_verifier_cost()
+    print(f"verifier cost estimate (expected): {int(verifier_cost.hash_compressions)} hash compressions, "
+          f"{int(verifier_cost.ext_field_mults)} extension field multiplications")
+    print("")
     print(f"parameters: \n {circuit.get_parameter_summary()}")
     print("")
     security_levels = circuit.get_security_levels()
     print(f"security levels (rbr): \n {json.dumps(security_levels, indent=4)}")
 
 
-def _print_summary_for_zkvm(zkvm: zkVM) -> None:
+def _print_summary_for_zkvm(zkvm: zkVM, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> None:
     """
     Print a summary of security results for a zkVM and all its circuits.
     """
@@ -43,23 +54,33 @@ def _print_summary_for_zkvm(zkvm: zkVM) -> None:
     if len(circuits) == 1:
         # Single circuit - print directly
         print("")
-        _print_summary_for_circuit(circuits[0])
+        _print_summary_for_circuit(circuits[0], profile)
     else:
         # Multiple circuits - print each as a subsection
         for circuit in circuits:
             print("")
             print(f"--- Circuit: {circuit.get_name()} ---")
             print("")
-            _print_summary_for_circuit(circuit)
+            _print_summary_for_circuit(circuit, profile)
+
+    pipeline = zkvm.pipeline
+    if pipeline is not None:
+        regime, bits, weakest_circuit = pipeline.get_weakest_link()
+        print("")
+        print("--- Recursion pipeline ---")
+        print(f"layers: {' -> '.join(layer.get_name() for layer in pipeline.get_layers())}")
+        print(f"prover time estimate (end-to-end, {pipeline.num_segments} segments): {pipeline.get_prover_seconds(profile):.3f} s")
+        print(f"final proof size estimate (worst case): {pipeline.get_final_proof_size_bits() // KIB} KiB")
+        print(f"weakest link: {bits} bits ({regime}, {weakest_circuit})")
 
     print("")
     print("")
     print("")
 
 
-def print_summaries(zkvms: list[zkVM]) -> None:
+def print_summaries(zkvms: list[zkVM], profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> None:
     """
     Print CLI summaries for all zkVMs.
     """
     for zkvm in zkvms:
-        _print_summary_for_zkvm(zkvm)
+        _print_summary_for_zkvm(zkvm, profile)
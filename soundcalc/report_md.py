@@ -11,11 +11,21 @@ import os
 from dataclasses import dataclass
 from typing import Any
 
+from soundcalc.common.fields import get_extension_field
 from soundcalc.common.utils import KIB
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
 from soundcalc.pcs.fri import FRI
 from soundcalc.pcs.jagged import JaggedPCS
+from soundcalc.pcs.stir import STIR
 from soundcalc.pcs.whir import WHIR
 from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.conjecture_savings import get_conjecture_savings
+from soundcalc.zkvms.extension_selector import select_extension_degree
+from soundcalc.zkvms.gap_optimizer import optimize_gap_to_radius
+from soundcalc.zkvms.pipeline import Pipeline
+from soundcalc.zkvms.rate_advisor import advise_rate
+from soundcalc.zkvms.variants import with_field
+from soundcalc.zkvms.verifier_circuit import VerifierCircuitModel, get_fixed_point_pipeline
 from soundcalc.zkvms.zkvm import zkVM
 
 
@@ -23,7 +33,7 @@ REPORTS_DIR = "reports"
 SUMMARY_REPORT_NAME = "summary.md"
 
 # zkVMs excluded from the summary overview (test/dummy entries)
-_SUMMARY_EXCLUDE = {"DummyWHIR"}
+_SUMMARY_EXCLUDE = {"DummyWHIR", "DummySTIR"}
 
 
 @dataclass
@@ -38,11 +48,16 @@ class zkVMSummary:
     security_bits: int
     security_regime: str
     final_proof_size_kib: int
+    peak_prover_memory_bits: float
+    # Savings of the final circuit under conjectured up-to-capacity proximity gaps
+    conjecture_savings: str = "—"
 
 
-def _compute_overview_stats(circuits: list[Circuit]) -> dict[str, Any]:
+def _compute_overview_stats(circuits: list[Circuit], profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                            final_circuit: Circuit | None = None) -> dict[str, Any]:
     """
     Compute overview statistics for a list of circuits.
+    The final circuit defaults to the last one.
 
     Returns a dict containing:
     - final_circuit_name: Name of the final circuit
@@ -50,24 +65,30 @@ def _compute_overview_stats(circuits: list[Circuit]) -> dict[str, Any]:
     - best_regime: The regime with highest minimum security (UDR or JBR)
     - min_security_bits: The minimum bits of security across all circuits
     - offending_circuit: Name of the circuit with lowest security
+    - total_prover_seconds: Estimated prover time for one proof of every circuit
+    - peak_memory_bits: Largest estimated peak prover memory across all circuits
+    - peak_memory_circuit: Name of the circuit with the largest peak prover memory
     """
     if not circuits:
         return {}
 
-    final_circuit = circuits[-1]
+    if final_circuit is None:
+        final_circuit = circuits[-1]
     final_proof_size_kib = final_circuit.get_proof_size_bits() // KIB
 
     # Track minimum security per regime
     regime_mins: dict[str, tuple[int, str]] = {}  # regime -> (min_bits, circuit_name)
 
     for circuit in circuits:
-        security_levels = circuit.get_security_levels()
+        security_levels = circuit.get_security_levels(proven_only=True)
         for regime_name, levels in security_levels.items():
             if isinstance(levels, dict) and "total" in levels:
                 total_bits = levels["total"]
                 if regime_name not in regime_mins or total_bits < regime_mins[regime_name][0]:
                     regime_mins[regime_name] = (total_bits, circuit.get_name())
 
+    peak_memory_circuit = max(circuits, key=lambda c: c.get_prover_memory().get_peak_bits())
+
     # Find the regime with the highest minimum security
     best_regime = None
     best_min_bits = -1
@@ -85,6 +106,9 @@ def _compute_overview_stats(circuits: list[Circuit]) -> dict[str, Any]:
         "best_regime": best_regime,
         "min_security_bits": best_min_bits,
         "offending_circuit": offending_circuit,
+        "total_prover_seconds": sum(circuit.get_prover_seconds(profile) for circuit in circuits),
+        "peak_memory_bits": peak_memory_circuit.get_prover_memory().get_peak_bits(),
+        "peak_memory_circuit": peak_memory_circuit.get_name(),
     }
 
 
@@ -100,6 +124,8 @@ def _pcs_label(circuit: Circuit) -> str:
         return "FRI"
     elif isinstance(circuit.pcs, WHIR):
         return "WHIR"
+    elif isinstance(circuit.pcs, STIR):
+        return "STIR"
     elif isinstance(circuit.pcs, JaggedPCS):
         return "Jagged + FRI"
     return "Unknown"
@@ -125,6 +151,7 @@ def _collect_zkvm_summary(zkvm: zkVM) -> zkVMSummary:
             security_bits=0,
             security_regime="N/A",
             final_proof_size_kib=0,
+            peak_prover_memory_bits=0,
         )
 
     field = _field_label(circuits[0].field)
@@ -133,7 +160,7 @@ def _collect_zkvm_summary(zkvm: zkVM) -> zkVMSummary:
     # Track minimum security per regime across all circuits
     regime_mins: dict[str, tuple[int, str]] = {}  # regime -> (min_bits, circuit_name)
     for circuit in circuits:
-        levels = circuit.get_security_levels()
+        levels = circuit.get_security_levels(proven_only=True)
         for regime_name, regime_data in levels.items():
             if isinstance(regime_data, dict) and "total" in regime_data:
                 total_bits = regime_data["total"]
@@ -150,7 +177,7 @@ def _collect_zkvm_summary(zkvm: zkVM) -> zkVMSummary:
             best_regime = regime_name
             weakest_name = circuit_name
 
-    final_proof_kib = circuits[-1].get_proof_size_bits() // KIB
+    final_proof_kib = zkvm.get_final_circuit().get_proof_size_bits() // KIB
 
     return zkVMSummary(
         name=zkvm.get_name(),
@@ -162,9 +189,236 @@ def _collect_zkvm_summary(zkvm: zkVM) -> zkVMSummary:
         security_bits=best_bits,
         security_regime=best_regime,
         final_proof_size_kib=int(final_proof_kib),
+        peak_prover_memory_bits=max(c.get_prover_memory().get_peak_bits() for c in circuits),
+        conjecture_savings=_conjecture_savings_cell(zkvm.get_final_circuit()),
+    )
+
+
+def _format_seconds(seconds: float) -> str:
+    if seconds < 1:
+        return f"{seconds * 1000:.1f} ms"
+    return f"{seconds:.2f} s"
+
+
+def _proof_size_breakdown_lines(circuit: Circuit) -> list[str]:
+    """Get a table showing where the bytes of the proof go."""
+    expected = circuit.get_proof_size_breakdown(expected=True)
+    worst = circuit.get_proof_size_breakdown(expected=False)
+    total = sum(worst.values())
+
+    lines = ["| Component | Expected | Worst case | Share (worst case) |", "| --- | --- | --- | --- |"]
+    for component, worst_bits in worst.items():
+        lines.append(
+            f"| {component} | {expected[component] / KIB:.1f} KiB | {worst_bits / KIB:.1f} KiB "
+            f"| {100 * worst_bits / total:.1f}% |"
+        )
+    return lines
+
+
+def _prover_time_line(circuit: Circuit, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> str:
+    """Get the prover time estimate line for a circuit."""
+    breakdown = circuit.get_prover_cost().get_seconds_breakdown(circuit.field, profile, circuit.hash_name)
+    total = sum(breakdown.values())
+    parts = ", ".join(f"{name} {_format_seconds(seconds)}" for name, seconds in breakdown.items())
+    return f"**Prover Time:** {_format_seconds(total)} ({parts})"
+
+
+def _format_hashes(num_hashes: float) -> str:
+    if num_hashes == 0:
+        return "0"
+    return f"2^{math.log2(num_hashes):.1f}"
+
+
+def _grinding_line(circuit: Circuit, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> str:
+    """Get the proof-of-work line for a circuit: expected hashes and time over all grinding steps."""
+    grinding_bits = [bits for bits in circuit.get_grinding_bits() if bits > 0]
+    if not grinding_bits:
+        return "**Grinding:** none"
+    return (
+        f"**Grinding:** {_format_hashes(circuit.get_grinding_work())} hashes expected "
+        f"over {len(grinding_bits)} step{'s' if len(grinding_bits) > 1 else ''} (up to {max(grinding_bits)} bits), "
+        f"{_format_seconds(circuit.get_grinding_seconds(profile))}"
+    )
+
+
+def _format_memory(bits: float) -> str:
+    num_bytes = bits / 8
+    if num_bytes < 2**30:
+        return f"{num_bytes / 2**20:.1f} MiB"
+    return f"{num_bytes / 2**30:.2f} GiB"
+
+
+def _prover_memory_line(circuit: Circuit) -> str:
+    """Get the peak prover memory estimate line for a circuit."""
+    memory = circuit.get_prover_memory()
+    return (
+        f"**Prover Memory:** {_format_memory(memory.get_peak_bits())} peak "
+        f"(LDE {_format_memory(memory.lde_bits)}, Merkle {_format_memory(memory.merkle_bits)}, "
+        f"codewords {_format_memory(memory.codeword_bits)})"
+    )
+
+
+def _verifier_cost_line(circuit: Circuit) -> str:
+    """Get the verifier cost estimate line for a circuit."""
+    expected = circuit.get_verifier_cost(expected=True)
+    worst = circuit.get_verifier_cost(expected=False)
+    return (
+        f"**Verifier Cost:** {int(expected.hash_compressions)} (expected) / {int(worst.hash_compressions)} (worst case) "
+        f"hash compressions, {int(expected.ext_field_mults)} extension field multiplications"
     )
 
 
+def _gap_optimization_line(circuit: Circuit) -> str:
+    """Get the line with the JBR gap maximizing the total security of a circuit."""
+    result = optimize_gap_to_radius(circuit)
+    current = "heuristic gap" if result.baseline_gap_to_radius is None else f"gap {result.baseline_gap_to_radius:.4g}"
+    if result.get_bits_gained() == 0:
+        return f"**JBR Gap:** the {current} is optimal ({result.bits} bits)"
+    return (
+        f"**JBR Gap:** gap_to_radius = {result.gap_to_radius:.4g} gives {result.bits} bits "
+        f"(+{result.get_bits_gained()} over the {current})"
+    )
+
+
+def _rate_advisor_lines(circuit: Circuit) -> list[str]:
+    """Get the table of rate options for a circuit (empty if the PCS is not supported)."""
+    if not isinstance(circuit.pcs, (FRI, JaggedPCS, WHIR)):
+        return []
+    try:
+        advice = advise_rate(circuit)
+    except ValueError:
+        return []
+
+    recommended = advice.get_recommended()
+    lines = [
+        f"**Rate Advisor:** minimum queries for {advice.target_bits} bits ({advice.regime}), "
+        f"recommended rate 2^-{recommended.log_inv_rate}",
+        "",
+        "| Rate | Queries | Proof Size | LDE Domain | Cost |",
+        "|------|---------|------------|------------|------|",
+    ]
+    for option, cost in zip(advice.options, advice.costs):
+        row = (
+            f"| 2^-{option.log_inv_rate} | {', '.join(map(str, option.num_queries))} "
+            f"| {int(option.get_proof_size_bits() // KIB)} KiB | 2^{int(math.log2(option.get_domain_size()))} | {cost:.2f} |"
+        )
+        lines.append(row.replace(f"| 2^-{option.log_inv_rate} |", f"| **2^-{option.log_inv_rate}** |") if option is recommended else row)
+    return lines
+
+
+def _extension_degree_line(circuit: Circuit) -> str:
+    """Get the line with the smallest extension degree keeping the security of a circuit."""
+    selection = select_extension_degree(circuit)
+    field = selection.get_field()
+    if field.field_extension_degree < circuit.field.field_extension_degree:
+        return (
+            f"**Extension Degree:** {field.name} suffices for {selection.target_bits} bits ({selection.regime}), "
+            f"saving {selection.get_element_bits_saved()} bits per element and "
+            f"{int(selection.get_proof_size_bits_saved() // KIB)} KiB of proof size (expected)"
+        )
+
+    line = f"**Extension Degree:** {field.name} is the smallest extension reaching {selection.target_bits} bits ({selection.regime})"
+    if field.field_extension_degree > 1:
+        smaller = with_field(circuit, get_extension_field(field, field.field_extension_degree - 1))
+        try:
+            line += f"; {smaller.field.name} gives {smaller.get_security_levels()[selection.regime]['total']} bits"
+        except AssertionError:
+            pass
+    return line
+
+
+def _conjecture_savings_line(circuit: Circuit) -> str | None:
+    """Get the line with the savings of a circuit under conjectured proximity gaps (None if not supported)."""
+    if not isinstance(circuit.pcs, (FRI, JaggedPCS, WHIR)):
+        return None
+    regime = circuit.get_reference_regime()
+    target_bits = circuit.get_security_levels()[regime]["total"]
+    try:
+        savings = get_conjecture_savings(circuit, target_bits=target_bits, regime=regime)
+    except ValueError:
+        return f"**Conjectured Capacity:** no number of queries reaches {target_bits} bits ({regime}) under the up-to-capacity conjecture"
+
+    num_queries = ", ".join(map(str, savings.num_queries))
+    return (
+        f"**Conjectured Capacity:** if proximity gaps held up to capacity (η = {savings.get_eta():.3g}), "
+        f"{num_queries} queries reach {target_bits} bits ({regime}), saving {savings.get_queries_saved()} queries and "
+        f"{int(savings.get_proof_size_bits_saved() // KIB)} KiB of proof size (expected)"
+    )
+
+
+def _conjecture_savings_cell(circuit: Circuit) -> str:
+    """Get the summary cell with the savings of a circuit under conjectured proximity gaps."""
+    if not isinstance(circuit.pcs, (FRI, JaggedPCS, WHIR)):
+        return "—"
+    try:
+        savings = get_conjecture_savings(circuit)
+    except ValueError:
+        return "—"
+    return f"{savings.get_queries_saved()} queries / {int(savings.get_proof_size_bits_saved() // KIB)} KiB"
+
+
+def _circuit_link(name: str) -> str:
+    return f"[{name}](#{name.lower().replace(' ', '-')})"
+
+
+def _build_pipeline_section(pipeline: Pipeline, profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                            verifier_circuit_model: VerifierCircuitModel | None = None) -> list[str]:
+    """
+    Build the recursion pipeline section: per layer, the number of proofs, the prover
+    time spent in the layer, and the verifier work one proof of the layer arithmetizes.
+    With a verifier circuit model fitted to the zkVM, also the trace lengths the
+    recursion layers converge to.
+    """
+    num_proofs = pipeline.get_num_proofs()
+    layer_seconds = pipeline.get_layer_prover_seconds(profile)
+    regime, bits, weakest_circuit = pipeline.get_weakest_link()
+
+    lines = ["## Recursion Pipeline", ""]
+    lines.append(f"Base segments: {pipeline.num_segments}. Each layer verifies proofs of the layer above it in the table.")
+    lines.append("")
+    lines.append("| Layer | Circuit | Arity | Proofs | Prover time | Verified work per proof |")
+    lines.append("| --- | --- | --- | --- | --- | --- |")
+    for i, layer in enumerate(pipeline.get_layers()):
+        arity = f"{layer.arity} (tree)" if layer.recursive else str(layer.arity)
+        verifier_cost = pipeline.get_arithmetized_verifier_cost(i)
+        if verifier_cost is None:
+            verified = "—"
+        else:
+            verified = (f"{int(verifier_cost.hash_compressions)} hash compressions, "
+                        f"{int(verifier_cost.ext_field_mults)} ext. mults")
+        lines.append(
+            f"| {i} | {_circuit_link(layer.get_name())} | {arity} | {num_proofs[i]} "
+            f"| {_format_seconds(layer_seconds[i])} | {verified} |"
+        )
+    lines.append("")
+    lines.append(
+        f"**End-to-end:** {_format_seconds(sum(layer_seconds))} prover time, "
+        f"{int(pipeline.get_final_proof_size_bits() // KIB)} KiB final proof (worst case), "
+        f"weakest link {bits} bits ({regime}, {_circuit_link(weakest_circuit)})"
+    )
+    lines.append("")
+
+    # Trace lengths the recursion layers converge to under the verifier circuit model.
+    # The model is only meaningful when fitted to the zkVM, so there is no default.
+    if verifier_circuit_model is None:
+        return lines
+    if not all(isinstance(layer.circuit.pcs, FRI) for layer in pipeline.get_layers()[1:]):
+        estimates = "n/a (FRI only)"
+    else:
+        try:
+            fixed_point = get_fixed_point_pipeline(pipeline, verifier_circuit_model)
+            estimates = ", ".join(
+                f"{layer.get_name()} 2^{int(math.log2(layer.circuit.pcs.get_trace_length()))} "
+                f"(configured 2^{int(math.log2(configured.circuit.pcs.get_trace_length()))})"
+                for layer, configured in zip(fixed_point.get_layers()[1:], pipeline.get_layers()[1:])
+            )
+        except ValueError as e:
+            estimates = f"n/a ({e})"
+    lines.append(f"**Estimated recursion trace lengths (fixed point):** {estimates}")
+    lines.append("")
+    return lines
+
+
 def _fri_parameter_lines(circuit: Circuit) -> list[str]:
     pcs = circuit.pcs
     batching = "Powers" if pcs.power_batching else "Affine"
@@ -174,6 +428,10 @@ def _fri_parameter_lines(circuit: Circuit) -> list[str]:
         f"- Number of queries: {pcs.num_queries}",
         f"- Grinding query phase (bits): {pcs.grinding_query_phase}",
     ]
+    if pcs.merkle_arity != 2:
+        lines.append(f"- Merkle tree arity: {pcs.merkle_arity}")
+    if pcs.merkle_cap_height != 0:
+        lines.append(f"- Merkle cap height: {pcs.merkle_cap_height}")
     if pcs.grinding_commit_phase > 0:
         lines.append(f"- Grinding commit phase, at every folding round (bits): {pcs.grinding_commit_phase}")
     if pcs.grinding_batching_phase > 0:
@@ -191,6 +449,8 @@ def _fri_parameter_lines(circuit: Circuit) -> list[str]:
         f"- Batch size: {pcs.batch_size}",
         f"- Batching: {batching}",
     ])
+    if pcs.commitment_groups is not None:
+        lines.append(f"- Commitment groups: {pcs.get_commitment_groups_label()}")
     return lines
 
 
@@ -207,6 +467,10 @@ def _jagged_parameter_lines(circuit: Circuit) -> list[str]:
         f"- Number of queries: {dense_pcs.num_queries}",
         f"- Grinding query phase (bits): {dense_pcs.grinding_query_phase}",
     ]
+    if dense_pcs.merkle_arity != 2:
+        lines.append(f"- Merkle tree arity: {dense_pcs.merkle_arity}")
+    if dense_pcs.merkle_cap_height != 0:
+        lines.append(f"- Merkle cap height: {dense_pcs.merkle_cap_height}")
     if dense_pcs.grinding_commit_phase > 0:
         lines.append(f"- Grinding commit phase, at every folding round (bits): {dense_pcs.grinding_commit_phase}")
     if dense_pcs.grinding_batching_phase > 0:
@@ -223,13 +487,15 @@ def _jagged_parameter_lines(circuit: Circuit) -> list[str]:
         f"- Dense batch size: {dense_pcs.batch_size}",
         f"- Batching: {batching}",
     ])
+    if dense_pcs.commitment_groups is not None:
+        lines.append(f"- Commitment groups: {dense_pcs.get_commitment_groups_label()}")
     return lines
 
 
 def _whir_parameter_lines(circuit: Circuit) -> list[str]:
     pcs = circuit.pcs
     batching = "Powers" if pcs.power_batching else "Affine"
-    return [
+    lines = [
         f"- Polynomial commitment scheme: WHIR",
         f"- Hash size (bits): {pcs.hash_size_bits}",
         f"- Field: {_field_label(pcs.field)}",
@@ -242,6 +508,33 @@ def _whir_parameter_lines(circuit: Circuit) -> list[str]:
         f"- OOD samples per iteration: {pcs.num_ood_samples}",
         f"- Total grinding overhead log2: {pcs.log_grinding_overhead}",
     ]
+    if pcs.merkle_arity != 2:
+        lines.append(f"- Merkle tree arity: {pcs.merkle_arity}")
+    if pcs.merkle_cap_height != 0:
+        lines.append(f"- Merkle cap height: {pcs.merkle_cap_height}")
+    return lines
+
+
+def _stir_parameter_lines(circuit: Circuit) -> list[str]:
+    pcs = circuit.pcs
+    batching = "Powers" if pcs.power_batching else "Affine"
+    lines = [
+        f"- Polynomial commitment scheme: STIR",
+        f"- Hash size (bits): {pcs.hash_size_bits}",
+        f"- Field: {_field_label(pcs.field)}",
+        f"- Iterations (M): {pcs.num_iterations}",
+        f"- Folding factor (log k): {pcs.folding_factor}",
+        f"- Log inverse rates: {pcs.log_inv_rates}",
+        f"- Batch size: {pcs.batch_size}",
+        f"- Batching: {batching}",
+        f"- Queries per iteration: {pcs.num_queries}",
+        f"- OOD samples per iteration: {pcs.num_ood_samples}",
+    ]
+    if pcs.merkle_arity != 2:
+        lines.append(f"- Merkle tree arity: {pcs.merkle_arity}")
+    if pcs.merkle_cap_height != 0:
+        lines.append(f"- Merkle cap height: {pcs.merkle_cap_height}")
+    return lines
 
 
 def _generic_parameter_lines(circuit: Circuit) -> list[str]:
@@ -269,6 +562,8 @@ def _get_parameter_lines(circuit: Circuit) -> list[str]:
         lines = _fri_parameter_lines(circuit)
     elif isinstance(circuit.pcs, WHIR):
         lines = _whir_parameter_lines(circuit)
+    elif isinstance(circuit.pcs, STIR):
+        lines = _stir_parameter_lines(circuit)
     elif isinstance(circuit.pcs, JaggedPCS):
         lines = _jagged_parameter_lines(circuit)
     else:
@@ -366,7 +661,8 @@ def _build_security_table(results: dict[str, Any], lookup_names: list[str] | Non
     return md_table
 
 
-def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False) -> str:
+def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False,
+                       profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> str:
     """
     Build a markdown report for a single zkVM.
 
@@ -374,6 +670,7 @@ def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False) -> str:
         zkvm: The zkVM to generate a report for
         multi_circuit: If True, inline all circuits separately with their names.
                       If False, only report on the first circuit.
+        profile: The throughput profile used for prover time estimates
     """
     lines: list[str] = []
     zkvm_name = zkvm.get_name()
@@ -386,13 +683,14 @@ def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False) -> str:
     lines.append("- Table columns correspond to proof system components")
     lines.append("- Cells show bits of security per component")
     lines.append("- Proof size estimates are indicative (1 KiB = 1024 bytes)")
+    lines.append(f"- Prover time estimates are indicative (single core, {profile.name} throughput profile)")
     lines.append("")
 
     circuits = zkvm.get_circuits()
 
     if multi_circuit and len(circuits) > 1:
         # Multi-circuit mode: add overview and inline all circuits
-        overview = _compute_overview_stats(circuits)
+        overview = _compute_overview_stats(circuits, profile, zkvm.get_final_circuit())
 
         if overview:
             lines.append("## zkVM Overview")
@@ -405,8 +703,19 @@ def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False) -> str:
             lines.append(f"| --- | --- | --- | --- |")
             lines.append(f"| Final proof size (worst case) | **{int(overview['final_proof_size_kib'])} KiB** | {final_circuit_link} | |")
             lines.append(f"| Final bits of security | **{overview['min_security_bits']} bits** | {offending_circuit_link} | Regime: {overview['best_regime']} |")
+            lines.append(f"| Total prover time | **{_format_seconds(overview['total_prover_seconds'])}** | | One proof per circuit |")
+            lines.append(
+                f"| Total grinding work | **{_format_hashes(zkvm.get_grinding_work())} hashes** | "
+                f"| {_format_seconds(zkvm.get_grinding_seconds(profile))}, one proof per circuit |"
+            )
+            memory_circuit = overview['peak_memory_circuit']
+            memory_circuit_link = f"[{memory_circuit}](#{memory_circuit.lower().replace(' ', '-')})"
+            lines.append(f"| Peak prover memory | **{_format_memory(overview['peak_memory_bits'])}** | {memory_circuit_link} | |")
             lines.append("")
 
+        if zkvm.pipeline is not None:
+            lines.extend(_build_pipeline_section(zkvm.pipeline, profile, zkvm.verifier_circuit_model))
+
         lines.append("## Circuits")
         lines.append("")
         for circuit in circuits:
@@ -427,12 +736,41 @@ def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False) -> str:
             worst_kib = int(circuit.get_proof_size_bits() // KIB)
             lines.append(f"**Proof Size:** {expected_kib} KiB (expected) / {worst_kib} KiB (worst case)")
             lines.append("")
+            lines.extend(_proof_size_breakdown_lines(circuit))
+            lines.append("")
+
+            # Prover time
+            lines.append(_prover_time_line(circuit, profile))
+            lines.append("")
+
+            # Prover memory
+            lines.append(_prover_memory_line(circuit))
+            lines.append("")
+
+            # Verifier cost
+            lines.append(_verifier_cost_line(circuit))
+            lines.append("")
 
             # Security table
             security_levels = circuit.get_security_levels()
             lookup_names = [lookup.get_name() for lookup in circuit.get_lookups()]
             lines.append(_build_security_table(security_levels, lookup_names))
             lines.append("")
+            lines.append(_grinding_line(circuit, profile))
+            lines.append("")
+            if "JBR" in circuit.get_regime_ids():
+                lines.append(_gap_optimization_line(circuit))
+                lines.append("")
+            lines.append(_extension_degree_line(circuit))
+            lines.append("")
+            conjecture_line = _conjecture_savings_line(circuit)
+            if conjecture_line:
+                lines.append(conjecture_line)
+                lines.append("")
+            rate_advisor_lines = _rate_advisor_lines(circuit)
+            if rate_advisor_lines:
+                lines.extend(rate_advisor_lines)
+                lines.append("")
     else:
         # Single circuit mode
         circuit = circuits[0] if circuits else None
@@ -447,11 +785,40 @@ def _build_zkvm_report(zkvm: zkVM, multi_circuit: bool = False) -> str:
             worst_kib = int(circuit.get_proof_size_bits() // KIB)
             lines.append(f"**Proof Size:** {expected_kib} KiB (expected) / {worst_kib} KiB (worst case)")
             lines.append("")
+            lines.extend(_proof_size_breakdown_lines(circuit))
+            lines.append("")
+
+            # Prover time
+            lines.append(_prover_time_line(circuit, profile))
+            lines.append("")
+
+            # Prover memory
+            lines.append(_prover_memory_line(circuit))
+            lines.append("")
+
+            # Verifier cost
+            lines.append(_verifier_cost_line(circuit))
+            lines.append("")
 
             # Security table
             security_levels = circuit.get_security_levels()
             lookup_names = [lookup.get_name() for lookup in circuit.get_lookups()]
             lines.append(_build_security_table(security_levels, lookup_names))
+            lines.append("")
+            lines.append(_grinding_line(circuit, profile))
+            if "JBR" in circuit.get_regime_ids():
+                lines.append("")
+                lines.append(_gap_optimization_line(circuit))
+            lines.append("")
+            lines.append(_extension_degree_line(circuit))
+            conjecture_line = _conjecture_savings_line(circuit)
+            if conjecture_line:
+                lines.append("")
+                lines.append(conjecture_line)
+            rate_advisor_lines = _rate_advisor_lines(circuit)
+            if rate_advisor_lines:
+                lines.append("")
+                lines.extend(rate_advisor_lines)
         else:
             lines.append("No circuits available.")
 
@@ -477,8 +844,8 @@ def _build_summary_report(zkvms: list[zkVM]) -> str:
         "",
         "## Overview",
         "",
-        "| zkVM | Version | Security | Proof Size | PCS | Field | Circuits | Weakest Circuit |",
-        "|------|---------|----------|------------|-----|-------|----------|-----------------|",
+        "| zkVM | Version | Security | Proof Size | Prover Memory | Conjectured Savings | PCS | Field | Circuits | Weakest Circuit |",
+        "|------|---------|----------|------------|---------------|---------------------|-----|-------|----------|-----------------|",
     ]
 
     summaries = sorted(
@@ -494,6 +861,8 @@ def _build_summary_report(zkvms: list[zkVM]) -> str:
             f"| {version_str} "
             f"| **{s.security_bits}** bits ({s.security_regime}) "
             f"| {s.final_proof_size_kib} KiB "
+            f"| {_format_memory(s.peak_prover_memory_bits)} "
+            f"| {s.conjecture_savings} "
             f"| {s.pcs} | {s.field} | {s.num_circuits} | {s.weakest_circuit_name} |"
         )
 
@@ -504,15 +873,19 @@ def _build_summary_report(zkvms: list[zkVM]) -> str:
         "- **Security**: Best bits of security across UDR (Unique Decoding) and JBR (Johnson Bound) regimes",
         "- **Weakest Circuit**: Circuit determining the overall security level",
         "- **Proof Size**: Final proof size in KiB (1 KiB = 1024 bytes)",
+        "- **Prover Memory**: Largest estimated peak prover memory across all circuits",
+        "- **Conjectured Savings**: Queries and proof size (expected) the final circuit would save at the same security, "
+        "if proximity gaps held up to capacity (unproven, see the individual reports)",
         "",
     ])
 
     return "\n".join(lines)
 
 
-def generate_and_save_reports(zkvms: list[zkVM]) -> None:
+def generate_and_save_reports(zkvms: list[zkVM], profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> None:
     """
     Generate markdown reports for each zkVM and save to reports/ directory.
+    Prover time estimates use the given throughput profile.
     """
     os.makedirs(REPORTS_DIR, exist_ok=True)
 
@@ -521,7 +894,7 @@ def generate_and_save_reports(zkvms: list[zkVM]) -> None:
         # ZisK gets multi-circuit mode (all circuits inlined)
         multi_circuit = len(zkvm.get_circuits()) > 1
 
-        md = _build_zkvm_report(zkvm, multi_circuit=multi_circuit)
+        md = _build_zkvm_report(zkvm, multi_circuit=multi_circuit, profile=profile)
         filename = f"{zkvm_name.lower().replace(' ', '_')}.md"
         md_path = os.path.join(REPORTS_DIR, filename)
 
@@ -0,0 +1,79 @@
+"""
+Adaptive sweep of a security threshold over two parameters of a circuit.
+
+Traces where the total security of a circuit crosses a target (see
+`soundcalc.zkvms.contour_sweep`), refining only near the threshold, e.g.:
+
+    python -m soundcalc.sweep --zkvm ZisK --x num_queries=1:256 --y log_inv_rate=1:8 --target 100
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from soundcalc.main import load_zkvm
+from soundcalc.zkvms.contour_sweep import SweepAxis, get_sweep_axis, trace_security_contour
+
+
+def parse_axis(spec: str) -> SweepAxis:
+    """
+    Parse an axis given as "<name>=<lo>:<hi>[:<step>]" (inclusive) or "<name>=<v1>,<v2>,...".
+    The name is "log_inv_rate" or a field of the PCS config (e.g. "num_queries").
+    """
+    name, sep, values_spec = spec.partition("=")
+    if not sep:
+        raise ValueError(f"Axis must be given as <name>=<values>: {spec}")
+    if ":" in values_spec:
+        lo, hi, *step = (int(v) for v in values_spec.split(":"))
+        values = list(range(lo, hi + 1, step[0] if step else 1))
+    else:
+        values = [int(v) for v in values_spec.split(",")]
+    return get_sweep_axis(name, values)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="soundcalc - Trace where the security of a circuit crosses a target over two parameters"
+    )
+    parser.add_argument("--zkvm", required=True, help="Name of the zkVM (e.g., ZisK)")
+    parser.add_argument("--circuit", default=None, help="Name of the circuit (defaults to the final circuit)")
+    parser.add_argument("--x", required=True, help="First axis, e.g. num_queries=1:256")
+    parser.add_argument("--y", required=True, help="Second axis, e.g. log_inv_rate=1:8")
+    parser.add_argument("--target", type=int, required=True, help="Target bits of total security")
+    parser.add_argument("--regime", default=None, help="Regime (defaults to the reference regime of the circuit)")
+    parser.add_argument("--coarse-points", type=int, default=9, help="Points per axis of the initial coarse grid")
+    args = parser.parse_args()
+
+    # Only load the requested zkVM, so that nothing but the CSV is printed to stdout
+    try:
+        zkvm = load_zkvm(args.zkvm)
+    except ValueError as e:
+        parser.error(str(e))
+    except KeyError as e:
+        parser.error(f"Incomplete configuration for zkVM '{args.zkvm}': missing '{e.args[0]}'")
+    if args.circuit is None:
+        circuit = zkvm.get_final_circuit()
+    else:
+        circuits = {circuit.get_name(): circuit for circuit in zkvm.get_circuits()}
+        if args.circuit not in circuits:
+            parser.error(f"Unknown circuit '{args.circuit}', available: {', '.join(circuits)}")
+        circuit = circuits[args.circuit]
+    if args.regime is not None and args.regime not in circuit.get_regime_ids():
+        parser.error(f"Unknown regime '{args.regime}' for {circuit.get_name()}, available: {', '.join(circuit.get_regime_ids())}")
+
+    sweep = trace_security_contour(
+        circuit, parse_axis(args.x), parse_axis(args.y), args.target, args.regime, args.coarse_points
+    )
+
+    print(f"{zkvm.get_name()} / {circuit.get_name()}: {args.target} bits ({sweep.regime})")
+    print(f"{sweep.get_num_evaluations()} evaluations "
+          f"({100 * sweep.get_evaluation_fraction():.1f}% of the {len(sweep.x_axis.values)} x {len(sweep.y_axis.values)} grid)")
+    print()
+    print(f"{sweep.x_axis.name},{sweep.y_axis.name},bits")
+    for x, y in sweep.get_contour():
+        i, j = sweep.x_axis.values.index(x), sweep.y_axis.values.index(y)
+        print(f"{x},{y},{sweep.bits[(i, j)]}")
+
+
+if __name__ == "__main__":
+    main()
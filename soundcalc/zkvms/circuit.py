@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from math import ceil, log2
+from math import log2
+from soundcalc.common import elementwise
 from soundcalc.common.fields import FieldParams
-from soundcalc.common.utils import apply_grinding, get_bits_of_security_from_error
-from soundcalc.lookups.logup import LogUp
+from soundcalc.common.utils import apply_grinding, get_bits_of_security_from_log_error, get_grinding_work
+from soundcalc.costs.prover import ProverCost, ProverMemory
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
+from soundcalc.costs.verifier import VerifierCost
+from soundcalc.lookups.logup import LogUp, get_soundness_bits_for_lookups
 from soundcalc.pcs.pcs import PCS
-from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
 from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
-from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
+from soundcalc.proxgaps.regimes import DEFAULT_REGIMES, parse_regime
 
 
 @dataclass
@@ -32,6 +35,91 @@ class CircuitConfig:
     udr_only: bool = False
     # Proof of Work grinding during DEEP (expressed in bits of security)
     grinding_deep: int = 0
+    # Regimes to analyze (see `parse_regime`), by default UDR and JBR.
+    # UDR-only circuits are only analyzed in UDR.
+    regimes: list[str] | None = None
+    # Name of the hash of the Merkle trees (e.g. "sha256"), used to look up its throughput.
+    # If not set, the default hash rate of the throughput profile is used.
+    hash_name: str | None = None
+
+
+@dataclass(frozen=True)
+class _DEEPALIInputs:
+    """
+    The regime-independent parts of the DEEP-ALI errors (as log2 values), shared across regimes.
+    The errors are L_plus times these terms.
+    """
+    trace_length: int
+    rate: float
+    D: float
+    log_ALI_term: float
+    log_DEEP_term: float
+
+
+def get_DEEP_ALI_inputs(field: FieldParams, trace_length: int, rate: float, num_constraints: int,
+                        AIR_max_degree: int, max_combo: int) -> _DEEPALIInputs:
+    """
+    Compute the regime-independent inputs of the DEEP-ALI errors.
+
+    Like `get_DEEP_ALI_log_errors` and `get_zerocheck_log_error`, this works elementwise on arrays
+    of circuit parameters, e.g., to evaluate many circuits at once.
+    """
+    # Theorem 8 of https://eprint.iacr.org/2022/1216.pdf
+    # Note: These bounds are regime independent
+    # TODO: If linear batching is used, the num_constraints term in e_ALI should be removed
+    # TODO: L_plus computation depends on how the FRI batching is performed.
+    #       For instance, if I want to prove the evaluation of f(X) at both z and g·z, then I can
+    #       either run a LDT over functions g1(X) = (f(X) - f(z)) / (X - z) and g2(X) = (f(X) - f(g·z)) / (X - g·z)
+    #       or I can run a LDT over a single function h(X) = (f(X) - U(X)) / ((X - z)(X - g·z))
+    #       where U(X) is the unique degree < 2 interpolant through points (z, f(z)) and (g·z, f(g·z)).
+    #       Here it is assumed that the second approach is used.
+    field_size = field.F
+    D = trace_length / rate
+
+    # errors (as log2 values) are L_plus times these terms
+    log_ALI_term = elementwise.log2(num_constraints) - log2(field_size)
+    log_DEEP_term = (
+        elementwise.log2(AIR_max_degree * (trace_length + max_combo - 1) + (trace_length - 1))
+        - elementwise.log2(field_size - trace_length - D)
+    )
+    return _DEEPALIInputs(trace_length, rate, D, log_ALI_term, log_DEEP_term)
+
+
+def get_DEEP_ALI_log_errors(L_plus: float, regime: ProximityGapsRegime, inputs: _DEEPALIInputs,
+                            max_combo: int, grinding_deep: int) -> tuple[float, float]:
+    """
+    Returns the errors (as log2 values) of ALI and DEEP for the list size L_plus, after DEEP grinding.
+    """
+    trace_length, rate, D = inputs.trace_length, inputs.rate, inputs.D
+    theta = regime.get_proximity_parameter(rate, trace_length)
+    # Multi-point quotients (a.k.a. combo batching) are only sound when the evaluation domain
+    # has enough "slack" relative to the proximity window:
+    #   k + m_max < (1 - θ) · n
+    # We enforce this here because our DEEP-ALI bound uses multi-point quotients with parameter
+    # m_max; the paper states/derives this condition in its FRI multi-point-queries analysis
+    # Ref: https://eprint.iacr.org/archive/2022/1216/20241217:162441, Section 4.1.3 (multi-point queries).
+    assert elementwise.all_true(trace_length + max_combo < (1.0 - theta) * D), (
+        "Violates multi-point condition: k + m_max < (1-θ)·n. "
+        f"k={trace_length}, m_max={max_combo}, θ={theta}, n={D}, (1-θ)·n={(1.0 - theta) * D}."
+    )
+
+    # errors as log2 values
+    log_L_plus = elementwise.log2(L_plus)
+    e_ALI = log_L_plus + inputs.log_ALI_term
+    e_DEEP = log_L_plus + inputs.log_DEEP_term
+
+    # take into account any DEEP grinding
+    e_DEEP = apply_grinding(e_DEEP, grinding_deep)
+
+    return e_ALI, e_DEEP
+
+
+def get_zerocheck_log_error(field: FieldParams, trace_length: int, num_constraints: int, AIR_max_degree: int) -> float:
+    """
+    Returns the error (as log2 value) of a zerocheck done with a multilinear sumcheck.
+    """
+    log_height = elementwise.ceil(elementwise.log2(trace_length))
+    return elementwise.log2(num_constraints + (AIR_max_degree + 2) * log_height) - log2(field.F)
 
 
 class Circuit:
@@ -57,6 +145,15 @@ class Circuit:
         # Store optional lookups
         self._lookups = config.lookups or []
         self.grinding_deep = config.grinding_deep
+        self.hash_name = config.hash_name
+        # Parse the regimes once, they only depend on the field and the gap
+        regimes = ["UDR"] if self.udr_only else (config.regimes or DEFAULT_REGIMES)
+        self.regimes = [parse_regime(regime, self.field, self.gap_to_radius) for regime in regimes]
+        ids = self.get_regime_ids()
+        if len(set(ids)) != len(ids):
+            raise ValueError(f"Circuit '{self.name}': duplicate regimes {ids}")
+        # Keep the config around, so that variants of this circuit can be derived
+        self.config = config
 
     def get_name(self) -> str:
         """Returns the name of the circuit."""
@@ -110,7 +207,79 @@ class Circuit:
         """
         return self.pcs.get_expected_proof_size_bits()
 
-    def get_security_levels(self) -> dict[str, dict[str, int]]:
+    def get_proof_size_breakdown(self, expected: bool = False) -> dict[str, int]:
+        """
+        Returns the (worst case or expected) proof size in bits, per component.
+        """
+        return self.pcs.get_proof_size_breakdown(expected)
+
+    def _get_circuit_grinding_bits(self) -> list[int]:
+        """Returns the bits of the grinding steps on top of the PCS: DEEP and every lookup."""
+        return [self.grinding_deep] + [lookup.config.grinding_bits_lookup for lookup in self._lookups]
+
+    def get_grinding_bits(self) -> list[int]:
+        """
+        Returns the bits of every proof-of-work grinding step of one proof of this circuit
+        (0 if a step does not grind): those of the PCS, DEEP, and every lookup.
+        """
+        return self.pcs.get_grinding_bits() + self._get_circuit_grinding_bits()
+
+    def get_grinding_work(self) -> float:
+        """
+        Returns the expected number of proof-of-work hashes for one proof of this circuit.
+        """
+        return get_grinding_work(self.get_grinding_bits())
+
+    def get_grinding_seconds(self, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> float:
+        """
+        Returns the expected time in seconds the prover spends grinding for one proof of this circuit,
+        at the proof-of-work hash rate of the profile.
+        """
+        return profile.grinding_hashes_to_seconds(self.get_grinding_work(), self.hash_name)
+
+    def get_prover_cost(self) -> ProverCost:
+        """
+        Returns an estimate of the prover's work for one proof of this circuit.
+        """
+        grinding_hashes = get_grinding_work(self._get_circuit_grinding_bits())
+        return self.pcs.get_prover_cost() + ProverCost(grinding_hashes=grinding_hashes)
+
+    def get_prover_seconds(self, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> float:
+        """
+        Returns an estimate of the single-core prover time in seconds for one proof of this circuit.
+        """
+        return self.get_prover_cost().get_seconds(self.field, profile, self.hash_name)
+
+    def get_prover_memory(self) -> ProverMemory:
+        """
+        Returns an estimate of the prover's peak memory for one proof of this circuit.
+        """
+        return self.pcs.get_prover_memory()
+
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        """
+        Returns an estimate of the verifier's work for one proof of this circuit.
+
+        On top of the PCS, the verifier evaluates all AIR constraints at the DEEP point (ALI).
+        """
+        cost = self.pcs.get_verifier_cost(expected)
+        if self._has_deep_ali_params():
+            cost = cost + VerifierCost(ext_field_mults=self.num_constraints * self.AIR_max_degree)
+        return cost
+
+    def get_regime_ids(self, proven_only: bool = False) -> list[str]:
+        """Returns the identifiers of the analyzed regimes (only the proven ones, if `proven_only`)."""
+        return [regime.identifier() for regime in self.regimes if regime.is_proven() or not proven_only]
+
+    def get_reference_regime(self) -> str:
+        """
+        Returns the regime that targets (e.g., of the rate advisor) refer to by default:
+        JBR if analyzed, else UDR if analyzed, else the first analyzed regime.
+        """
+        ids = self.get_regime_ids()
+        return next((id for id in ["JBR", "UDR"] if id in ids), ids[0])
+
+    def get_security_levels(self, proven_only: bool = False) -> dict[str, dict[str, int]]:
         """
         Returns a dictionary that maps each regime (i.e., a way of doing security analysis)
         to a dictionary that contains the round-by-round soundness levels.
@@ -121,94 +290,91 @@ class Circuit:
         It maps from a label that explains which round it is for to an integer.
         If this integer is, say, k, then it means the error for this round is at
         most 2^{-k}.
+
+        The regimes are those of the config (only the proven ones, if `proven_only`).
+        Regime-independent inputs are computed once and shared across all regimes.
         """
-        regimes = [
-            UniqueDecodingRegime(self.field),
-        ]
-        if self.udr_only == False:
-            regimes.append(JohnsonBoundRegime(self.field, gap_to_radius=self.gap_to_radius))
+        regimes = [regime for regime in self.regimes if regime.is_proven() or not proven_only]
+
+        # Lookup soundness and the DEEP-ALI inputs do not depend on the regime
+        lookup_levels = self._get_lookup_levels()
+        deep_ali_inputs = self._get_DEEP_ALI_inputs()
 
         result = {}
         for regime in regimes:
-            id = regime.identifier()
-            pcs_levels = self.pcs.get_pcs_security_levels(regime)
-
-            # Add DEEP-ALI errors if circuit params are provided
-            if self._has_deep_ali_params():
-                rate = self.pcs.get_rate()
-                dimension = self.pcs.get_dimension()
-                list_size = regime.get_max_list_size(rate, dimension)
-                deep_ali_levels = self._get_DEEP_ALI_errors(list_size,regime)
-                all_levels = pcs_levels | deep_ali_levels
-            # A dirty heuristic for now, add zerocheck error only for unique decoding regime.
-            elif self.multilinear_zerocheck and self.udr_only:
-                zerocheck_levels = {}
-                log_height = ceil(log2(self.pcs.get_trace_length()))
-                zerocheck_error = (self.num_constraints + (self.AIR_max_degree + 2) * log_height) / self.field.F
-                zerocheck_levels["zerocheck"] = get_bits_of_security_from_error(zerocheck_error)
-                all_levels = pcs_levels | zerocheck_levels
-            else:
-                all_levels = pcs_levels
-
-            # Add lookup security levels
-            for lookup in self._lookups:
-                all_levels[lookup.get_name()] = lookup.get_soundness_bits()
-
-            all_levels["total"] = min(all_levels.values())
-            result[id] = all_levels
+            result[regime.identifier()] = self._get_regime_security_levels(regime, lookup_levels, deep_ali_inputs)
 
         return result
 
+    def get_regime_security_levels(self, regime: ProximityGapsRegime) -> dict[str, int]:
+        """
+        Returns the round-by-round soundness levels (and the total) of the circuit in the given
+        regime, which need not be one of the regimes analyzed by `get_security_levels`.
+        """
+        return self._get_regime_security_levels(regime, self._get_lookup_levels(), self._get_DEEP_ALI_inputs())
+
+    def _get_lookup_levels(self) -> dict[str, int]:
+        return {
+            lookup.get_name(): bits
+            for lookup, bits in zip(self._lookups, get_soundness_bits_for_lookups(self._lookups))
+        }
+
+    def _get_regime_security_levels(self, regime: ProximityGapsRegime, lookup_levels: dict[str, int],
+                                    deep_ali_inputs: _DEEPALIInputs | None) -> dict[str, int]:
+        pcs_levels = self.pcs.get_pcs_security_levels(regime)
+
+        # Add DEEP-ALI errors if circuit params are provided
+        if deep_ali_inputs is not None:
+            list_size = regime.get_max_list_size(deep_ali_inputs.rate, deep_ali_inputs.trace_length)
+            deep_ali_levels = self._get_DEEP_ALI_errors(list_size, regime, deep_ali_inputs)
+            all_levels = pcs_levels | deep_ali_levels
+        # A dirty heuristic for now, add zerocheck error only for unique decoding regime.
+        elif self.multilinear_zerocheck and self.udr_only:
+            zerocheck_levels = {}
+            zerocheck_error = get_zerocheck_log_error(self.field, self.pcs.get_trace_length(), self.num_constraints, self.AIR_max_degree)
+            zerocheck_levels["zerocheck"] = get_bits_of_security_from_log_error(zerocheck_error)
+            all_levels = pcs_levels | zerocheck_levels
+        else:
+            all_levels = pcs_levels
+
+        # Add lookup security levels
+        all_levels = all_levels | lookup_levels
+
+        all_levels["total"] = min(all_levels.values())
+        return all_levels
+
     def _has_deep_ali_params(self) -> bool:
         """Should we report DEEP-ALI soundness?"""
         # A dirty heuristic for now
         return self.num_constraints is not None and self.multilinear_zerocheck == False
 
-    def _get_DEEP_ALI_errors(self, L_plus: float, regime: ProximityGapsRegime) -> dict[str, int]:
+    def _get_DEEP_ALI_inputs(self) -> _DEEPALIInputs | None:
+        """
+        Compute the regime-independent inputs of the DEEP-ALI errors, or None if the
+        circuit params for DEEP-ALI are not provided.
+        """
+        if not self._has_deep_ali_params():
+            return None
+
+        return get_DEEP_ALI_inputs(self.field, self.pcs.get_dimension(), self.pcs.get_rate(),
+                                   self.num_constraints, self.AIR_max_degree, self.max_combo)
+
+    def _get_DEEP_ALI_errors(self, L_plus: float, regime: ProximityGapsRegime,
+                             inputs: _DEEPALIInputs | None = None) -> dict[str, int]:
         """
         Compute common proof system error components that are shared across regimes.
         Some of them depend on the list size L_plus
 
+        The regime-independent inputs are computed if not given, see `_get_DEEP_ALI_inputs`.
+
         Returns a dictionary containing levels for ALI and DEEP
         """
-
-        # Theorem 8 of https://eprint.iacr.org/2022/1216.pdf
-        # Note: These bounds are regime independent
-        # TODO: If linear batching is used, the num_constraints term in e_ALI should be removed
-        # TODO: L_plus computation depends on how the FRI batching is performed.
-        #       For instance, if I want to prove the evaluation of f(X) at both z and g·z, then I can
-        #       either run a LDT over functions g1(X) = (f(X) - f(z)) / (X - z) and g2(X) = (f(X) - f(g·z)) / (X - g·z)
-        #       or I can run a LDT over a single function h(X) = (f(X) - U(X)) / ((X - z)(X - g·z))
-        #       where U(X) is the unique degree < 2 interpolant through points (z, f(z)) and (g·z, f(g·z)).
-        #       Here it is assumed that the second approach is used.
-        field_size = self.field.F
-        trace_length = self.pcs.get_dimension()
-        rate = self.pcs.get_rate()
-        D = trace_length / rate
-        theta = regime.get_proximity_parameter(rate, trace_length)
-        # Multi-point quotients (a.k.a. combo batching) are only sound when the evaluation domain
-        # has enough "slack" relative to the proximity window:
-        #   k + m_max < (1 - θ) · n
-        # We enforce this here because our DEEP-ALI bound uses multi-point quotients with parameter
-        # m_max; the paper states/derives this condition in its FRI multi-point-queries analysis
-        # Ref: https://eprint.iacr.org/archive/2022/1216/20241217:162441, Section 4.1.3 (multi-point queries).
-        assert trace_length + self.max_combo < (1.0 - theta) * D, (
-            "Violates multi-point condition: k + m_max < (1-θ)·n. "
-            f"k={trace_length}, m_max={self.max_combo}, θ={theta}, n={D}, (1-θ)·n={(1.0 - theta) * D}."
-        )
-
-        e_ALI = L_plus * self.num_constraints / field_size
-        e_DEEP = (
-            L_plus
-            * (self.AIR_max_degree * (trace_length + self.max_combo - 1) + (trace_length - 1))
-            / (field_size - trace_length - D)
-        )
-
-        # take into account any DEEP grinding
-        e_DEEP = apply_grinding(e_DEEP, self.grinding_deep)
+        if inputs is None:
+            inputs = self._get_DEEP_ALI_inputs()
+        e_ALI, e_DEEP = get_DEEP_ALI_log_errors(L_plus, regime, inputs, self.max_combo, self.grinding_deep)
 
         levels = {}
-        levels["ALI"] = get_bits_of_security_from_error(e_ALI)
-        levels["DEEP"] = get_bits_of_security_from_error(e_DEEP)
+        levels["ALI"] = get_bits_of_security_from_log_error(e_ALI)
+        levels["DEEP"] = get_bits_of_security_from_log_error(e_DEEP)
 
         return levels
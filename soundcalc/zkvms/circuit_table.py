@@ -0,0 +1,495 @@
+"""
+Columnar (struct-of-arrays) representation of the circuits of a FRI-based zkVM.
+
+A `Circuit` holds a `FRI` object and a list of `LogUp` objects, each of which copies
+every config field into a per-object `__dict__`. For sweeps that build tens of thousands
+of circuits this dominates memory. A `CircuitTable` instead stores one compact array per
+field, and only materializes `Circuit` objects on demand.
+
+Proof sizes, lookup soundness and (with NumPy) security levels run directly on the columns.
+Security levels use the same FRI, DEEP-ALI and regime formulas as `FRI` and `Circuit`, which
+work elementwise on arrays, so that the formulas still live in one place.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+from array import array
+from dataclasses import dataclass, field as dataclass_field
+from typing import Iterator
+
+from soundcalc.common.fields import FieldParams, parse_field
+from soundcalc.common.utils import get_bits_of_security_from_log_error
+from soundcalc.lookups.logup import LogUp, LogUpConfig, LogUpType, get_soundness_bits_batch
+from soundcalc.pcs.fri import FRI, CommitmentGroup, FRIConfig, get_FRI_batching_log_error, get_FRI_commit_phase_log_error, get_FRI_proof_size_bits, get_FRI_query_phase_log_error
+from soundcalc.proxgaps.regimes import DEFAULT_REGIMES, parse_regime
+from soundcalc.zkvms.circuit import Circuit, CircuitConfig, get_DEEP_ALI_inputs, get_DEEP_ALI_log_errors, get_zerocheck_log_error
+
+# NumPy is optional: without it, security levels are computed one materialized circuit at a time
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+# Marker for optional integer columns (e.g. `num_constraints` for circuits without DEEP-ALI)
+_MISSING_INT = -1
+
+
+def _int_column() -> array:
+    return array("q")
+
+
+def _medium_int_column() -> array:
+    return array("i")
+
+
+def _small_int_column() -> array:
+    # Grinding bits, folding factors and degrees comfortably fit into 16 bits
+    return array("h")
+
+
+def _float_column() -> array:
+    return array("d")
+
+
+def _bool_column() -> array:
+    return array("b")
+
+
+@dataclass
+class CircuitTable:
+    """
+    Columnar storage for the circuits of a FRI-based zkVM.
+
+    Row i of every per-circuit column describes circuit i. Variable-length data
+    (folding factors, commitment groups and lookups) is stored flat, together with an offsets column:
+    the entries of circuit i live at positions offsets[i] .. offsets[i+1]-1.
+    """
+    field: FieldParams
+    hash_size_bits: int
+    merkle_arity: int = 2
+    merkle_cap_height: int | str = 0
+    regimes: list[str] | None = None
+    hash_name: str | None = None
+
+    # Per-circuit columns
+    names: list[str] = dataclass_field(default_factory=list)
+    rho: array = dataclass_field(default_factory=_float_column)
+    trace_length: array = dataclass_field(default_factory=_int_column)
+    batch_size: array = dataclass_field(default_factory=_medium_int_column)
+    power_batching: array = dataclass_field(default_factory=_bool_column)
+    multilinear_batching: array = dataclass_field(default_factory=_bool_column)
+    num_queries: array = dataclass_field(default_factory=_medium_int_column)
+    FRI_early_stop_degree: array = dataclass_field(default_factory=_int_column)
+    grinding_query_phase: array = dataclass_field(default_factory=_small_int_column)
+    grinding_commit_phase: array = dataclass_field(default_factory=_small_int_column)
+    grinding_batching_phase: array = dataclass_field(default_factory=_small_int_column)
+    grinding_deep: array = dataclass_field(default_factory=_small_int_column)
+    # NaN encodes "no override"
+    gap_to_radius: array = dataclass_field(default_factory=_float_column)
+    # _MISSING_INT encodes "not set"
+    num_constraints: array = dataclass_field(default_factory=_medium_int_column)
+    AIR_max_degree: array = dataclass_field(default_factory=_small_int_column)
+    max_combo: array = dataclass_field(default_factory=_small_int_column)
+    multilinear_zerocheck: array = dataclass_field(default_factory=_bool_column)
+    udr_only: array = dataclass_field(default_factory=_bool_column)
+
+    # Flattened FRI folding factors
+    folding_factors: array = dataclass_field(default_factory=_small_int_column)
+    folding_offsets: array = dataclass_field(default_factory=lambda: array("q", [0]))
+
+    # Flattened Merkle commitment groups (circuits without groups have no entries)
+    commitment_group_names: list[str] = dataclass_field(default_factory=list)
+    commitment_group_widths: array = dataclass_field(default_factory=_medium_int_column)
+    commitment_group_offsets: array = dataclass_field(default_factory=lambda: array("q", [0]))
+
+    # Lookup columns, one row per distinct lookup. Lookups repeat across circuits (e.g., every
+    # point of a sweep has the same lookups), so every distinct lookup is only stored once.
+    lookup_names: list[str] = dataclass_field(default_factory=list)
+    lookup_multivariate: array = dataclass_field(default_factory=_bool_column)
+    lookup_rows_T: array = dataclass_field(default_factory=_int_column)
+    lookup_rows_L: array = dataclass_field(default_factory=_int_column)
+    lookup_num_columns_S: array = dataclass_field(default_factory=_medium_int_column)
+    lookup_num_lookups_M: array = dataclass_field(default_factory=_medium_int_column)
+    # _MISSING_INT encodes "derive alphabet size from the table sizes"
+    lookup_alphabet_size_H: array = dataclass_field(default_factory=_int_column)
+    lookup_grinding_bits: array = dataclass_field(default_factory=_small_int_column)
+    lookup_multilinear_fingerprint: array = dataclass_field(default_factory=_bool_column)
+    lookup_reduction_error: array = dataclass_field(default_factory=_float_column)
+    # Flattened lookups of every circuit, as rows of the lookup columns
+    lookup_ids: array = dataclass_field(default_factory=_medium_int_column)
+    lookup_offsets: array = dataclass_field(default_factory=lambda: array("q", [0]))
+    # Maps the parameters of every distinct lookup to its row of the lookup columns
+    _lookup_rows: dict[tuple, int] = dataclass_field(default_factory=dict, repr=False, compare=False)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def from_toml_config(cls, config: dict) -> "CircuitTable":
+        """
+        Fill a table directly from a parsed FRI_STARK TOML config dict,
+        without building intermediate `Circuit` objects.
+        """
+        protocol_family = config["zkevm"]["protocol_family"]
+        if protocol_family != "FRI_STARK":
+            raise ValueError(f"CircuitTable only supports FRI_STARK configs, got: {protocol_family}")
+
+        table = cls(
+            field=parse_field(config["zkevm"]["field"]),
+            hash_size_bits=config["zkevm"]["hash_size_bits"],
+            merkle_arity=config["zkevm"].get("merkle_arity", 2),
+            merkle_cap_height=config["zkevm"].get("merkle_cap_height", 0),
+            regimes=config["zkevm"].get("regimes"),
+            hash_name=config["zkevm"].get("hash"),
+        )
+        for section in config.get("circuits", []):
+            table.append_section(section)
+        return table
+
+    def append_section(self, section: dict) -> None:
+        """
+        Append one `[[circuits]]` TOML section as a new row.
+        Uses the same keys and defaults as `zkVM._load_fri_from_toml`.
+        """
+        gap_to_radius = section.get("gap_to_radius")
+
+        self.names.append(section["name"])
+        self.rho.append(section["rho"])
+        self.trace_length.append(section["trace_length"])
+        self.batch_size.append(section["batch_size"])
+        self.power_batching.append(section["power_batching"])
+        self.multilinear_batching.append(section.get("multilinear_batching", False))
+        self.num_queries.append(section["num_queries"])
+        self.FRI_early_stop_degree.append(section["fri_early_stop_degree"])
+        self.grinding_query_phase.append(section.get("grinding_query_phase", 0))
+        self.grinding_commit_phase.append(section.get("grinding_commit_phase", 0))
+        self.grinding_batching_phase.append(section.get("grinding_batching_phase", 0))
+        self.grinding_deep.append(section.get("grinding_deep", 0))
+        self.gap_to_radius.append(math.nan if gap_to_radius is None else gap_to_radius)
+        self.num_constraints.append(section["num_constraints"])
+        self.AIR_max_degree.append(section["air_max_degree"])
+        self.max_combo.append(section["opening_points"])
+        self.multilinear_zerocheck.append(section.get("multilinear_zerocheck", False))
+        self.udr_only.append(section.get("udr_only", False))
+
+        self.folding_factors.extend(section["fri_folding_factors"])
+        self.folding_offsets.append(len(self.folding_factors))
+
+        group_sections = section.get("commitment_groups", [])
+        total_width = sum(group_section["width"] for group_section in group_sections)
+        if group_sections and total_width != section["batch_size"]:
+            raise ValueError(
+                f"Commitment group widths add up to {total_width}, but batch_size is {section['batch_size']}"
+            )
+        for group_section in group_sections:
+            self.commitment_group_names.append(sys.intern(group_section["name"]))
+            self.commitment_group_widths.append(group_section["width"])
+        self.commitment_group_offsets.append(len(self.commitment_group_names))
+
+        for lookup_section in section.get("lookups", []):
+            alphabet_size_H = lookup_section.get("alphabet_size_H")
+            lookup = (
+                lookup_section["name"],
+                LogUpType(lookup_section.get("logup_type", "univariate")) == LogUpType.MULTIVARIATE,
+                lookup_section["rows_L"],
+                lookup_section["rows_T"],
+                lookup_section.get("num_columns_S", 1),
+                lookup_section.get("num_lookups_M", 1),
+                _MISSING_INT if alphabet_size_H is None else alphabet_size_H,
+                lookup_section.get("grinding_bits_lookup", 0),
+                lookup_section.get("multilinear_fingerprint", False),
+                lookup_section.get("reduction_error", 0.0),
+            )
+            self.lookup_ids.append(self._get_lookup_row(lookup))
+        self.lookup_offsets.append(len(self.lookup_ids))
+
+    def _get_lookup_row(self, lookup: tuple) -> int:
+        """Returns the row of the lookup columns with the given parameters, appending it if needed."""
+        row = self._lookup_rows.get(lookup)
+        if row is None:
+            row = len(self.lookup_names)
+            (name, multivariate, rows_L, rows_T, num_columns_S, num_lookups_M,
+             alphabet_size_H, grinding_bits, multilinear_fingerprint, reduction_error) = lookup
+            self.lookup_names.append(name)
+            self.lookup_multivariate.append(multivariate)
+            self.lookup_rows_L.append(rows_L)
+            self.lookup_rows_T.append(rows_T)
+            self.lookup_num_columns_S.append(num_columns_S)
+            self.lookup_num_lookups_M.append(num_lookups_M)
+            self.lookup_alphabet_size_H.append(alphabet_size_H)
+            self.lookup_grinding_bits.append(grinding_bits)
+            self.lookup_multilinear_fingerprint.append(multilinear_fingerprint)
+            self.lookup_reduction_error.append(reduction_error)
+            self._lookup_rows[lookup] = row
+        return row
+
+    def get_folding_factors(self, i: int) -> list[int]:
+        """Returns the FRI folding factors of circuit i."""
+        return self.folding_factors[self.folding_offsets[i]:self.folding_offsets[i + 1]].tolist()
+
+    def get_commitment_groups(self, i: int) -> list[CommitmentGroup] | None:
+        """Returns the Merkle commitment groups of circuit i (None for a single tree)."""
+        start, end = self.commitment_group_offsets[i], self.commitment_group_offsets[i + 1]
+        if start == end:
+            return None
+        return [
+            CommitmentGroup(name=self.commitment_group_names[j], width=self.commitment_group_widths[j])
+            for j in range(start, end)
+        ]
+
+    def get_lookup_configs(self, i: int) -> list[LogUpConfig]:
+        """Returns the LogUp configs of circuit i."""
+        configs = []
+        for j in self.lookup_ids[self.lookup_offsets[i]:self.lookup_offsets[i + 1]]:
+            alphabet_size_H = self.lookup_alphabet_size_H[j]
+            configs.append(LogUpConfig(
+                name=self.lookup_names[j],
+                field=self.field,
+                logup_type=LogUpType.MULTIVARIATE if self.lookup_multivariate[j] else LogUpType.UNIVARIATE,
+                rows_L=self.lookup_rows_L[j],
+                rows_T=self.lookup_rows_T[j],
+                num_columns_S=self.lookup_num_columns_S[j],
+                num_lookups_M=self.lookup_num_lookups_M[j],
+                alphabet_size_H=None if alphabet_size_H == _MISSING_INT else alphabet_size_H,
+                grinding_bits_lookup=self.lookup_grinding_bits[j],
+                multilinear_fingerprint=bool(self.lookup_multilinear_fingerprint[j]),
+                reduction_error=self.lookup_reduction_error[j],
+            ))
+        return configs
+
+    def get_fri_config(self, i: int) -> FRIConfig:
+        """Returns the FRI config of circuit i."""
+        gap_to_radius = self.gap_to_radius[i]
+        return FRIConfig(
+            hash_size_bits=self.hash_size_bits,
+            rho=self.rho[i],
+            gap_to_radius=None if math.isnan(gap_to_radius) else gap_to_radius,
+            trace_length=self.trace_length[i],
+            field=self.field,
+            batch_size=self.batch_size[i],
+            power_batching=bool(self.power_batching[i]),
+            multilinear_batching=bool(self.multilinear_batching[i]),
+            num_queries=self.num_queries[i],
+            FRI_folding_factors=self.get_folding_factors(i),
+            FRI_early_stop_degree=self.FRI_early_stop_degree[i],
+            grinding_query_phase=self.grinding_query_phase[i],
+            grinding_commit_phase=self.grinding_commit_phase[i],
+            grinding_batching_phase=self.grinding_batching_phase[i],
+            merkle_arity=self.merkle_arity,
+            merkle_cap_height=self.merkle_cap_height,
+            commitment_groups=self.get_commitment_groups(i),
+        )
+
+    def get_circuit(self, i: int) -> Circuit:
+        """
+        Materialize circuit i as a regular `Circuit` object.
+        """
+        gap_to_radius = self.gap_to_radius[i]
+        lookups = [LogUp(config) for config in self.get_lookup_configs(i)]
+        return Circuit(CircuitConfig(
+            name=self.names[i],
+            pcs=FRI(self.get_fri_config(i)),
+            field=self.field,
+            gap_to_radius=None if math.isnan(gap_to_radius) else gap_to_radius,
+            num_constraints=self._optional_int(self.num_constraints[i]),
+            AIR_max_degree=self._optional_int(self.AIR_max_degree[i]),
+            max_combo=self._optional_int(self.max_combo[i]),
+            lookups=lookups if lookups else None,
+            grinding_deep=self.grinding_deep[i],
+            multilinear_zerocheck=bool(self.multilinear_zerocheck[i]),
+            udr_only=bool(self.udr_only[i]),
+            regimes=self.regimes,
+            hash_name=self.hash_name,
+        ))
+
+    def iter_circuits(self) -> Iterator[Circuit]:
+        """
+        Yields the circuits one at a time. Each circuit can be garbage collected
+        as soon as the caller is done with it.
+        """
+        for i in range(len(self)):
+            yield self.get_circuit(i)
+
+    def get_proof_size_bits(self, expected: bool = False) -> list[int]:
+        """
+        Returns the (worst case or expected) proof size of every circuit, in bits.
+
+        This runs directly on the columns, without materializing any objects.
+        """
+        field_size_bits = self.field.extension_field_element_size_bits()
+        sizes = []
+        for i in range(len(self)):
+            sizes.append(get_FRI_proof_size_bits(
+                hash_size_bits=self.hash_size_bits,
+                field_size_bits=field_size_bits,
+                batch_size=self.batch_size[i],
+                num_queries=self.num_queries[i],
+                domain_size=int(self.trace_length[i] / self.rho[i]),
+                folding_factors=self.get_folding_factors(i),
+                rate=self.rho[i],
+                expected=expected,
+                merkle_arity=self.merkle_arity,
+                merkle_cap_height=self.merkle_cap_height,
+                commitment_groups=self.get_commitment_groups(i),
+            ))
+        return sizes
+
+    def get_lookup_soundness_bits(self) -> list[dict[str, int]]:
+        """
+        Returns the LogUp soundness bits of every lookup, grouped per circuit.
+
+        All distinct lookups of the table are evaluated in one pass over the lookup columns.
+        """
+        bits = get_soundness_bits_batch(
+            field=self.field,
+            multivariate=self.lookup_multivariate,
+            rows_T=self.lookup_rows_T,
+            rows_L=self.lookup_rows_L,
+            num_columns_S=self.lookup_num_columns_S,
+            num_lookups_M=self.lookup_num_lookups_M,
+            alphabet_size_H=self.lookup_alphabet_size_H,
+            grinding_bits_lookup=self.lookup_grinding_bits,
+            multilinear_fingerprint=self.lookup_multilinear_fingerprint,
+            reduction_error=self.lookup_reduction_error,
+        )
+        return [
+            {self.lookup_names[j]: bits[j] for j in self.lookup_ids[self.lookup_offsets[i]:self.lookup_offsets[i + 1]]}
+            for i in range(len(self))
+        ]
+
+    def get_security_levels(self) -> list[dict[str, dict[str, int]]]:
+        """
+        Returns `Circuit.get_security_levels()` for every circuit.
+
+        With NumPy, this runs directly on the columns: the rows are grouped by the parameters that
+        select the regimes and formulas (gap, UDR-only, batching strategy, number of folding rounds,
+        DEEP-ALI or zerocheck), and every group is evaluated in one pass per regime. Without NumPy,
+        every row is materialized as a `Circuit` and evaluated on its own.
+        """
+        if np is None:
+            return [circuit.get_security_levels() for circuit in self.iter_circuits()]
+
+        lookup_levels = self.get_lookup_soundness_bits()
+        levels = [None] * len(self)
+        for key, rows in self._get_formula_groups().items():
+            rows = np.array(rows, dtype=np.int64)
+            for i, row_levels in zip(rows.tolist(), self._get_group_security_levels(key, rows)):
+                for regime_levels in row_levels.values():
+                    regime_levels.update(lookup_levels[i])
+                    regime_levels["total"] = min(regime_levels.values())
+                levels[i] = row_levels
+        return levels
+
+    def _get_formula_groups(self) -> dict[tuple, list[int]]:
+        """
+        Groups the rows by (gap_to_radius, udr_only, power_batching, multilinear_batching,
+        DEEP-ALI, multilinear_zerocheck, number of folding rounds).
+        """
+        groups = {}
+        keys = zip(
+            self.gap_to_radius, self.udr_only, self.power_batching, self.multilinear_batching,
+            self.num_constraints, self.multilinear_zerocheck, np.diff(self.folding_offsets).tolist(),
+        )
+        for i, (gap_to_radius, udr_only, power, multilinear, num_constraints, zerocheck, num_rounds) in enumerate(keys):
+            key = (
+                None if math.isnan(gap_to_radius) else gap_to_radius,
+                bool(udr_only),
+                bool(power),
+                bool(multilinear),
+                num_constraints != _MISSING_INT and not zerocheck,
+                bool(zerocheck),
+                num_rounds,
+            )
+            groups.setdefault(key, []).append(i)
+        return groups
+
+    def _get_group_security_levels(self, key: tuple, rows) -> list[dict[str, dict[str, int]]]:
+        """
+        Evaluates the PCS and DEEP-ALI (or zerocheck) levels of a group of rows (see `_get_formula_groups`),
+        as `Circuit._get_regime_security_levels` does for a single circuit, without lookups and total.
+        """
+        gap_to_radius, udr_only, power_batching, multilinear_batching, has_deep_ali, multilinear_zerocheck, num_rounds = key
+        # TODO: add zerocheck error outside of unique decoding regime
+        if multilinear_zerocheck:
+            assert udr_only
+
+        regime_strs = ["UDR"] if udr_only else (self.regimes or DEFAULT_REGIMES)
+        regimes = [parse_regime(regime, self.field, gap_to_radius) for regime in regime_strs]
+        ids = [regime.identifier() for regime in regimes]
+        if len(set(ids)) != len(ids):
+            raise ValueError(f"Circuit '{self.names[rows[0]]}': duplicate regimes {ids}")
+
+        # Floats, so that the field size (which may exceed 64 bits) broadcasts against them
+        rate = np.asarray(self.rho)[rows]
+        trace_length = np.asarray(self.trace_length, dtype=np.float64)[rows]
+        batch_size = np.asarray(self.batch_size, dtype=np.int64)[rows]
+        num_queries = np.asarray(self.num_queries, dtype=np.int64)[rows]
+        grinding_batching = np.asarray(self.grinding_batching_phase, dtype=np.int64)[rows]
+        grinding_commit = np.asarray(self.grinding_commit_phase, dtype=np.int64)[rows]
+        grinding_query = np.asarray(self.grinding_query_phase, dtype=np.int64)[rows]
+
+        # Folding factors as a (rows x rounds) matrix, and the dimension of the code after each round
+        folding_positions = np.asarray(self.folding_offsets)[rows][:, None] + np.arange(num_rounds)
+        folding_factors = np.asarray(self.folding_factors, dtype=np.int64)[folding_positions]
+        acc_folding_factors = np.cumprod(folding_factors, axis=1)
+        commit_round_dimensions = trace_length[:, None] / acc_folding_factors
+
+        # Make sure that the early stop degree is correctly set (as `FRI._get_num_folding_rounds` does)
+        domain_size = (trace_length / rate).astype(np.int64)
+        final_size = domain_size // np.prod(folding_factors, axis=1)
+        early_stop_degree = np.asarray(self.FRI_early_stop_degree)[rows]
+        mismatches = np.flatnonzero(final_size != early_stop_degree)
+        assert mismatches.size == 0, (
+            f"Circuit '{self.names[rows[mismatches[0]]]}': after {num_rounds} rounds, "
+            f"n={final_size[mismatches[0]]} != FRI_early_stop_degree={early_stop_degree[mismatches[0]]}"
+        )
+
+        if has_deep_ali:
+            max_combo = np.asarray(self.max_combo, dtype=np.float64)[rows]
+            deep_ali_inputs = get_DEEP_ALI_inputs(
+                self.field, trace_length, rate,
+                np.asarray(self.num_constraints, dtype=np.float64)[rows],
+                np.asarray(self.AIR_max_degree, dtype=np.float64)[rows],
+                max_combo,
+            )
+            grinding_deep = np.asarray(self.grinding_deep, dtype=np.int64)[rows]
+
+        # Every regime maps to a list of (label, bits of every row)
+        columns = {}
+        for regime in regimes:
+            log_errors = {}
+            log_errors["batching"] = get_FRI_batching_log_error(
+                regime, rate, trace_length, batch_size, power_batching, multilinear_batching, grinding_batching)
+            for r in range(num_rounds):
+                log_errors[f"commit round {r+1}"] = get_FRI_commit_phase_log_error(
+                    regime, rate, commit_round_dimensions[:, r], folding_factors[:, r], grinding_commit)
+            log_errors["query phase"] = get_FRI_query_phase_log_error(regime, rate, trace_length, num_queries, grinding_query)
+
+            if has_deep_ali:
+                list_size = regime.get_max_list_size(rate, trace_length)
+                log_errors["ALI"], log_errors["DEEP"] = get_DEEP_ALI_log_errors(
+                    list_size, regime, deep_ali_inputs, max_combo, grinding_deep)
+            # A dirty heuristic for now, add zerocheck error only for unique decoding regime.
+            elif multilinear_zerocheck and udr_only:
+                log_errors["zerocheck"] = get_zerocheck_log_error(
+                    self.field, trace_length,
+                    np.asarray(self.num_constraints, dtype=np.float64)[rows],
+                    np.asarray(self.AIR_max_degree, dtype=np.float64)[rows],
+                )
+
+            columns[regime.identifier()] = [
+                (label, get_bits_of_security_from_log_error(np.broadcast_to(log_error, rows.shape)).tolist())
+                for label, log_error in log_errors.items()
+            ]
+
+        return [
+            {regime_id: {label: bits[k] for label, bits in regime_columns} for regime_id, regime_columns in columns.items()}
+            for k in range(len(rows))
+        ]
+
+    @staticmethod
+    def _optional_int(value: int) -> int | None:
+        return None if value == _MISSING_INT else value
@@ -0,0 +1,98 @@
+"""
+Proof size savings under conjectured proximity gaps.
+
+Under the conjecture that proximity gaps hold up to capacity (see `ConjecturedRegime`), every
+query rejects a far function with probability about 1 - rate instead of 1 - sqrt(rate) (JBR)
+or (1 - rate) / 2 (UDR). Thus, the same security level needs far fewer queries.
+
+For a circuit, we keep its rate and all other parameters, re-solve the minimum number of
+queries reaching its current security level in the conjectured regime, and return how many
+queries and how much proof size this would save, if the conjecture held.
+
+The gap eta to capacity trades off the query error (rate + eta per query) against the list
+size and the MCA error (both grow with 1 / eta). Unless a conjecture is given, we try
+eta = (1 - rate) / 2^j for j = 1, ..., 12, and keep the one saving the most proof size.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import log2
+
+from soundcalc.proxgaps.conjectured import ConjecturedRegime
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.rate_advisor import solve_min_num_queries
+from soundcalc.zkvms.variants import get_num_queries, with_pcs, with_rate
+
+
+@dataclass(frozen=True)
+class ConjectureSavings:
+    """A circuit with the minimum number of queries reaching a target under a conjecture."""
+    conjecture: ConjecturedRegime
+    # The regime the target comes from
+    regime: str
+    target_bits: int
+    # The circuit as configured, and its variant with the re-solved number of queries
+    baseline: Circuit
+    circuit: Circuit
+    # One count for FRI and Jagged, one per iteration for WHIR
+    num_queries: list[int]
+
+    def get_queries_saved(self) -> int:
+        """Returns how many queries (summed over all iterations) fewer are needed."""
+        return sum(get_num_queries(self.baseline.pcs)) - sum(self.num_queries)
+
+    def get_proof_size_bits_saved(self) -> int:
+        """Returns how many bits the expected proof size is smaller than in the baseline."""
+        return self.baseline.get_expected_proof_size_bits() - self.circuit.get_expected_proof_size_bits()
+
+    def get_eta(self) -> float:
+        """Returns the gap to capacity of the conjecture, at the rate of the circuit."""
+        return self.conjecture.get_eta(self.baseline.pcs.get_rate())
+
+
+def _get_savings(circuit: Circuit, conjecture: ConjecturedRegime, target_bits: int, regime: str) -> ConjectureSavings | None:
+    log_inv_rate = round(-log2(circuit.pcs.get_rate()))
+    num_queries = solve_min_num_queries(circuit, log_inv_rate, conjecture, target_bits)
+    if num_queries is None:
+        return None
+    variant = with_pcs(circuit, with_rate(circuit.pcs, log_inv_rate, num_queries))
+    return ConjectureSavings(conjecture, regime, target_bits, circuit, variant, num_queries)
+
+
+def get_conjecture_savings(
+        circuit: Circuit,
+        conjecture: ConjecturedRegime | None = None,
+        target_bits: int | None = None,
+        regime: str | None = None,
+) -> ConjectureSavings:
+    """
+    Returns the savings of the circuit (with FRI, Jagged or WHIR) if the given conjecture held.
+    By default, we use `ConjecturedRegime` with its default formulas, and the gap eta saving
+    the most proof size. By default, the regime is the reference regime of the circuit (see
+    `Circuit.get_reference_regime`), and the target is the current total security of the
+    circuit in this regime.
+
+    Raises ValueError if the PCS is not supported, or no number of queries reaches the target
+    in the conjectured regime (e.g., since the conjectured MCA error is too large).
+    """
+    # Raises ValueError if the PCS is not supported
+    get_num_queries(circuit.pcs)
+    if regime is None:
+        regime = circuit.get_reference_regime()
+    if target_bits is None:
+        target_bits = circuit.get_security_levels()[regime]["total"]
+
+    if conjecture is not None:
+        conjectures = [conjecture]
+    else:
+        rate = circuit.pcs.get_rate()
+        conjectures = [ConjecturedRegime(circuit.field, eta=(1 - rate) / 2**j) for j in range(1, 13)]
+
+    candidates = [_get_savings(circuit, conjecture, target_bits, regime) for conjecture in conjectures]
+    candidates = [savings for savings in candidates if savings is not None]
+    if not candidates:
+        raise ValueError(
+            f"Circuit '{circuit.get_name()}': no number of queries reaches {target_bits} bits ({conjectures[0].identifier()})"
+        )
+    return max(candidates, key=lambda savings: savings.get_proof_size_bits_saved())
@@ -0,0 +1,187 @@
+"""
+Adaptive contour tracing of a security threshold over two parameters of a circuit.
+
+A uniform grid over two parameters (e.g., num_queries × rate, or grinding × batch_size)
+spends almost all of its evaluations far from the boundary we care about, i.e., where the
+total security crosses a target such as 100 or 128 bits.
+
+Instead, we start with a coarse grid, and only refine the cells whose corners lie on
+different sides of the target, halving them until they are single cells of the fine grid
+(as in marching squares). The fine cells left over trace the threshold contour.
+
+This assumes the contour does not enter and leave a coarse cell between its corners, which
+holds if the security is monotone in both parameters (as for queries, rate and grinding),
+and otherwise holds for a fine enough coarse grid.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from math import ceil, log2
+from typing import Any, Callable
+
+from soundcalc.pcs.jagged import JaggedConfig, JaggedPCS
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.variants import get_num_queries, with_pcs, with_rate
+
+
+@dataclass(frozen=True)
+class SweepAxis:
+    """A parameter of a circuit to sweep over, with its values on the fine grid (in order)."""
+    name: str
+    values: list
+    # Returns the variant of the circuit with this parameter set to the given value
+    apply: Callable[[Circuit, Any], Circuit]
+
+
+def _with_pcs_config(circuit: Circuit, field_name: str, value: Any) -> Circuit:
+    pcs = circuit.pcs
+    if isinstance(pcs, JaggedPCS):
+        dense_pcs = type(pcs.dense_pcs)(replace(pcs.dense_pcs.config, **{field_name: value}))
+        pcs = JaggedPCS(JaggedConfig(dense_pcs=dense_pcs, trace_length=pcs.trace_length, trace_width=pcs.trace_width))
+    else:
+        pcs = type(pcs)(replace(pcs.config, **{field_name: value}))
+    return with_pcs(circuit, pcs)
+
+
+def pcs_config_axis(field_name: str, values: list) -> SweepAxis:
+    """
+    Returns an axis over a field of the PCS config (of the dense PCS for Jagged), e.g.,
+    "num_queries", "batch_size" or "grinding_query_phase".
+    """
+    return SweepAxis(field_name, values, lambda circuit, value: _with_pcs_config(circuit, field_name, value))
+
+
+def _with_log_inv_rate(circuit: Circuit, log_inv_rate: int) -> Circuit:
+    pcs = circuit.pcs
+    return with_pcs(circuit, with_rate(pcs, log_inv_rate, get_num_queries(pcs)))
+
+
+def log_inv_rate_axis(values: list[int]) -> SweepAxis:
+    """
+    Returns an axis over the rate 2^-log_inv_rate (FRI, Jagged or WHIR), keeping the number
+    of queries. As in `with_rate`, FRI keeps its folding factors.
+    """
+    return SweepAxis("log_inv_rate", values, _with_log_inv_rate)
+
+
+def get_sweep_axis(name: str, values: list) -> SweepAxis:
+    """Returns the axis for a parameter name: "log_inv_rate", or a field of the PCS config."""
+    if name == "log_inv_rate":
+        return log_inv_rate_axis(values)
+    return pcs_config_axis(name, values)
+
+
+@dataclass(frozen=True)
+class ContourSweep:
+    """The evaluations of an adaptive sweep, and the fine cells the threshold contour passes through."""
+    x_axis: SweepAxis
+    y_axis: SweepAxis
+    regime: str
+    target_bits: int
+    # Total security per evaluated grid point (x index, y index), None for invalid configurations
+    bits: dict[tuple[int, int], int | None]
+    # Fine cells crossing the target, given by their lower corner (x index, y index)
+    contour_cells: list[tuple[int, int]]
+
+    def reaches_target(self, i: int, j: int) -> bool:
+        bits = self.bits[(i, j)]
+        return bits is not None and bits >= self.target_bits
+
+    def get_num_evaluations(self) -> int:
+        return len(self.bits)
+
+    def get_evaluation_fraction(self) -> float:
+        """Returns the number of evaluations relative to a uniform sweep of the fine grid."""
+        return self.get_num_evaluations() / (len(self.x_axis.values) * len(self.y_axis.values))
+
+    def get_contour(self) -> list[tuple[Any, Any]]:
+        """
+        Returns the (x, y) values of the contour at fine resolution: the grid points reaching the
+        target that are next to one that does not (in a crossing fine cell), in order.
+        """
+        points = set()
+        for i0, j0 in self.contour_cells:
+            i1 = min(i0 + 1, len(self.x_axis.values) - 1)
+            j1 = min(j0 + 1, len(self.y_axis.values) - 1)
+            for i, j in [(i0, j0), (i0, j1), (i1, j0), (i1, j1)]:
+                neighbors = [(i ^ i0 ^ i1, j), (i, j ^ j0 ^ j1)]
+                if self.reaches_target(i, j) and any(not self.reaches_target(*n) for n in neighbors):
+                    points.add((i, j))
+        return [(self.x_axis.values[i], self.y_axis.values[j]) for i, j in sorted(points)]
+
+
+def _get_coarse_intervals(n: int, stride: int) -> list[tuple[int, int]]:
+    nodes = sorted(set(range(0, n, stride)) | {n - 1})
+    if len(nodes) == 1:
+        return [(0, 0)]
+    return list(zip(nodes, nodes[1:]))
+
+
+def _split(interval: tuple[int, int]) -> list[tuple[int, int]]:
+    lo, hi = interval
+    if hi - lo <= 1:
+        return [interval]
+    mid = (lo + hi) // 2
+    return [(lo, mid), (mid, hi)]
+
+
+def trace_security_contour(
+        circuit: Circuit,
+        x_axis: SweepAxis,
+        y_axis: SweepAxis,
+        target_bits: int,
+        regime: str | None = None,
+        num_coarse_points: int = 9,
+) -> ContourSweep:
+    """
+    Traces where the total security of the circuit in the given regime (by default its reference
+    regime, see `Circuit.get_reference_regime`) crosses `target_bits` over the two axes.
+
+    The coarse grid has (about) `num_coarse_points` points per axis, including the first and last
+    value. Cells whose corners disagree on reaching the target are halved until they are fine cells.
+    Configurations that are invalid (e.g., due to the 2-adicity of the field) do not reach the target.
+    Raises ValueError if the circuit is not analyzed in the given regime.
+    """
+    if regime is None:
+        regime = circuit.get_reference_regime()
+    if regime not in circuit.get_regime_ids():
+        raise ValueError(f"Circuit '{circuit.get_name()}' is not analyzed in regime '{regime}'")
+
+    bits: dict[tuple[int, int], int | None] = {}
+
+    def reaches_target(i: int, j: int) -> bool:
+        if (i, j) not in bits:
+            try:
+                variant = y_axis.apply(x_axis.apply(circuit, x_axis.values[i]), y_axis.values[j])
+                bits[(i, j)] = variant.get_security_levels()[regime]["total"]
+            except (AssertionError, ValueError):
+                bits[(i, j)] = None
+        value = bits[(i, j)]
+        return value is not None and value >= target_bits
+
+    def get_stride(n: int) -> int:
+        return 2 ** max(0, ceil(log2(max(n - 1, 1) / max(num_coarse_points - 1, 1))))
+
+    nx, ny = len(x_axis.values), len(y_axis.values)
+    cells = [
+        (x_interval, y_interval)
+        for x_interval in _get_coarse_intervals(nx, get_stride(nx))
+        for y_interval in _get_coarse_intervals(ny, get_stride(ny))
+    ]
+
+    contour_cells = []
+    while cells:
+        next_cells = []
+        for x_interval, y_interval in cells:
+            corners = {reaches_target(i, j) for i in x_interval for j in y_interval}
+            if len(corners) == 1:
+                continue
+            x_parts, y_parts = _split(x_interval), _split(y_interval)
+            if len(x_parts) == 1 and len(y_parts) == 1:
+                contour_cells.append((x_interval[0], y_interval[0]))
+            else:
+                next_cells.extend((x_part, y_part) for x_part in x_parts for y_part in y_parts)
+        cells = next_cells
+
+    return ContourSweep(x_axis, y_axis, regime, target_bits, bits, sorted(contour_cells))
@@ -0,0 +1,75 @@
+"""
+Extension degree selector for circuits.
+
+The batching, folding, OOD, ALI, DEEP and lookup errors all scale with 1 / |F|, where F is
+the extension field that challenges are sampled from. The query phase does not depend on F.
+Often, a smaller extension of the same base prime suffices for the targeted security level,
+which saves proof size (every opened or sent extension element shrinks) and prover time
+(extension field arithmetic dominates batching and folding).
+
+For every degree, we derive a variant of the circuit with the extension of that degree,
+and return the smallest degree that reaches the target.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from soundcalc.common.fields import FieldParams, get_extension_field
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.variants import with_field
+
+
+@dataclass(frozen=True)
+class ExtensionDegreeSelection:
+    """The smallest extension degree of a circuit reaching a target security level."""
+    regime: str
+    target_bits: int
+    # The circuit as configured, and its variant with the smallest extension degree
+    baseline: Circuit
+    circuit: Circuit
+
+    def get_field(self) -> FieldParams:
+        return self.circuit.field
+
+    def get_element_bits_saved(self) -> int:
+        """Returns how many bits an extension field element is smaller than in the baseline."""
+        return self.baseline.field.extension_field_element_size_bits() - self.get_field().extension_field_element_size_bits()
+
+    def get_proof_size_bits_saved(self) -> int:
+        """Returns how many bits the expected proof size is smaller than in the baseline."""
+        return self.baseline.get_expected_proof_size_bits() - self.circuit.get_expected_proof_size_bits()
+
+
+def select_extension_degree(
+        circuit: Circuit,
+        target_bits: int | None = None,
+        regime: str | None = None,
+        max_degree: int = 8,
+) -> ExtensionDegreeSelection:
+    """
+    Returns the smallest extension degree (up to `max_degree`) of the circuit's base prime
+    for which the circuit has at least `target_bits` of total security in the given regime.
+    By default, the regime is the reference regime of the circuit (see `Circuit.get_reference_regime`),
+    and the target is the current total security of the circuit in this regime.
+
+    Raises ValueError if no degree reaches the target.
+    """
+    if regime is None:
+        regime = circuit.get_reference_regime()
+    if target_bits is None:
+        target_bits = circuit.get_security_levels()[regime]["total"]
+
+    for degree in range(1, max_degree + 1):
+        variant = with_field(circuit, get_extension_field(circuit.field, degree))
+        try:
+            total_bits = variant.get_security_levels()[regime]["total"]
+        except AssertionError:
+            # E.g., the multi-point condition of DEEP-ALI needs a large enough field
+            continue
+        if total_bits >= target_bits:
+            return ExtensionDegreeSelection(regime, target_bits, circuit, variant)
+
+    raise ValueError(
+        f"Circuit '{circuit.get_name()}': no extension of degree up to {max_degree} reaches {target_bits} bits ({regime})"
+    )
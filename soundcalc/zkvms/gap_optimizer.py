@@ -0,0 +1,126 @@
+"""
+Optimizer for the Johnson bound gap (`gap_to_radius`) of a circuit.
+
+In the Johnson bound regime, the proximity parameter is 1 - sqrt(rate) - gap. A smaller
+gap improves the query phase (the verifier rejects far functions with higher probability),
+but increases the list size, and hence the batching, folding and DEEP-ALI errors. Unless
+pinned in the TOML config, the gap is set by a heuristic in `JohnsonBoundRegime`.
+
+Here, we search for the gap that maximizes the total JBR security of a circuit. The total
+security is the minimum of components that decrease with the gap and components that
+increase with it, so it is (roughly) unimodal in the gap. We scan a log-spaced grid to
+bracket the optimum, and then refine it with golden-section search on log(gap).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from math import exp, log, sqrt
+
+from soundcalc.zkvms.circuit import Circuit
+
+# 1 / golden ratio
+_INV_PHI = (sqrt(5) - 1) / 2
+
+
+@dataclass(frozen=True)
+class GapOptimizationResult:
+    """Result of optimizing the JBR gap of a circuit."""
+    # The optimal gap (None if the heuristic is optimal), and the total JBR security it achieves
+    gap_to_radius: float | None
+    bits: int
+    # The configured gap (None for the heuristic), and the total JBR security it achieves
+    baseline_gap_to_radius: float | None
+    baseline_bits: int
+
+    def get_bits_gained(self) -> int:
+        return self.bits - self.baseline_bits
+
+
+def get_jbr_total_bits(circuit: Circuit, gap_to_radius: float | None) -> int | None:
+    """
+    Returns the total JBR security of the circuit with the given gap (None for the heuristic),
+    or None if the configuration is invalid for this gap (e.g. the multi-point condition of
+    DEEP-ALI or a proximity parameter outside of (0, 1)).
+    """
+    variant = Circuit(replace(circuit.config, gap_to_radius=gap_to_radius))
+    try:
+        return variant.get_security_levels()["JBR"]["total"]
+    except AssertionError:
+        return None
+
+
+def optimize_gap_to_radius(
+        circuit: Circuit,
+        num_grid_points: int = 64,
+        min_gap_fraction: float = 2**-20,
+        tolerance: float = 1e-3,
+        max_m: int = 64,
+) -> GapOptimizationResult:
+    """
+    Returns the gap maximizing the total JBR security of the circuit.
+
+    Gaps are searched in [min_gap_fraction, 1 - min_gap_fraction] ⋅ (1 - sqrt(rate)), where rate
+    is the (initial, i.e., largest) rate of the PCS. The search stops once the bracket is
+    narrower than `tolerance` in log(gap). Additionally, the jumps of the list-decoding
+    parameter m are checked up to `max_m`. The configured gap is kept unless another gap
+    achieves strictly more security. Raises ValueError for circuits that are not analyzed in JBR.
+    """
+    if "JBR" not in circuit.get_regime_ids():
+        raise ValueError(f"Circuit '{circuit.get_name()}' is not analyzed in the Johnson bound regime")
+
+    baseline_bits = circuit.get_security_levels()["JBR"]["total"]
+
+    sqrt_rate = sqrt(circuit.pcs.get_rate())
+    radius = 1 - sqrt_rate
+    lo, hi = log(radius * min_gap_fraction), log(radius * (1 - min_gap_fraction))
+
+    cache: dict[float, int] = {}
+
+    def bits_at(x: float) -> int:
+        if x not in cache:
+            bits = get_jbr_total_bits(circuit, exp(x))
+            cache[x] = -1 if bits is None else bits
+        return cache[x]
+
+    # Bracket the optimum on a log-spaced grid
+    grid = [lo + (hi - lo) * j / (num_grid_points - 1) for j in range(num_grid_points)]
+    best = max(range(num_grid_points), key=lambda j: bits_at(grid[j]))
+    a, b = grid[max(best - 1, 0)], grid[min(best + 1, num_grid_points - 1)]
+
+    # Golden-section search for the maximum in [a, b]
+    x1, x2 = b - _INV_PHI * (b - a), a + _INV_PHI * (b - a)
+    while b - a > tolerance:
+        if bits_at(x1) < bits_at(x2):
+            a, x1 = x1, x2
+            x2 = a + _INV_PHI * (b - a)
+        else:
+            b, x2 = x2, x1
+            x1 = b - _INV_PHI * (b - a)
+
+    # The parameter m of the BCHKS25 bound is ceil(sqrt(rate) / gap), so the errors jump where
+    # it changes, and the optimum may lie in a narrow window right at such a jump. Evaluate the
+    # gaps sqrt(rate) / m, which are the smallest gaps for a given m, as well.
+    for m in range(3, max_m + 1):
+        x = log(sqrt_rate / m)
+        if lo <= x <= hi:
+            bits_at(x)
+
+    # The first maximum in evaluation order (grid, golden-section, then jump points)
+    best_x = max(cache, key=lambda x: cache[x])
+    if cache[best_x] < 0:
+        raise ValueError(f"Circuit '{circuit.get_name()}': no valid gap found")
+
+    # Keep the configured gap unless we strictly improve on it. Note that the heuristic gap
+    # depends on the rate, so for PCSs with several rates (e.g., WHIR) it is not a single gap.
+    if baseline_bits >= cache[best_x]:
+        gap_to_radius, bits = circuit.gap_to_radius, baseline_bits
+    else:
+        gap_to_radius, bits = exp(best_x), cache[best_x]
+
+    return GapOptimizationResult(
+        gap_to_radius=gap_to_radius,
+        bits=bits,
+        baseline_gap_to_radius=circuit.gap_to_radius,
+        baseline_bits=baseline_bits,
+    )
@@ -0,0 +1,192 @@
+"""
+Recursion/aggregation pipelines.
+
+Multi-circuit zkVMs usually form a recursion chain: a base layer proves execution
+segments, and every further layer proves that it verified the proofs of the layer
+below (e.g. RISCV → CONVERT → COMBINE → EMBED). A pipeline describes this chain and
+derives end-to-end figures from it: the weakest link, the total prover work for a
+given number of segments, the final proof size, and the verifier work each layer
+has to arithmetize.
+
+Pipelines are declared in the zkVM TOML:
+
+    [pipeline]
+    num_segments = 1          # base proofs to aggregate (optional, default 1)
+
+    [[pipeline.layers]]
+    circuit = "riscv"
+
+    [[pipeline.layers]]
+    circuit = "combine"
+    arity = 2                 # child proofs verified per proof (optional, default 1)
+    recursive = true          # repeat the layer until a single proof remains (optional)
+
+Optionally, `[pipeline.verifier_circuit]` holds a verifier circuit model fitted to the
+recursion layers (see `soundcalc.zkvms.verifier_circuit`).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from math import ceil
+
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
+from soundcalc.costs.verifier import VerifierCost
+from soundcalc.zkvms.circuit import Circuit
+
+
+@dataclass(frozen=True)
+class PipelineLayer:
+    """A single layer of a recursion pipeline."""
+    circuit: Circuit
+    # Number of proofs of the layer below that one proof of this layer verifies
+    arity: int = 1
+    # Whether the layer is applied repeatedly (as an aggregation tree) until one proof remains
+    recursive: bool = False
+
+    def get_name(self) -> str:
+        return self.circuit.get_name()
+
+    def get_num_proofs(self, num_children: int) -> int:
+        """
+        Returns the number of proofs of this layer needed to consume `num_children`
+        proofs of the layer below. A layer always produces at least one proof.
+        """
+        if not self.recursive:
+            return ceil(num_children / self.arity)
+
+        # Aggregation tree: reduce by a factor of `arity` per level
+        total = 0
+        remaining = num_children
+        while remaining > 1:
+            remaining = ceil(remaining / self.arity)
+            total += remaining
+        return max(total, 1)
+
+    def get_num_outputs(self, num_children: int) -> int:
+        """Returns the number of proofs this layer hands to the layer above."""
+        if self.recursive:
+            return 1
+        return ceil(num_children / self.arity)
+
+
+class Pipeline:
+    """
+    A recursion/aggregation pipeline over the circuits of a zkVM.
+
+    Layers are ordered from the base layer to the final (outermost) layer, and each
+    layer verifies proofs of the layer directly below it.
+    """
+
+    def __init__(self, layers: list[PipelineLayer], num_segments: int = 1):
+        if not layers:
+            raise ValueError("A pipeline needs at least one layer")
+        if num_segments < 1:
+            raise ValueError(f"num_segments must be positive, got {num_segments}")
+        for layer in layers:
+            if layer.arity < 1:
+                raise ValueError(f"Layer '{layer.get_name()}' has invalid arity {layer.arity}")
+            if layer.recursive and layer.arity < 2:
+                raise ValueError(f"Recursive layer '{layer.get_name()}' needs arity at least 2")
+
+        self.layers = layers
+        self.num_segments = num_segments
+
+    @classmethod
+    def from_toml_config(cls, section: dict, circuits: list[Circuit]) -> "Pipeline":
+        """
+        Build a pipeline from the `[pipeline]` section of a zkVM TOML config,
+        resolving layer circuits by name.
+        """
+        circuits_by_name = {circuit.get_name(): circuit for circuit in circuits}
+        layers = []
+        for layer_section in section.get("layers", []):
+            name = layer_section["circuit"]
+            if name not in circuits_by_name:
+                raise ValueError(f"Pipeline layer refers to unknown circuit '{name}'")
+            layers.append(PipelineLayer(
+                circuit=circuits_by_name[name],
+                arity=layer_section.get("arity", 1),
+                recursive=layer_section.get("recursive", False),
+            ))
+        return cls(layers, num_segments=section.get("num_segments", 1))
+
+    def get_layers(self) -> list[PipelineLayer]:
+        return self.layers
+
+    def get_final_circuit(self) -> Circuit:
+        """Returns the circuit producing the final proof."""
+        return self.layers[-1].circuit
+
+    def get_num_proofs(self, num_segments: int | None = None) -> list[int]:
+        """
+        Returns the number of proofs generated per layer, for the given number of
+        base segments (defaults to the pipeline's `num_segments`).
+        """
+        if num_segments is None:
+            num_segments = self.num_segments
+
+        num_proofs = [num_segments]
+        num_outputs = num_segments
+        for layer in self.layers[1:]:
+            num_proofs.append(layer.get_num_proofs(num_outputs))
+            num_outputs = layer.get_num_outputs(num_outputs)
+        return num_proofs
+
+    def get_final_proof_size_bits(self, expected: bool = False) -> int:
+        """Returns the size of the final proof in bits."""
+        final_circuit = self.get_final_circuit()
+        if expected:
+            return final_circuit.get_expected_proof_size_bits()
+        return final_circuit.get_proof_size_bits()
+
+    def get_weakest_link(self) -> tuple[str, int, str]:
+        """
+        Returns (regime, bits, circuit name) for the weakest circuit of the pipeline.
+
+        The security of the pipeline is the minimum over its layers. As in the
+        reports, we take this minimum per regime and return the best regime.
+        """
+        regime_mins: dict[str, tuple[int, str]] = {}
+        for layer in self.layers:
+            for regime_name, levels in layer.circuit.get_security_levels(proven_only=True).items():
+                if isinstance(levels, dict) and "total" in levels:
+                    bits = levels["total"]
+                    if regime_name not in regime_mins or bits < regime_mins[regime_name][0]:
+                        regime_mins[regime_name] = (bits, layer.get_name())
+
+        best_regime, (best_bits, weakest_circuit) = max(regime_mins.items(), key=lambda item: item[1][0])
+        return best_regime, best_bits, weakest_circuit
+
+    def get_layer_prover_seconds(self, profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                                 num_segments: int | None = None) -> list[float]:
+        """Returns the estimated single-core prover time in seconds per layer (all its proofs)."""
+        return [
+            num_proofs * layer.circuit.get_prover_seconds(profile)
+            for layer, num_proofs in zip(self.layers, self.get_num_proofs(num_segments))
+        ]
+
+    def get_prover_seconds(self, profile: ThroughputProfile = DEFAULT_THROUGHPUT,
+                           num_segments: int | None = None) -> float:
+        """Returns the estimated single-core prover time in seconds for the whole pipeline."""
+        return sum(self.get_layer_prover_seconds(profile, num_segments))
+
+    def get_arithmetized_verifier_cost(self, layer_index: int, expected: bool = True) -> VerifierCost | None:
+        """
+        Returns the verifier work that one proof of the given layer arithmetizes,
+        i.e., `arity` verifications of the layer below. None for the base layer.
+        """
+        if layer_index == 0:
+            return None
+
+        layer = self.layers[layer_index]
+        child_cost = self.layers[layer_index - 1].circuit.get_verifier_cost(expected)
+        if layer.recursive:
+            # An aggregation node verifies proofs of its own layer as well; take the costlier one
+            own_cost = layer.circuit.get_verifier_cost(expected)
+            if own_cost.hash_compressions > child_cost.hash_compressions:
+                child_cost = own_cost
+        return VerifierCost(
+            hash_compressions=layer.arity * child_cost.hash_compressions,
+            ext_field_mults=layer.arity * child_cost.ext_field_mults,
+        )
@@ -0,0 +1,172 @@
+"""
+Rate advisor for circuits using FRI, Jagged (FRI) or WHIR.
+
+A lower rate needs fewer queries for the same security, and hence gives smaller proofs,
+but makes the low-degree extension and the Merkle trees bigger, and hence the prover slower.
+
+For every candidate rate 2^-log_inv_rate, we derive a variant of the circuit and re-solve
+the minimum number of queries such that the circuit still reaches a target security level.
+All other parameters (grinding, folding, batching) are kept. The options are then compared
+by a weighted cost of their (expected) proof size and their LDE domain size.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+from soundcalc.pcs.fri import FRI
+from soundcalc.pcs.jagged import JaggedPCS
+from soundcalc.pcs.pcs import PCS
+from soundcalc.pcs.whir import WHIR
+from soundcalc.proxgaps.proxgaps_regime import ProximityGapsRegime
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.variants import get_num_queries, with_pcs, with_rate
+
+
+@dataclass(frozen=True)
+class RateOption:
+    """A candidate rate of a circuit, with the minimum number of queries reaching the target."""
+    log_inv_rate: int
+    # One count for FRI and Jagged, one per iteration for WHIR
+    num_queries: list[int]
+    # The circuit with this rate and number of queries
+    circuit: Circuit
+
+    def get_proof_size_bits(self) -> int:
+        return self.circuit.get_expected_proof_size_bits()
+
+    def get_domain_size(self) -> int:
+        """Returns the size of the (initial) LDE domain."""
+        pcs = self.circuit.pcs
+        return round(pcs.get_dimension() / pcs.get_rate())
+
+
+@dataclass(frozen=True)
+class RateAdvice:
+    """The feasible rate options of a circuit, and the recommended one."""
+    regime: str
+    target_bits: int
+    options: list[RateOption]
+    # Cost of each option, as in `options`
+    costs: list[float]
+
+    def get_recommended(self) -> RateOption:
+        """Returns the option with the smallest cost (the largest rate on ties)."""
+        return self.options[self.costs.index(min(self.costs))]
+
+
+def _get_query_level_keys(pcs: PCS) -> list[str]:
+    """
+    Returns, for every query count of the PCS, the label of the security level it determines.
+    """
+    if isinstance(pcs, JaggedPCS):
+        return _get_query_level_keys(pcs.dense_pcs)
+    if isinstance(pcs, FRI):
+        return ["query phase"]
+    if isinstance(pcs, WHIR):
+        # The queries of iteration i-1 are checked by the shift queries of iteration i,
+        # and the queries of the last iteration by the final check
+        return [f"Shift(i={iteration})" for iteration in range(1, pcs.num_iterations)] + ["fin"]
+    raise ValueError(f"Rate advisor does not support {type(pcs).__name__}")
+
+
+def solve_min_num_queries(
+        circuit: Circuit,
+        log_inv_rate: int,
+        regime: str | ProximityGapsRegime,
+        target_bits: int,
+        max_num_queries: int = 2048,
+) -> list[int] | None:
+    """
+    Returns the minimum number of queries (per iteration for WHIR) such that the circuit with
+    rate 2^-log_inv_rate has at least `target_bits` of total security in the given regime
+    ("UDR", "JBR", or any ProximityGapsRegime), or None if this is not possible with up to
+    `max_num_queries` queries (or the rate is invalid, e.g., due to the 2-adicity of the field).
+
+    Every query count only determines the security level of its own query phase, so we can
+    find the minimum of each count separately, by doubling and then binary search.
+    """
+    keys = _get_query_level_keys(circuit.pcs)
+    num_queries = list(get_num_queries(circuit.pcs))
+
+    def get_levels(num_queries: list[int]) -> dict[str, int]:
+        variant = with_pcs(circuit, with_rate(circuit.pcs, log_inv_rate, num_queries))
+        if isinstance(regime, ProximityGapsRegime):
+            return variant.get_regime_security_levels(regime)
+        return variant.get_security_levels()[regime]
+
+    try:
+        for i, key in enumerate(keys):
+            def reaches_target(count: int) -> bool:
+                num_queries[i] = count
+                return get_levels(num_queries)[key] >= target_bits
+
+            upper = 1
+            while not reaches_target(upper):
+                if upper >= max_num_queries:
+                    return None
+                upper *= 2
+
+            lo, hi = upper // 2 + 1, upper
+            while lo < hi:
+                mid = (lo + hi) // 2
+                if reaches_target(mid):
+                    hi = mid
+                else:
+                    lo = mid + 1
+            num_queries[i] = lo
+
+        # The components that do not depend on the queries may still be below the target
+        if get_levels(num_queries)["total"] < target_bits:
+            return None
+    except AssertionError:
+        return None
+
+    return num_queries
+
+
+def advise_rate(
+        circuit: Circuit,
+        log_inv_rates: Sequence[int] = tuple(range(1, 7)),
+        target_bits: int | None = None,
+        regime: str | None = None,
+        proof_size_weight: float = 1.0,
+        domain_size_weight: float = 1.0,
+) -> RateAdvice:
+    """
+    Sweeps the rate of the circuit over 2^-log_inv_rate for the given values, re-solves the
+    minimum number of queries for each, and recommends the rate minimizing
+
+        proof_size_weight ⋅ proof size / smallest proof size
+            + domain_size_weight ⋅ domain size / smallest domain size
+
+    over the feasible options. By default, the regime is the reference regime of the circuit
+    (see `Circuit.get_reference_regime`), and the target is the current total security of the
+    circuit in this regime.
+    Raises ValueError if no rate reaches the target.
+    """
+    if regime is None:
+        regime = circuit.get_reference_regime()
+    if target_bits is None:
+        target_bits = circuit.get_security_levels()[regime]["total"]
+
+    options = []
+    for log_inv_rate in log_inv_rates:
+        num_queries = solve_min_num_queries(circuit, log_inv_rate, regime, target_bits)
+        if num_queries is not None:
+            variant = with_pcs(circuit, with_rate(circuit.pcs, log_inv_rate, num_queries))
+            options.append(RateOption(log_inv_rate, num_queries, variant))
+
+    if not options:
+        raise ValueError(f"Circuit '{circuit.get_name()}': no rate reaches {target_bits} bits ({regime})")
+
+    min_proof_size = min(option.get_proof_size_bits() for option in options)
+    min_domain_size = min(option.get_domain_size() for option in options)
+    costs = [
+        proof_size_weight * option.get_proof_size_bits() / min_proof_size
+        + domain_size_weight * option.get_domain_size() / min_domain_size
+        for option in options
+    ]
+
+    return RateAdvice(regime, target_bits, options, costs)
@@ -0,0 +1,90 @@
+"""
+Variants of circuits and PCSs, e.g., with another rate, number of queries or field.
+
+Shared by the analyses that re-evaluate a circuit under other parameters (the rate
+advisor, conjecture savings, contour sweeps and the extension selector). All other
+parameters are kept.
+"""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from math import log2
+
+from soundcalc.common.fields import FieldParams
+from soundcalc.lookups.logup import LogUp
+from soundcalc.pcs.fri import FRI
+from soundcalc.pcs.jagged import JaggedConfig, JaggedPCS
+from soundcalc.pcs.pcs import PCS
+from soundcalc.pcs.stir import STIR
+from soundcalc.pcs.whir import WHIR
+from soundcalc.zkvms.circuit import Circuit
+
+
+def get_num_queries(pcs: PCS) -> list[int]:
+    """
+    Returns the number of queries of the PCS: one count for FRI and Jagged, one per iteration for WHIR.
+    Raises ValueError for other PCSs.
+    """
+    if isinstance(pcs, JaggedPCS):
+        return [pcs.dense_pcs.num_queries]
+    if isinstance(pcs, FRI):
+        return [pcs.num_queries]
+    if isinstance(pcs, WHIR):
+        return list(pcs.num_queries)
+    raise ValueError(f"Variants with another rate are not supported for {type(pcs).__name__}")
+
+
+def with_rate(pcs: PCS, log_inv_rate: int, num_queries: list[int]) -> PCS:
+    """
+    Returns a variant of the PCS with the rate 2^-log_inv_rate and the given number of queries
+    (as in `get_num_queries`). For FRI, the folding factors are kept, so the final domain grows
+    with the LDE domain.
+
+    Raises AssertionError if the rate is invalid (e.g., due to the 2-adicity of the field),
+    and ValueError for PCSs other than FRI, Jagged and WHIR.
+    """
+    if isinstance(pcs, JaggedPCS):
+        dense_pcs = with_rate(pcs.dense_pcs, log_inv_rate, num_queries)
+        return JaggedPCS(JaggedConfig(dense_pcs=dense_pcs, trace_length=pcs.trace_length, trace_width=pcs.trace_width))
+    if isinstance(pcs, FRI):
+        rho = 2**-log_inv_rate
+        # The LDE domain must be a 2-adic subgroup
+        if log2(pcs.trace_length) + log_inv_rate > pcs.field.two_adicity:
+            raise AssertionError(f"Field {pcs.field.name} 2-adicity is too low for rate {rho}")
+        early_stop_degree = pcs.FRI_early_stop_degree * 2**(log_inv_rate - pcs.k)
+        return FRI(replace(pcs.config, rho=rho, num_queries=num_queries[0], FRI_early_stop_degree=early_stop_degree))
+    if isinstance(pcs, WHIR):
+        return WHIR(replace(pcs.config, log_inv_rate=log_inv_rate, num_queries=num_queries))
+    raise ValueError(f"Variants with another rate are not supported for {type(pcs).__name__}")
+
+
+def with_pcs(circuit: Circuit, pcs: PCS) -> Circuit:
+    """Returns a variant of the circuit with the given PCS, keeping all other parameters."""
+    return Circuit(replace(circuit.config, pcs=pcs))
+
+
+def _with_field_pcs(pcs: PCS, field: FieldParams) -> PCS:
+    if isinstance(pcs, JaggedPCS):
+        dense_pcs = _with_field_pcs(pcs.dense_pcs, field)
+        return JaggedPCS(JaggedConfig(dense_pcs=dense_pcs, trace_length=pcs.trace_length, trace_width=pcs.trace_width))
+    if isinstance(pcs, FRI):
+        return FRI(replace(pcs.config, field=field))
+    if isinstance(pcs, WHIR):
+        return WHIR(replace(pcs.config, field=field))
+    if isinstance(pcs, STIR):
+        return STIR(replace(pcs.config, field=field))
+    raise ValueError(f"Variants over another field are not supported for {type(pcs).__name__}")
+
+
+def with_field(circuit: Circuit, field: FieldParams) -> Circuit:
+    """
+    Returns a variant of the circuit (including its PCS and lookups) over the given field.
+    """
+    lookups = [LogUp(replace(lookup.config, field=field)) for lookup in circuit.get_lookups()]
+    return Circuit(replace(
+        circuit.config,
+        field=field,
+        pcs=_with_field_pcs(circuit.pcs, field),
+        lookups=lookups or circuit.config.lookups,
+    ))
@@ -0,0 +1,140 @@
+"""
+Verifier-circuit size estimation for recursion pipelines.
+
+In a recursion pipeline, the trace length of a layer depends on the cost of verifying
+the proofs of the layer below. We map verifier work (hash compressions for Merkle
+openings, extension field multiplications for folding checks etc.) to an approximate
+trace length, and iterate until the trace lengths of all recursion layers reach a
+fixed point. This shows how e.g. fewer queries or larger folding factors shrink the
+whole recursion tree.
+
+As with the other cost estimates, this is a rough model and should be treated as such.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from math import ceil, log2
+
+from soundcalc.costs.verifier import VerifierCost
+from soundcalc.pcs.fri import FRI, FRIConfig
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.pipeline import Pipeline
+
+
+@dataclass(frozen=True)
+class VerifierCircuitModel:
+    """
+    Linear model for the number of trace rows a recursive verifier needs.
+
+    The defaults are indicative only; they should be fitted to a concrete
+    recursion circuit (e.g. from its measured trace height). Reports only show the
+    fixed point for zkVMs that declare a fitted model in their TOML:
+
+        [pipeline.verifier_circuit]
+        rows_per_hash_compression = 16
+        rows_per_ext_field_mult = 1
+        fixed_rows = 4096
+    """
+    # Rows per hash compression (e.g. for a Poseidon2 permutation and its I/O)
+    rows_per_hash_compression: float = 16
+    # Rows per extension field multiplication
+    rows_per_ext_field_mult: float = 1
+    # Rows independent of the verified proofs (public values, transcript setup, ...)
+    fixed_rows: int = 2**12
+
+    @classmethod
+    def from_toml_config(cls, section: dict) -> "VerifierCircuitModel":
+        """Build a model from the `[pipeline.verifier_circuit]` section of a zkVM TOML config."""
+        return cls(
+            rows_per_hash_compression=section["rows_per_hash_compression"],
+            rows_per_ext_field_mult=section["rows_per_ext_field_mult"],
+            fixed_rows=section["fixed_rows"],
+        )
+
+    def get_trace_length(self, verifier_cost: VerifierCost) -> int:
+        """
+        Returns the trace length (a power of two) of a circuit doing the given verifier work.
+        """
+        rows = (
+            self.fixed_rows
+            + self.rows_per_hash_compression * verifier_cost.hash_compressions
+            + self.rows_per_ext_field_mult * verifier_cost.ext_field_mults
+        )
+        return 2 ** max(0, ceil(log2(rows)))
+
+
+DEFAULT_VERIFIER_CIRCUIT_MODEL = VerifierCircuitModel()
+
+
+def get_FRI_config_for_trace_length(config: FRIConfig, trace_length: int) -> FRIConfig:
+    """
+    Returns a copy of the FRI config for a different trace length.
+
+    We keep the rate, number of queries and the size of the final domain. The folding
+    schedule follows the original folding factors, repeating the last factor when more
+    rounds are needed and shrinking the last round when fewer are needed.
+    """
+    domain_size = int(trace_length / config.rho)
+    final_domain_size = min(config.FRI_early_stop_degree, domain_size)
+    log_remaining = int(round(log2(domain_size // final_domain_size)))
+
+    folding_factors = []
+    i = 0
+    while log_remaining > 0:
+        log_factor = int(round(log2(config.FRI_folding_factors[min(i, len(config.FRI_folding_factors) - 1)])))
+        log_factor = min(log_factor, log_remaining)
+        folding_factors.append(2**log_factor)
+        log_remaining -= log_factor
+        i += 1
+
+    return replace(
+        config,
+        trace_length=trace_length,
+        FRI_folding_factors=folding_factors,
+        FRI_early_stop_degree=final_domain_size,
+    )
+
+
+def get_circuit_for_trace_length(circuit: Circuit, trace_length: int) -> Circuit:
+    """
+    Returns a copy of a FRI-based circuit with a different trace length.
+
+    The width (batch_size) and the number of queries are kept, so the verifier work of the
+    resized circuit only changes through its Merkle tree depths and folding schedule.
+    """
+    if not isinstance(circuit.pcs, FRI):
+        raise ValueError(f"Circuit '{circuit.get_name()}': resizing is only supported for FRI")
+    if circuit.pcs.get_trace_length() == trace_length:
+        return circuit
+
+    pcs = FRI(get_FRI_config_for_trace_length(circuit.pcs.config, trace_length))
+    return Circuit(replace(circuit.config, pcs=pcs))
+
+
+def get_fixed_point_pipeline(
+        pipeline: Pipeline,
+        model: VerifierCircuitModel = DEFAULT_VERIFIER_CIRCUIT_MODEL,
+        max_iterations: int = 32,
+) -> Pipeline:
+    """
+    Resize the recursion layers of a pipeline (all layers but the base layer) until
+    each layer's trace length matches the estimated size of the verifier it runs.
+
+    Layers are updated in order, so that every layer sees the resized layer below it.
+    Aggregation trees verify proofs of their own layer, which is why we iterate.
+    """
+    layers = list(pipeline.get_layers())
+
+    for _ in range(max_iterations):
+        changed = False
+        for i in range(1, len(layers)):
+            verifier_cost = Pipeline(layers).get_arithmetized_verifier_cost(i)
+            trace_length = model.get_trace_length(verifier_cost)
+            if trace_length != layers[i].circuit.pcs.get_trace_length():
+                layers[i] = replace(layers[i], circuit=get_circuit_for_trace_length(layers[i].circuit, trace_length))
+                changed = True
+        if not changed:
+            return Pipeline(layers, num_segments=pipeline.num_segments)
+
+    raise ValueError(f"Verifier circuit sizes did not converge within {max_iterations} iterations")
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+from dataclasses import replace
 from pathlib import Path
 
 import toml
 
 from soundcalc.common.fields import FieldParams, parse_field
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
 from soundcalc.lookups.logup import LogUp, LogUpConfig, LogUpType
-from soundcalc.pcs.fri import FRI, FRIConfig
+from soundcalc.pcs.fri import FRI, CommitmentGroup, FRIConfig
 from soundcalc.pcs.pcs import PCS
 from soundcalc.pcs.jagged import JaggedPCS, JaggedConfig
+from soundcalc.pcs.stir import STIR, STIRConfig
 from soundcalc.pcs.whir import WHIR, WHIRConfig
 from soundcalc.zkvms.circuit import Circuit, CircuitConfig
+from soundcalc.zkvms.circuit_table import CircuitTable
+from soundcalc.zkvms.pipeline import Pipeline
+from soundcalc.zkvms.verifier_circuit import VerifierCircuitModel
 
 
 def _parse_lookups_from_toml(section: dict, field: FieldParams) -> list[LogUp]:
@@ -36,15 +42,45 @@ def _parse_lookups_from_toml(section: dict, field: FieldParams) -> list[LogUp]:
     return lookups
 
 
+def _parse_commitment_groups_from_toml(section: dict) -> list[CommitmentGroup] | None:
+    """Parse the optional Merkle commitment groups from a circuit section in the TOML config."""
+    if "commitment_groups" not in section:
+        return None
+    return [
+        CommitmentGroup(name=group_section["name"], width=group_section["width"])
+        for group_section in section["commitment_groups"]
+    ]
+
+
+def _parse_pipeline_from_toml(config: dict, circuits: list[Circuit]) -> Pipeline | None:
+    """Parse the optional recursion pipeline from the TOML config."""
+    if "pipeline" not in config:
+        return None
+    return Pipeline.from_toml_config(config["pipeline"], circuits)
+
+
+def _parse_verifier_circuit_model_from_toml(config: dict) -> VerifierCircuitModel | None:
+    """Parse the optional verifier circuit model fitted to the recursion layers of the zkVM."""
+    section = config.get("pipeline", {}).get("verifier_circuit")
+    if section is None:
+        return None
+    return VerifierCircuitModel.from_toml_config(section)
+
+
 class zkVM:
     """
-    A class modeling a zkVM, which contains one or more circuits.
+    A class modeling a zkVM, which contains one or more circuits,
+    optionally arranged in a recursion pipeline.
     """
 
-    def __init__(self, name: str, circuits: list[Circuit], version: str | None = None):
+    def __init__(self, name: str, circuits: list[Circuit], version: str | None = None,
+                 pipeline: Pipeline | None = None, verifier_circuit_model: VerifierCircuitModel | None = None):
         self._name = name
         self._circuits = circuits
         self.version = version
+        self.pipeline = pipeline
+        # Model of the recursion verifier circuits, if fitted for this zkVM
+        self.verifier_circuit_model = verifier_circuit_model
 
     def get_name(self) -> str:
         """Returns the name of the zkVM."""
@@ -54,6 +90,37 @@ class zkVM:
         """Returns the list of circuits in this zkVM."""
         return self._circuits
 
+    def get_final_circuit(self) -> Circuit:
+        """
+        Returns the circuit producing the final proof: the last layer of the
+        pipeline if one is declared, otherwise the last circuit.
+        """
+        if self.pipeline is not None:
+            return self.pipeline.get_final_circuit()
+        return self._circuits[-1]
+
+    def get_grinding_work(self) -> float:
+        """Returns the expected number of proof-of-work hashes for one proof of every circuit."""
+        return sum(circuit.get_grinding_work() for circuit in self._circuits)
+
+    def get_grinding_seconds(self, profile: ThroughputProfile = DEFAULT_THROUGHPUT) -> float:
+        """Returns the expected grinding time in seconds for one proof of every circuit."""
+        return sum(circuit.get_grinding_seconds(profile) for circuit in self._circuits)
+
+    def with_regimes(self, regimes: list[str]) -> "zkVM":
+        """
+        Returns a copy of this zkVM whose circuits (including those of the pipeline)
+        are analyzed in the given regimes, see `parse_regime`.
+        """
+        circuits = [Circuit(replace(circuit.config, regimes=regimes)) for circuit in self._circuits]
+        pipeline = None
+        if self.pipeline is not None:
+            by_name = {circuit.get_name(): circuit for circuit in circuits}
+            layers = [replace(layer, circuit=by_name[layer.get_name()]) for layer in self.pipeline.get_layers()]
+            pipeline = Pipeline(layers, self.pipeline.num_segments)
+        return zkVM(self._name, circuits, version=self.version, pipeline=pipeline,
+                    verifier_circuit_model=self.verifier_circuit_model)
+
     @classmethod
     def load_from_toml(cls, toml_path: Path) -> "zkVM":
         """
@@ -68,11 +135,24 @@ class zkVM:
             return cls._load_fri_from_toml(config)
         elif protocol_family == "WHIR":
             return cls._load_whir_from_toml(config)
+        elif protocol_family == "STIR":
+            return cls._load_stir_from_toml(config)
         elif protocol_family == "JAGGED":
             return cls._load_jagged_from_toml(config)
         else:
             raise ValueError(f"Unknown protocol_family: {protocol_family}")
 
+    @staticmethod
+    def load_circuit_table_from_toml(toml_path: Path) -> CircuitTable:
+        """
+        Load the circuits of a FRI-based VM from a TOML configuration file
+        into a compact columnar `CircuitTable`.
+        """
+        with open(toml_path, "r") as f:
+            config = toml.load(f)
+
+        return CircuitTable.from_toml_config(config)
+
     @classmethod
     def _load_fri_from_toml(cls, config: dict) -> "zkVM":
         """
@@ -84,6 +164,8 @@ class zkVM:
         for section in config.get("circuits", []):
             pcs = FRI(FRIConfig(
                 hash_size_bits=config["zkevm"]["hash_size_bits"],
+                merkle_arity=config["zkevm"].get("merkle_arity", 2),
+                merkle_cap_height=config["zkevm"].get("merkle_cap_height", 0),
                 rho=section["rho"],
                 gap_to_radius=section.get("gap_to_radius"),
                 trace_length=section["trace_length"],
@@ -97,6 +179,7 @@ class zkVM:
                 grinding_query_phase=section.get("grinding_query_phase", 0),
                 grinding_commit_phase=section.get("grinding_commit_phase", 0),
                 grinding_batching_phase=section.get("grinding_batching_phase", 0),
+                commitment_groups=_parse_commitment_groups_from_toml(section),
             ))
             lookups = _parse_lookups_from_toml(section, field)
             circuit = Circuit(CircuitConfig(
@@ -111,11 +194,15 @@ class zkVM:
                 grinding_deep=section.get("grinding_deep", 0),
                 multilinear_zerocheck = section.get("multilinear_zerocheck", False),
                 udr_only = section.get("udr_only", False),
+                regimes=config["zkevm"].get("regimes"),
+                hash_name=config["zkevm"].get("hash"),
             ))
             circuits.append(circuit)
 
         return cls(config["zkevm"]["name"], circuits=circuits,
-                   version=config["zkevm"].get("version"))
+                   version=config["zkevm"].get("version"),
+                   pipeline=_parse_pipeline_from_toml(config, circuits),
+                   verifier_circuit_model=_parse_verifier_circuit_model_from_toml(config))
 
     @classmethod
     def _load_whir_from_toml(cls, config: dict) -> "zkVM":
@@ -128,6 +215,8 @@ class zkVM:
         for section in config.get("circuits", []):
             pcs = WHIR(WHIRConfig(
                 hash_size_bits=config["zkevm"]["hash_size_bits"],
+                merkle_arity=config["zkevm"].get("merkle_arity", 2),
+                merkle_cap_height=config["zkevm"].get("merkle_cap_height", 0),
                 log_inv_rate=section["log_inv_rate"],
                 num_iterations=section["num_iterations"],
                 folding_factor=section["folding_factor"],
@@ -152,12 +241,63 @@ class zkVM:
                 gap_to_radius=section.get("gap_to_radius"),
                 multilinear_zerocheck = section.get("multilinear_zerocheck", False),
                 udr_only = section.get("udr_only", False),
+                regimes=config["zkevm"].get("regimes"),
+                hash_name=config["zkevm"].get("hash"),
+                lookups=lookups if lookups else None,
+            ))
+            circuits.append(circuit)
+
+        return cls(config["zkevm"]["name"], circuits=circuits,
+                   version=config["zkevm"].get("version"),
+                   pipeline=_parse_pipeline_from_toml(config, circuits),
+                   verifier_circuit_model=_parse_verifier_circuit_model_from_toml(config))
+
+    @classmethod
+    def _load_stir_from_toml(cls, config: dict) -> "zkVM":
+        """
+        Load a STIR-based VM from a parsed TOML config dict.
+        """
+        field = parse_field(config["zkevm"]["field"])
+        circuits = []
+
+        for section in config.get("circuits", []):
+            pcs = STIR(STIRConfig(
+                hash_size_bits=config["zkevm"]["hash_size_bits"],
+                merkle_arity=config["zkevm"].get("merkle_arity", 2),
+                merkle_cap_height=config["zkevm"].get("merkle_cap_height", 0),
+                log_inv_rate=section["log_inv_rate"],
+                num_iterations=section["num_iterations"],
+                folding_factor=section["folding_factor"],
+                field=field,
+                gap_to_radius=section.get("gap_to_radius"),
+                log_degree=section["log_degree"],
+                batch_size=section["batch_size"],
+                power_batching=section["power_batching"],
+                grinding_batching_phase=section["grinding_batching_phase"],
+                num_queries=section["num_queries"],
+                num_ood_samples=section["num_ood_samples"],
+                grinding_bits_folding=section["grinding_bits_folding"],
+                grinding_bits_queries=section["grinding_bits_queries"],
+                grinding_bits_ood=section["grinding_bits_ood"],
+            ))
+            lookups = _parse_lookups_from_toml(section, field)
+            circuit = Circuit(CircuitConfig(
+                name=section["name"],
+                pcs=pcs,
+                field=field,
+                gap_to_radius=section.get("gap_to_radius"),
+                multilinear_zerocheck = section.get("multilinear_zerocheck", False),
+                udr_only = section.get("udr_only", False),
+                regimes=config["zkevm"].get("regimes"),
+                hash_name=config["zkevm"].get("hash"),
                 lookups=lookups if lookups else None,
             ))
             circuits.append(circuit)
 
         return cls(config["zkevm"]["name"], circuits=circuits,
-                   version=config["zkevm"].get("version"))
+                   version=config["zkevm"].get("version"),
+                   pipeline=_parse_pipeline_from_toml(config, circuits),
+                   verifier_circuit_model=_parse_verifier_circuit_model_from_toml(config))
 
     @classmethod
     def _load_jagged_from_toml(cls, config: dict) -> "zkVM":
@@ -170,6 +310,8 @@ class zkVM:
         for section in config.get("circuits", []):
             dense_pcs = FRI(FRIConfig(
                 hash_size_bits=config["zkevm"]["hash_size_bits"],
+                merkle_arity=config["zkevm"].get("merkle_arity", 2),
+                merkle_cap_height=config["zkevm"].get("merkle_cap_height", 0),
                 rho=section["rho"],
                 gap_to_radius=section.get("gap_to_radius"),
                 trace_length=section["dense_length"],
@@ -181,6 +323,7 @@ class zkVM:
                 FRI_folding_factors=section.get("fri_folding_factors"),
                 FRI_early_stop_degree=section.get("fri_early_stop_degree"),
                 grinding_query_phase=section.get("grinding_query_phase", 0),
+                commitment_groups=_parse_commitment_groups_from_toml(section),
             ))
             pcs = JaggedPCS(JaggedConfig(
                 dense_pcs = dense_pcs,
@@ -198,9 +341,13 @@ class zkVM:
                 max_combo=section["opening_points"],
                 multilinear_zerocheck = section.get("multilinear_zerocheck", False),
                 udr_only = section.get("udr_only", False),
+                regimes=config["zkevm"].get("regimes"),
+                hash_name=config["zkevm"].get("hash"),
                 lookups=lookups if lookups else None,
             ))
             circuits.append(circuit)
 
         return cls(config["zkevm"]["name"], circuits=circuits,
-                   version=config["zkevm"].get("version"))
+                   version=config["zkevm"].get("version"),
+                   pipeline=_parse_pipeline_from_toml(config, circuits),
+                   verifier_circuit_model=_parse_verifier_circuit_model_from_toml(config))
@@ -2,3 +2,50 @@ import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from soundcalc.common.fields import GOLDILOCKS_3
+from soundcalc.pcs.fri import FRI, FRIConfig
+from soundcalc.zkvms.circuit import Circuit, CircuitConfig
+
+
+def make_fri_config(**overrides) -> FRIConfig:
+    """
+    A small FRI config shared by the tests.
+    Domain size D = 1024 / 0.5 = 2048, folded by [4, 4, 4] down to 32.
+    """
+    params = dict(
+        hash_size_bits=256,
+        rho=0.5,
+        trace_length=1024,
+        field=GOLDILOCKS_3,
+        batch_size=10,
+        power_batching=True,
+        multilinear_batching=False,
+        num_queries=50,
+        FRI_folding_factors=[4, 4, 4],
+        FRI_early_stop_degree=32,
+        grinding_query_phase=16,
+        grinding_commit_phase=4,
+    )
+    params.update(overrides)
+    return FRIConfig(**params)
+
+
+def make_circuit(field=GOLDILOCKS_3, **overrides) -> Circuit:
+    """
+    A FRI circuit with DEEP-ALI parameters and a trace of 2^20 rows, shared by the tests.
+    Overrides go to the FRI config, except `udr_only`.
+    """
+    fri_overrides = dict(field=field, trace_length=2**20, num_queries=80)
+    fri_overrides.update({k: v for k, v in overrides.items() if k != "udr_only"})
+    # Fold 2^21 down to 32
+    fri_overrides.setdefault("FRI_folding_factors", [4] * 8)
+    return Circuit(CircuitConfig(
+        name="test",
+        pcs=FRI(make_fri_config(**fri_overrides)),
+        field=field,
+        num_constraints=100,
+        AIR_max_degree=3,
+        max_combo=2,
+        udr_only=overrides.get("udr_only", False),
+    ))
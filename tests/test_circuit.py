@@ -1,12 +1,17 @@
 import math
+import random
+
 import pytest
 
 from soundcalc.common.fields import BABYBEAR_4
+from soundcalc.costs.prover import ProverCost, ProverMemory
+from soundcalc.costs.verifier import VerifierCost
 from soundcalc.pcs.pcs import PCS
 from soundcalc.zkvms.circuit import Circuit, CircuitConfig
 from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
 from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
-from soundcalc.lookups.logup import LogUp, LogUpConfig, LogUpType
+from soundcalc.lookups import logup
+from soundcalc.lookups.logup import LogUp, LogUpConfig, LogUpType, get_soundness_bits_for_lookups
 
 
 class DummyPCS(PCS):
@@ -24,6 +29,18 @@ class DummyPCS(PCS):
     def get_expected_proof_size_bits(self) -> int:
         return 0
 
+    def get_grinding_bits(self) -> list[int]:
+        return []
+
+    def get_prover_cost(self) -> ProverCost:
+        return ProverCost()
+
+    def get_prover_memory(self) -> ProverMemory:
+        return ProverMemory()
+
+    def get_verifier_cost(self, expected: bool = True) -> VerifierCost:
+        return VerifierCost()
+
     def get_rate(self) -> float:
         return self._rate
 
@@ -138,3 +155,49 @@ def test_grinding_adds_security_bits_additively():
     assert abs(diff - grinding_bits) <= 1, (
         f"Expected grinding to add ~{grinding_bits} bits, but got {diff}"
     )
+
+
+def test_logup_batch_matches_single_lookups():
+    """The batch evaluator must agree with evaluating each lookup on its own."""
+    configs = [
+        LogUpConfig(name="uni", field=BABYBEAR_4, logup_type=LogUpType.UNIVARIATE,
+                    rows_L=1 << 20, rows_T=1 << 16, num_columns_S=3, num_lookups_M=2,
+                    grinding_bits_lookup=5),
+        LogUpConfig(name="multi", field=BABYBEAR_4, logup_type=LogUpType.MULTIVARIATE,
+                    rows_L=1 << 22, rows_T=0, num_columns_S=107, num_lookups_M=1900,
+                    grinding_bits_lookup=12, multilinear_fingerprint=True),
+        LogUpConfig(name="multi_H", field=BABYBEAR_4, logup_type=LogUpType.MULTIVARIATE,
+                    rows_L=1 << 20, rows_T=1 << 20, num_columns_S=6,
+                    alphabet_size_H=1 << 18, reduction_error=2**-100),
+    ]
+    lookups = [LogUp(config) for config in configs]
+
+    assert get_soundness_bits_for_lookups(lookups) == [lookup.get_soundness_bits() for lookup in lookups]
+    assert get_soundness_bits_for_lookups([]) == []
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_logup_batch_matches_random_lookups(monkeypatch, use_numpy):
+    """Both the array pass and the scalar fallback must agree with the single lookups."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(logup, "np", None)
+
+    rng = random.Random(0)
+    configs = [
+        LogUpConfig(
+            name=f"lookup {i}", field=BABYBEAR_4,
+            logup_type=rng.choice([LogUpType.UNIVARIATE, LogUpType.MULTIVARIATE]),
+            rows_L=1 << rng.randint(10, 24), rows_T=rng.choice([0, 1 << rng.randint(8, 24)]),
+            num_columns_S=rng.randint(1, 200), num_lookups_M=rng.randint(1, 5000),
+            alphabet_size_H=rng.choice([None, 1 << rng.randint(8, 30)]),
+            grinding_bits_lookup=rng.randint(0, 20),
+            multilinear_fingerprint=rng.random() < 0.5,
+            reduction_error=rng.choice([0.0, 2.0 ** -rng.randint(60, 120)]),
+        )
+        for i in range(200)
+    ]
+    lookups = [LogUp(config) for config in configs]
+
+    assert get_soundness_bits_for_lookups(lookups) == [lookup.get_soundness_bits() for lookup in lookups]
@@ -0,0 +1,124 @@
+# tests/test_circuit_table.py
+"""Tests for the columnar CircuitTable representation."""
+
+import random
+import tracemalloc
+from pathlib import Path
+
+import pytest
+import toml
+
+from soundcalc.zkvms import circuit_table
+from soundcalc.zkvms.circuit_table import CircuitTable
+from soundcalc.zkvms.zkvm import zkVM
+
+ZISK_TOML = Path(__file__).parent.parent / "soundcalc" / "zkvms" / "zisk" / "zisk.toml"
+
+
+def test_circuit_table_matches_circuit_objects():
+    """The table must reproduce exactly what the object-based loader computes."""
+    zkvm = zkVM.load_from_toml(ZISK_TOML)
+    table = zkVM.load_circuit_table_from_toml(ZISK_TOML)
+    circuits = zkvm.get_circuits()
+
+    assert len(table) == len(circuits)
+    assert table.get_proof_size_bits() == [c.get_proof_size_bits() for c in circuits]
+    assert table.get_proof_size_bits(expected=True) == [c.get_expected_proof_size_bits() for c in circuits]
+    assert table.get_security_levels() == [c.get_security_levels() for c in circuits]
+
+    for i, circuit in enumerate(circuits):
+        assert table.get_circuit(i).get_parameter_summary() == circuit.get_parameter_summary()
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_circuit_table_security_levels_match_random_circuits(monkeypatch, use_numpy):
+    """The columnar evaluator and the per-row fallback must agree with materialized circuits."""
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(circuit_table, "np", None)
+
+    with open(ZISK_TOML, "r") as f:
+        config = toml.load(f)
+    config["zkevm"]["regimes"] = ["UDR", "JBR", "CONJ", "CONJ:0.01"]
+    template = config["circuits"][0]
+
+    rng = random.Random(0)
+    sections = []
+    for i in range(100):
+        section = dict(template, name=f"circuit {i}")
+        section["rho"] = 2.0 ** -rng.randint(1, 4)
+        section["trace_length"] = 1 << rng.randint(16, 22)
+        section["fri_folding_factors"] = [rng.choice([2, 4, 8, 16]) for _ in range(rng.randint(0, 4))]
+        domain_size = int(section["trace_length"] / section["rho"])
+        for folding_factor in section["fri_folding_factors"]:
+            domain_size //= folding_factor
+        section["fri_early_stop_degree"] = domain_size
+        section["batch_size"] = rng.randint(1, 200)
+        section["num_queries"] = rng.randint(20, 200)
+        section["power_batching"] = rng.random() < 0.5
+        section["multilinear_batching"] = not section["power_batching"] and rng.random() < 0.5
+        section["multilinear_zerocheck"] = rng.random() < 0.2
+        section["udr_only"] = section["multilinear_zerocheck"] or rng.random() < 0.2
+        section["gap_to_radius"] = rng.choice([None, 0.005, 0.01])
+        if section["gap_to_radius"] is None:
+            del section["gap_to_radius"]
+        for phase in ["query_phase", "commit_phase", "batching_phase"]:
+            section[f"grinding_{phase}"] = rng.randint(0, 20)
+        section["grinding_deep"] = rng.randint(0, 20)
+        sections.append(section)
+    config["circuits"] = sections
+
+    table = CircuitTable.from_toml_config(config)
+    expected = [table.get_circuit(i).get_security_levels() for i in range(len(table))]
+    assert table.get_security_levels() == expected
+
+
+def test_circuit_table_is_compact():
+    """The table should use an order of magnitude less memory than circuit objects in a sweep-sized config."""
+    with open(ZISK_TOML, "r") as f:
+        config = toml.load(f)
+    config["circuits"] = config["circuits"] * 20
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    zkvm = zkVM._load_fri_from_toml(config)
+    objects_size = tracemalloc.get_traced_memory()[0] - before
+    del zkvm
+
+    before = tracemalloc.get_traced_memory()[0]
+    table = CircuitTable.from_toml_config(config)
+    table_size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert len(table) == len(config["circuits"])
+    assert table_size * 10 <= objects_size, f"table: {table_size} B, objects: {objects_size} B"
+
+
+def test_circuit_table_lookup_bits_match_logup_objects():
+    zkvm = zkVM.load_from_toml(ZISK_TOML)
+    table = zkVM.load_circuit_table_from_toml(ZISK_TOML)
+
+    expected = [
+        {lookup.get_name(): lookup.get_soundness_bits() for lookup in circuit.get_lookups()}
+        for circuit in zkvm.get_circuits()
+    ]
+    assert table.get_lookup_soundness_bits() == expected
+
+
+def test_circuit_table_commitment_groups():
+    with open(ZISK_TOML, "r") as f:
+        config = toml.load(f)
+    section = config["circuits"][0]
+    section["commitment_groups"] = [
+        {"name": "main", "width": section["batch_size"] - 1},
+        {"name": "quotient", "width": 1},
+    ]
+
+    circuit = zkVM._load_fri_from_toml(config).get_circuits()[0]
+    table = CircuitTable.from_toml_config(config)
+
+    assert [group.name for group in circuit.pcs.commitment_groups] == ["main", "quotient"]
+    assert table.get_commitment_groups(1) is None
+    assert table.get_proof_size_bits(expected=True)[0] == circuit.get_expected_proof_size_bits()
+    assert table.get_circuit(0).get_verifier_cost() == circuit.get_verifier_cost()
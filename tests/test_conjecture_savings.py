@@ -0,0 +1,60 @@
+# tests/test_conjecture_savings.py
+"""Tests for the conjectured up-to-capacity regime and its savings."""
+
+import math
+
+import pytest
+
+from soundcalc.common.fields import GOLDILOCKS_3
+from soundcalc.proxgaps.conjectured import ConjecturedRegime
+from soundcalc.zkvms import dummy_stir
+from soundcalc.zkvms.conjecture_savings import get_conjecture_savings
+from tests.conftest import make_circuit
+
+
+def test_conjectured_regime():
+    regime = ConjecturedRegime(GOLDILOCKS_3, eta=0.01)
+    assert regime.identifier() == "CONJ"
+    assert math.isclose(regime.get_proximity_parameter(0.5, 2**20), 0.49)
+    assert math.isclose(regime.get_max_list_size(0.5, 2**20), 2**21 / 0.01)
+    assert math.isclose(regime.get_log_error_linear(0.5, 2**20), math.log2(2**21 / 0.01) - math.log2(GOLDILOCKS_3.F))
+    assert regime.get_log_error_powers(0.5, 2**20, 5) == regime.get_log_error_linear(0.5, 2**20) + 2
+
+    # By default, eta is rate / 20
+    assert math.isclose(ConjecturedRegime(GOLDILOCKS_3).get_proximity_parameter(0.5, 2**20), 1 - 0.5 * 1.05)
+
+
+def test_pluggable_formulas():
+    regime = ConjecturedRegime(
+        GOLDILOCKS_3,
+        eta=0.01,
+        list_size_formula=lambda rate, dimension, eta: 1,
+        error_formula=lambda rate, dimension, eta: dimension,
+        name="MyConjecture",
+    )
+    assert regime.identifier() == "MyConjecture"
+    assert regime.get_max_list_size(0.5, 2**20) == 1
+    assert regime.get_log_error_linear(0.5, 2**20) == 20 - math.log2(GOLDILOCKS_3.F)
+
+
+def test_savings_keep_security():
+    circuit = make_circuit()
+    savings = get_conjecture_savings(circuit)
+
+    assert savings.regime == "JBR"
+    assert savings.target_bits == circuit.get_security_levels()["JBR"]["total"]
+    assert savings.circuit.get_regime_security_levels(savings.conjecture)["total"] >= savings.target_bits
+    assert savings.get_queries_saved() > 0
+    assert savings.get_proof_size_bits_saved() > 0
+    assert 0 < savings.get_eta() < 1 - circuit.pcs.get_rate()
+
+    # A given conjecture is used as is
+    conjecture = ConjecturedRegime(circuit.field, eta=0.05)
+    assert get_conjecture_savings(circuit, conjecture).conjecture is conjecture
+
+
+def test_unreachable_target_is_rejected():
+    with pytest.raises(ValueError):
+        get_conjecture_savings(make_circuit(), target_bits=1000)
+    with pytest.raises(ValueError):
+        get_conjecture_savings(dummy_stir.load().get_circuits()[0])
@@ -0,0 +1,85 @@
+# tests/test_contour_sweep.py
+"""Tests for the adaptive contour-tracing sweep."""
+
+import pytest
+
+from soundcalc.sweep import parse_axis
+from soundcalc.zkvms import dummy_whir
+from soundcalc.zkvms.contour_sweep import get_sweep_axis, log_inv_rate_axis, pcs_config_axis, trace_security_contour
+from tests.conftest import make_circuit
+
+
+def _brute_force_contour(circuit, x_axis, y_axis, target_bits, regime):
+    """The contour of a uniform sweep over all grid points."""
+    def reaches(i, j):
+        try:
+            variant = y_axis.apply(x_axis.apply(circuit, x_axis.values[i]), y_axis.values[j])
+            return variant.get_security_levels()[regime]["total"] >= target_bits
+        except (AssertionError, ValueError):
+            return False
+
+    nx, ny = len(x_axis.values), len(y_axis.values)
+    grid = {(i, j): reaches(i, j) for i in range(nx) for j in range(ny)}
+    return [
+        (x_axis.values[i], y_axis.values[j])
+        for (i, j), reached in sorted(grid.items())
+        if reached and any(not grid.get(n, True) for n in [(i - 1, j), (i + 1, j), (i, j - 1), (i, j + 1)])
+    ]
+
+
+def test_contour_matches_uniform_sweep():
+    circuit = make_circuit()
+    x_axis = get_sweep_axis("num_queries", list(range(1, 129)))
+    y_axis = get_sweep_axis("log_inv_rate", list(range(1, 5)))
+    target_bits = circuit.get_security_levels()["JBR"]["total"] - 10
+
+    sweep = trace_security_contour(circuit, x_axis, y_axis, target_bits)
+
+    assert sweep.regime == "JBR"
+    assert sweep.get_contour()
+    assert sweep.get_contour() == _brute_force_contour(circuit, x_axis, y_axis, target_bits, "JBR")
+    assert sweep.get_evaluation_fraction() < 0.5
+
+
+def test_contour_is_monotone_in_queries_and_grinding():
+    circuit = make_circuit()
+    x_axis = get_sweep_axis("grinding_query_phase", list(range(0, 33)))
+    y_axis = get_sweep_axis("num_queries", list(range(1, 257)))
+    target_bits = circuit.get_security_levels()["JBR"]["total"] - 10
+
+    sweep = trace_security_contour(circuit, x_axis, y_axis, target_bits)
+
+    # More grinding never needs more queries
+    min_queries = {}
+    for grinding, num_queries in sweep.get_contour():
+        min_queries[grinding] = min(num_queries, min_queries.get(grinding, num_queries))
+    assert list(min_queries.values()) == sorted(min_queries.values(), reverse=True)
+    assert sweep.get_evaluation_fraction() < 0.1
+
+
+def test_contour_whir():
+    circuit = dummy_whir.load().get_circuits()[0]
+    # The final check is the weakest component, so sweep the queries of the last iteration
+    num_queries = circuit.pcs.num_queries
+    x_axis = pcs_config_axis("num_queries", [num_queries[:-1] + [count] for count in range(1, 65)])
+    y_axis = log_inv_rate_axis([1, 2, 3, 4, 5, 6])
+
+    sweep = trace_security_contour(circuit, x_axis, y_axis, 33, "UDR")
+
+    assert sweep.get_contour()
+    assert sweep.get_contour() == _brute_force_contour(circuit, x_axis, y_axis, 33, "UDR")
+
+
+def test_parse_axis():
+    assert parse_axis("num_queries=1:9:4").values == [1, 5, 9]
+    assert parse_axis("log_inv_rate=1,3").values == [1, 3]
+    with pytest.raises(ValueError):
+        parse_axis("num_queries")
+
+
+def test_unknown_regime_is_rejected():
+    circuit = make_circuit()
+    x_axis = get_sweep_axis("num_queries", list(range(1, 9)))
+    y_axis = get_sweep_axis("log_inv_rate", [1, 2])
+    with pytest.raises(ValueError):
+        trace_security_contour(circuit, x_axis, y_axis, 100, "CONJ")
@@ -0,0 +1,148 @@
+# tests/test_costs.py
+"""Tests for the prover/verifier cost models."""
+
+import math
+
+import pytest
+
+from soundcalc.calibrate import _goldilocks_mul_numpy, calibrate
+from soundcalc import report_md
+from soundcalc.common.fields import BABYBEAR_4, GOLDILOCKS_3, GOLDILOCKS_P, parse_field
+from soundcalc.costs.throughput import DEFAULT_THROUGHPUT, ThroughputProfile
+from soundcalc.main import _load_throughput_profile
+from soundcalc.pcs.fri import FRI
+from soundcalc.zkvms.zkvm import zkVM
+from tests.conftest import make_circuit, make_fri_config
+
+
+def test_fri_prover_cost():
+    cost = FRI(make_fri_config()).get_prover_cost()
+
+    # 10 columns: NTT of size 1024 (interpolate) and 2048 (evaluate)
+    assert cost.lde_field_mults == 10 * (512 * 10 + 1024 * 11)
+
+    # Initial tree: leaves of 10 * 64 bits fit into 2 compressions
+    # Folding trees: leaves of 4 * 192 bits fit into 2 compressions
+    assert cost.merkle_leaf_compressions == 2048 * 2 + (512 + 128 + 32) * 2
+    assert cost.merkle_node_compressions == (2048 - 1) + (512 - 1) + (128 - 1) + (32 - 1)
+
+    # Batching (ext x base = 3), folding (ext x ext = 9), final interpolation of 32 points
+    assert cost.commit_field_mults == 10 * 2048 * 3 + (2048 + 512 + 128) * 9 + 16 * 5 * 3
+
+    # Query grinding plus commit grinding in each of the 3 rounds
+    assert cost.grinding_hashes == 2**16 + 3 * 2**4
+
+
+def test_prover_seconds_grow_with_blowup():
+    base = FRI(make_fri_config())
+    blown_up = FRI(make_fri_config(rho=0.25, FRI_early_stop_degree=64))
+
+    seconds = base.get_prover_cost().get_seconds(GOLDILOCKS_3)
+    assert seconds > 0
+    assert blown_up.get_prover_cost().get_seconds(GOLDILOCKS_3) > seconds
+    assert math.isclose(
+        sum(base.get_prover_cost().get_seconds_breakdown(GOLDILOCKS_3).values()), seconds
+    )
+
+
+def test_fri_prover_memory():
+    memory = FRI(make_fri_config()).get_prover_memory()
+
+    # 10 base field columns on the domain of size 2048
+    assert memory.lde_bits == 2048 * 10 * 64
+    # Codewords committed in the three folding rounds (extension field)
+    assert memory.codeword_bits == (2048 + 512 + 128) * 192
+    # Initial tree over 2048 leaves, then trees over 512, 128, 32 leaves
+    assert memory.merkle_bits == 256 * ((2 * 2048 - 1) + (2 * 512 - 1) + (2 * 128 - 1) + (2 * 32 - 1))
+    assert memory.get_peak_bits() == memory.lde_bits + memory.merkle_bits + memory.codeword_bits
+
+
+def test_fri_verifier_cost_worst_case():
+    fri = FRI(make_fri_config())
+    cost = fri.get_verifier_cost(expected=False)
+
+    # Per query: hash the leaf and recompute the path, in each of the 4 trees.
+    # As in the proof size, opened symbols count as extension field elements: the initial
+    # leaves of 10 * 192 bits take 4 compressions, the folding leaves of 4 * 192 bits take 2
+    per_query_compressions = (4 + 11) + (2 + 9) + (2 + 7) + (2 + 5)
+    assert cost.hash_compressions == 50 * per_query_compressions
+
+    # Per query: combine 10 columns, fold 3 cosets of size 4, evaluate the final polynomial (16 coefficients)
+    assert cost.ext_field_mults == 50 * (10 + 3 * 4 * 3 + 16)
+
+    # Sharing Merkle paths can only help
+    assert fri.get_verifier_cost(expected=True).hash_compressions <= cost.hash_compressions
+
+
+def test_throughput_profile_roundtrip(tmp_path):
+    path = tmp_path / "profile.json"
+    DEFAULT_THROUGHPUT.save(path, metadata={"note": "test"})
+    assert ThroughputProfile.load(path) == DEFAULT_THROUGHPUT
+
+
+def test_loaded_profile_keeps_grinding_rate(tmp_path):
+    profile = ThroughputProfile(
+        name="calibrated",
+        field_mults_per_second={GOLDILOCKS_P: 1e9},
+        hash_compressions_per_second=1e7,
+        grinding_hashes_per_second=5e8,
+    )
+    path = tmp_path / "profile.json"
+    profile.save(path)
+
+    loaded = _load_throughput_profile(str(path))
+    assert loaded.grinding_hashes_per_second == 5e8
+    assert loaded.hash_compressions_per_second == 1e7
+    # Fields the profile does not cover fall back to the default profile
+    assert loaded.field_mults_per_second == DEFAULT_THROUGHPUT.field_mults_per_second | {GOLDILOCKS_P: 1e9}
+
+
+def test_hash_rate_by_name():
+    profile = ThroughputProfile(
+        name="test",
+        field_mults_per_second={GOLDILOCKS_P: 1e9},
+        hash_compressions_per_second=1e6,
+        hash_compressions_per_second_by_hash={"blake2s": 4e6},
+    )
+    assert profile.hash_compressions_to_seconds(4e6, "blake2s") == 1
+    # Hashes without an entry (or no hash at all) use the default rate
+    assert profile.hash_compressions_to_seconds(4e6, "sha256") == 4
+    assert profile.hash_compressions_to_seconds(4e6) == 4
+    assert ThroughputProfile.from_dict(profile.to_dict()) == profile
+
+    cost = FRI(make_fri_config()).get_prover_cost()
+    breakdown = cost.get_seconds_breakdown(GOLDILOCKS_3, profile, "blake2s")
+    assert breakdown["Merkle"] == pytest.approx(cost.get_hash_compressions() / 4e6)
+
+
+def test_custom_prime_falls_back_to_word_size():
+    # Primes without an entry use the slowest entry of the same word size
+    assert DEFAULT_THROUGHPUT.get_field_mults_per_second(parse_field("p=4294967291^3")) == 8e8
+    assert DEFAULT_THROUGHPUT.get_field_mults_per_second(parse_field("p=18446744073709551557^2")) == 4e8
+
+    # A 32-bit prime with 2-adicity 30, as a field sweep would configure it
+    field = parse_field("p=3221225473^4")
+    circuit = make_circuit(field=field)
+    seconds = circuit.get_prover_seconds()
+    assert seconds == pytest.approx(make_circuit(field=BABYBEAR_4).get_prover_seconds(), rel=0.1)
+    assert "Prover Time" in report_md._build_zkvm_report(zkVM("custom", circuits=[circuit]))
+
+
+def test_calibrate_produces_usable_profile():
+    profile, metadata = calibrate("sha256", iterations=200, repeats=1, seed=0, verbose=False)
+    assert profile.hash_compressions_per_second > 0
+    assert profile.hash_compressions_per_second_by_hash["sha256"] == profile.hash_compressions_per_second
+    assert profile.get_field_mults_per_second(GOLDILOCKS_3) > 0
+    assert metadata["hash"] == "sha256"
+
+    fri = FRI(make_fri_config())
+    assert fri.get_prover_cost().get_seconds(GOLDILOCKS_3, profile) > 0
+
+
+def test_goldilocks_numpy_multiplication():
+    np = pytest.importorskip("numpy")
+
+    a = [0, 1, 2**32, GOLDILOCKS_P - 1, GOLDILOCKS_P - 1, 0xDEADBEEF12345678 % GOLDILOCKS_P]
+    b = [5, GOLDILOCKS_P - 1, 2**32, GOLDILOCKS_P - 1, 2, 0x0123456789ABCDEF]
+    result = _goldilocks_mul_numpy(np.array(a, dtype=np.uint64), np.array(b, dtype=np.uint64))
+    assert [int(r) % GOLDILOCKS_P for r in result] == [x * y % GOLDILOCKS_P for x, y in zip(a, b)]
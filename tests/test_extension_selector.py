@@ -0,0 +1,65 @@
+# tests/test_extension_selector.py
+"""Tests for the extension degree selector."""
+
+import pytest
+
+from soundcalc.common.fields import BABYBEAR_4, BABYBEAR_5, BABYBEAR_P, GOLDILOCKS_3, get_extension_field
+from soundcalc.lookups.logup import LogUp, LogUpConfig, LogUpType
+from soundcalc.pcs.fri import FRI
+from soundcalc.zkvms.circuit import Circuit, CircuitConfig
+from soundcalc.zkvms.extension_selector import select_extension_degree
+from soundcalc.zkvms.variants import with_field
+from tests.conftest import make_circuit, make_fri_config
+
+
+def test_get_extension_field():
+    assert get_extension_field(BABYBEAR_4, 5) is BABYBEAR_5
+
+    field = get_extension_field(BABYBEAR_4, 3)
+    assert field.name == "BabyBear³"
+    assert field.p == BABYBEAR_P
+    assert field.F == float(BABYBEAR_P**3)
+    assert field.two_adicity == BABYBEAR_4.two_adicity
+    assert field.extension_field_element_size_bits() == 93
+
+    assert get_extension_field(GOLDILOCKS_3, 1).name == "Goldilocks"
+
+
+def test_current_degree_is_kept_for_current_security():
+    circuit = make_circuit(BABYBEAR_4)
+    selection = select_extension_degree(circuit)
+
+    assert selection.get_field() is BABYBEAR_4
+    assert selection.get_element_bits_saved() == 0
+    assert selection.get_proof_size_bits_saved() == 0
+
+
+def test_smaller_degree_for_lower_target():
+    circuit = make_circuit(BABYBEAR_5)
+    target_bits = with_field(circuit, get_extension_field(BABYBEAR_5, 3)).get_security_levels()["JBR"]["total"]
+    selection = select_extension_degree(circuit, target_bits=target_bits)
+
+    assert selection.get_field().field_extension_degree <= 3
+    assert selection.circuit.get_security_levels()["JBR"]["total"] >= target_bits
+    assert selection.get_element_bits_saved() >= 2 * 31
+    assert selection.get_proof_size_bits_saved() > 0
+
+
+def test_with_field_replaces_field_everywhere():
+    lookup = LogUp(LogUpConfig(name="range", field=BABYBEAR_4, logup_type=LogUpType.UNIVARIATE, rows_T=2**16, rows_L=2**20))
+    circuit = Circuit(CircuitConfig(
+        name="test",
+        pcs=FRI(make_fri_config(field=BABYBEAR_4, trace_length=2**20, FRI_folding_factors=[4] * 8)),
+        field=BABYBEAR_4,
+        lookups=[lookup],
+    ))
+
+    variant = with_field(circuit, BABYBEAR_5)
+    assert variant.field is BABYBEAR_5
+    assert variant.pcs.field is BABYBEAR_5
+    assert variant.get_lookups()[0].config.field is BABYBEAR_5
+
+
+def test_unreachable_target_is_rejected():
+    with pytest.raises(ValueError):
+        select_extension_degree(make_circuit(BABYBEAR_4), target_bits=1000)
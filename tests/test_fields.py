@@ -0,0 +1,55 @@
+# tests/test_fields.py
+"""Tests for the field registry."""
+
+import pytest
+
+from soundcalc.common.fields import (
+    BABYBEAR_4,
+    BABYBEAR_P,
+    BN254_1,
+    GOLDILOCKS_3,
+    KOALABEAR_4,
+    M31_4,
+    M31_6,
+    M31_P,
+    get_field,
+    get_two_adicity,
+    parse_field,
+)
+
+
+def test_two_adicity_of_presets():
+    assert GOLDILOCKS_3.two_adicity == 32
+    assert BABYBEAR_4.two_adicity == 27
+    assert KOALABEAR_4.two_adicity == 24
+    assert BN254_1.two_adicity == 28
+    # M31: 2-adicity of p^k - 1
+    assert M31_4.two_adicity == 33
+    assert M31_6.two_adicity == 32
+    assert get_two_adicity(M31_P, 2) == 32
+
+
+def test_field_size_is_exact():
+    assert BABYBEAR_4.F == float(BABYBEAR_P**4)
+    assert get_field(BABYBEAR_P, 6).extension_field_element_size_bits() == 6 * 31
+
+
+def test_parse_field_strings():
+    assert parse_field("BabyBear^4") is BABYBEAR_4
+    assert parse_field("p=2013265921^4") is BABYBEAR_4
+    assert parse_field("p=0x78000001^4") is BABYBEAR_4
+
+    field = parse_field("BabyBear^6")
+    assert field.name == "BabyBear⁶"
+    assert field.field_extension_degree == 6
+    assert field.two_adicity == 27
+
+    assert parse_field("Goldilocks") is get_field(GOLDILOCKS_3.p, 1)
+    assert parse_field("p=97^2").name == "F_97²"
+    assert parse_field("p=97^2").two_adicity == 5
+
+
+@pytest.mark.parametrize("field_str", ["Foo^4", "p=2013265923^4", "BabyBear^0", "BabyBear^x"])
+def test_parse_field_rejects_invalid_strings(field_str):
+    with pytest.raises(ValueError):
+        parse_field(field_str)
@@ -1,5 +1,16 @@
 # tests/test_fri.py
-from soundcalc.pcs.fri import get_FRI_proof_size_bits
+import random
+
+import pytest
+
+from soundcalc.pcs.fri import (
+    FRI,
+    CommitmentGroup,
+    get_FRI_expected_num_distinct_positions,
+    get_FRI_proof_size_bits,
+    get_FRI_proof_size_breakdown,
+)
+from tests.conftest import make_fri_config
 
 def test_get_FRI_proof_size_bits():
     hash_size_bits = 1
@@ -33,3 +44,65 @@ def test_get_FRI_proof_size_bits():
     )
 
     assert result == expected
+
+
+def test_get_FRI_proof_size_breakdown():
+    args = (1, 1, 3, 10, 64 * 2, [2, 2], 1/2)
+    for expected in (False, True):
+        breakdown = get_FRI_proof_size_breakdown(*args, expected)
+        assert list(breakdown) == ["roots", "initial openings", "round 1 openings", "round 2 openings", "final polynomial"]
+        assert breakdown["roots"] == 3
+        assert breakdown["final polynomial"] == 16
+        assert sum(breakdown.values()) == get_FRI_proof_size_bits(*args, expected)
+
+
+def test_commitment_groups_in_proof_size():
+    args = (1, 1, 3, 10, 64 * 2, [2, 2], 1/2, False)
+    groups = [CommitmentGroup("main", 2), CommitmentGroup("quotient", 1)]
+    breakdown = get_FRI_proof_size_breakdown(*args, commitment_groups=groups)
+
+    # One root per group, and one path per group and query
+    assert breakdown["roots"] == 4
+    assert breakdown["initial openings (main)"] == 10 * (7 + 2)
+    assert breakdown["initial openings (quotient)"] == 10 * (7 + 1)
+
+    # Merging the groups into one tree saves a root and a path per query
+    merged = get_FRI_proof_size_bits(*args, commitment_groups=[CommitmentGroup("all", 3)])
+    assert merged == get_FRI_proof_size_bits(*args)
+    assert sum(breakdown.values()) - merged == 1 + 10 * 7
+
+
+def test_commitment_group_widths_must_match_batch_size():
+    with pytest.raises(ValueError):
+        FRI(make_fri_config(commitment_groups=[CommitmentGroup("main", 4), CommitmentGroup("quotient", 4)]))
+
+
+def test_expected_distinct_positions_through_folding():
+    domain_size, folding_factors, num_queries = 2**12, [4, 4, 4, 4], 100
+    expected = get_FRI_expected_num_distinct_positions(domain_size, folding_factors, num_queries)
+
+    # Simulate: fold the query positions of every layer into the cosets of the next one
+    rng = random.Random(0)
+    trials = 500
+    simulated = [0] * len(expected)
+    for _ in range(trials):
+        positions = {rng.randrange(domain_size) for _ in range(num_queries)}
+        n = domain_size
+        simulated[0] += len(positions)
+        for i, folding_factor in enumerate(folding_factors):
+            n //= folding_factor
+            positions = {x % n for x in positions}
+            simulated[i + 1] += len(positions)
+
+    for e, s in zip(expected, simulated):
+        assert abs(e - s / trials) <= 0.05 * e + 1
+    # The final domain of 16 positions is (almost) fully opened
+    assert expected[-1] == 16
+
+
+def test_expected_proof_size_counts_distinct_leaves():
+    # With many queries into a small tree, every leaf is opened (and sent only once),
+    # and no sibling hashes are needed (up to rounding, at most one per level)
+    breakdown = get_FRI_proof_size_breakdown(1, 1, 3, 1000, 64 * 2, [2, 2], 1/2, True)
+    assert 128 * 3 <= breakdown["initial openings"] <= 128 * 3 + 7
+    assert 32 * 2 <= breakdown["round 2 openings"] <= 32 * 2 + 5
@@ -0,0 +1,83 @@
+# tests/test_fri_schedule.py
+"""Tests for the FRI folding schedule optimizer."""
+
+import math
+import time
+
+import pytest
+
+from soundcalc.common.fields import GOLDILOCKS_3
+from soundcalc.pcs.fri import FRI
+from soundcalc.pcs.fri_schedule import get_FRI_commit_round_bits, optimize_FRI_folding_schedule
+from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
+from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
+from tests.conftest import make_fri_config
+
+
+def _schedules(log_n: int, max_log_factor: int):
+    """All ordered factorizations of 2^log_n into powers of two up to 2^max_log_factor."""
+    if log_n == 0:
+        yield []
+        return
+    for log_factor in range(1, min(log_n, max_log_factor) + 1):
+        for rest in _schedules(log_n - log_factor, max_log_factor):
+            yield [2**log_factor] + rest
+
+
+def _commit_bits(fri: FRI, regime) -> int:
+    levels = fri.get_pcs_security_levels(regime)
+    return min(bits for name, bits in levels.items() if name.startswith("commit round"))
+
+
+@pytest.mark.parametrize("expected", [False, True])
+def test_optimizer_matches_brute_force(expected):
+    config = make_fri_config()
+    regime = UniqueDecodingRegime(GOLDILOCKS_3)
+
+    optimized = FRI(optimize_FRI_folding_schedule(config, regime, min_commit_bits=100, max_folding_factor=16, expected=expected))
+
+    # D / early stop = 2048 / 32 = 2^6
+    sizes = []
+    for folding_factors in _schedules(6, 4):
+        fri = FRI(make_fri_config(FRI_folding_factors=folding_factors))
+        if _commit_bits(fri, regime) >= 100:
+            sizes.append(sum(fri.get_proof_size_breakdown(expected).values()))
+
+    assert math.prod(optimized.FRI_folding_factors) == 2048 // 32
+    assert sum(optimized.get_proof_size_breakdown(expected).values()) == min(sizes)
+
+
+def test_optimizer_verifier_hashes():
+    config = make_fri_config()
+    regime = UniqueDecodingRegime(GOLDILOCKS_3)
+
+    optimized = FRI(optimize_FRI_folding_schedule(config, regime, min_commit_bits=100, objective="verifier_hashes", max_folding_factor=16))
+
+    best = min(
+        FRI(make_fri_config(FRI_folding_factors=folding_factors)).get_verifier_cost().hash_compressions
+        for folding_factors in _schedules(6, 4)
+    )
+    assert optimized.get_verifier_cost().hash_compressions == best
+
+
+def test_optimizer_respects_commit_security():
+    config = make_fri_config()
+    regime = JohnsonBoundRegime(GOLDILOCKS_3)
+
+    # The weakest round of any schedule is at most the round folding by 2 on the largest domain
+    max_bits = get_FRI_commit_round_bits(config, regime, 2048, 2)
+    optimized = FRI(optimize_FRI_folding_schedule(config, regime, min_commit_bits=max_bits - 1))
+    assert _commit_bits(optimized, regime) >= max_bits - 1
+
+    with pytest.raises(ValueError):
+        optimize_FRI_folding_schedule(config, regime, min_commit_bits=max_bits + 1)
+
+
+def test_optimizer_is_fast_for_large_domains():
+    config = make_fri_config(trace_length=2**28, rho=0.25, FRI_folding_factors=[2] * 24, FRI_early_stop_degree=64)
+    regime = UniqueDecodingRegime(GOLDILOCKS_3)
+
+    start = time.perf_counter()
+    optimized = FRI(optimize_FRI_folding_schedule(config, regime, min_commit_bits=100))
+    assert time.perf_counter() - start < 5
+    assert optimized.get_expected_proof_size_bits() <= FRI(config).get_expected_proof_size_bits()
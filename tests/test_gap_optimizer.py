@@ -0,0 +1,50 @@
+# tests/test_gap_optimizer.py
+"""Tests for the JBR gap optimizer."""
+
+import math
+from dataclasses import replace
+
+import pytest
+
+from soundcalc.common.fields import BABYBEAR_4, GOLDILOCKS_3
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms.gap_optimizer import get_jbr_total_bits, optimize_gap_to_radius
+from tests.conftest import make_circuit
+
+
+@pytest.mark.parametrize("field", [GOLDILOCKS_3, BABYBEAR_4])
+def test_optimal_gap_matches_fine_scan(field):
+    circuit = make_circuit(field)
+    result = optimize_gap_to_radius(circuit)
+
+    radius = 1 - math.sqrt(circuit.pcs.get_rate())
+    fine = max(get_jbr_total_bits(circuit, radius * j / 2000) or 0 for j in range(1, 2000))
+
+    assert result.bits == fine
+    assert result.bits >= result.baseline_bits
+    assert get_jbr_total_bits(circuit, result.gap_to_radius) == result.bits
+
+
+def test_optimal_gap_improves_on_heuristic():
+    # With few queries, the query phase dominates, so a smaller gap than the heuristic one helps
+    circuit = make_circuit(BABYBEAR_4, num_queries=30)
+    result = optimize_gap_to_radius(circuit)
+
+    assert result.baseline_gap_to_radius is None
+    assert result.baseline_bits == circuit.get_security_levels()["JBR"]["total"]
+    assert result.get_bits_gained() > 0
+
+
+def test_configured_gap_is_kept_if_optimal():
+    circuit = make_circuit()
+    optimal = optimize_gap_to_radius(circuit)
+    pinned = Circuit(replace(circuit.config, gap_to_radius=optimal.gap_to_radius))
+
+    result = optimize_gap_to_radius(pinned)
+    assert result.gap_to_radius == optimal.gap_to_radius
+    assert result.get_bits_gained() == 0
+
+
+def test_udr_only_circuit_is_rejected():
+    with pytest.raises(ValueError):
+        optimize_gap_to_radius(make_circuit(udr_only=True))
@@ -1,43 +1,24 @@
 # tests/test_grinding.py
-"""Tests for grinding parameters: grinding_commit_phase and grinding_deep."""
+"""Tests for grinding parameters (grinding_commit_phase, grinding_deep) and the grinding work."""
+
+from dataclasses import replace
 
 import pytest
 
 from soundcalc.common.fields import GOLDILOCKS_3
+from soundcalc.costs.throughput import ThroughputProfile
 from soundcalc.pcs.fri import FRI, FRIConfig
 from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
 from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
 from soundcalc.zkvms.circuit import Circuit, CircuitConfig
-
-
-def _make_fri_config(grinding_commit_phase: int = 0, grinding_query_phase: int = 0) -> FRIConfig:
-    """Create a minimal FRI config for testing.
-
-    Domain size D = trace_length / rho = 1024 / 0.5 = 2048
-    After folding by [4, 4, 4]: 2048 / 4 / 4 / 4 = 32
-    So FRI_early_stop_degree = 32
-    """
-    return FRIConfig(
-        hash_size_bits=256,
-        rho=0.5,
-        trace_length=1024,
-        field=GOLDILOCKS_3,
-        batch_size=10,
-        power_batching=True,
-        multilinear_batching=False,
-        num_queries=50,
-        FRI_folding_factors=[4, 4, 4],
-        FRI_early_stop_degree=32,
-        grinding_query_phase=grinding_query_phase,
-        grinding_commit_phase=grinding_commit_phase,
-    )
+from tests.conftest import make_fri_config
 
 
 @pytest.mark.parametrize("regime_cls", [UniqueDecodingRegime, JohnsonBoundRegime])
 def test_grinding_commit_phase_increases_security(regime_cls):
     """Test that grinding_commit_phase increases commit round security bits."""
-    fri_no_grind = FRI(_make_fri_config(grinding_commit_phase=0))
-    fri_with_grind = FRI(_make_fri_config(grinding_commit_phase=10))
+    fri_no_grind = FRI(make_fri_config(grinding_commit_phase=0))
+    fri_with_grind = FRI(make_fri_config(grinding_commit_phase=10))
 
     regime = regime_cls(GOLDILOCKS_3)
 
@@ -59,7 +40,7 @@ def test_grinding_commit_phase_increases_security(regime_cls):
 @pytest.mark.parametrize("regime_cls", [UniqueDecodingRegime, JohnsonBoundRegime])
 def test_grinding_deep_increases_security(regime_cls):
     """Test that grinding_deep increases DEEP security bits."""
-    pcs = FRI(_make_fri_config())
+    pcs = FRI(make_fri_config())
     regime = regime_cls(GOLDILOCKS_3)
 
     circuit_no_grind = Circuit(CircuitConfig(
@@ -116,7 +97,7 @@ def test_grinding_commit_phase_default_zero():
 
 def test_grinding_deep_default_zero():
     """Test that grinding_deep defaults to 0."""
-    pcs = FRI(_make_fri_config())
+    pcs = FRI(make_fri_config())
     config = CircuitConfig(
         name="test",
         pcs=pcs,
@@ -126,3 +107,28 @@ def test_grinding_deep_default_zero():
 
     circuit = Circuit(config)
     assert circuit.grinding_deep == 0
+
+
+def test_grinding_work_counts_every_step():
+    """Test that the grinding work covers the FRI phases, every commit round, and DEEP."""
+    pcs = FRI(make_fri_config(grinding_batching_phase=4, grinding_commit_phase=8, grinding_query_phase=16))
+    circuit = Circuit(CircuitConfig(name="test", pcs=pcs, field=GOLDILOCKS_3, grinding_deep=12))
+
+    assert sorted(circuit.get_grinding_bits()) == sorted([4, 16, 12] + [8] * pcs.FRI_rounds_n)
+    assert circuit.get_grinding_work() == 2**4 + 2**16 + 2**12 + pcs.FRI_rounds_n * 2**8
+
+    # DEEP grinding is part of the prover cost as well
+    assert circuit.get_prover_cost().grinding_hashes == circuit.get_grinding_work()
+
+
+def test_grinding_seconds_use_pow_hash_rate():
+    """Test that grinding time uses the PoW hash rate of the profile, if set."""
+    pcs = FRI(make_fri_config(grinding_commit_phase=0, grinding_query_phase=20))
+    circuit = Circuit(CircuitConfig(name="test", pcs=pcs, field=GOLDILOCKS_3))
+
+    profile = ThroughputProfile(name="test", hash_compressions_per_second=2**10)
+    assert circuit.get_grinding_seconds(profile) == 2**10
+
+    pow_profile = replace(profile, grinding_hashes_per_second=2**16)
+    assert circuit.get_grinding_seconds(pow_profile) == 2**4
+    assert ThroughputProfile.from_dict(pow_profile.to_dict()) == pow_profile
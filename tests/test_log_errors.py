@@ -0,0 +1,73 @@
+# tests/test_log_errors.py
+"""Tests for carrying soundness errors as log2 values."""
+
+import math
+
+import pytest
+
+from soundcalc.common.utils import (
+    MAX_SECURITY_BITS,
+    apply_grinding,
+    get_bits_of_security_from_log_error,
+    get_log_error,
+    log2_sum,
+)
+from soundcalc.pcs.fri import FRI
+from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
+from tests.conftest import make_fri_config
+
+
+def test_log2_sum():
+    assert log2_sum(-10, -10) == -9
+    assert math.isclose(log2_sum(-3, -2), math.log2(2**-3 + 2**-2))
+    assert log2_sum(-5, -math.inf) == -5
+    assert log2_sum(-math.inf, -math.inf) == -math.inf
+    # Terms far below 2^-1074 do not underflow
+    assert log2_sum(-5000, -5000) == -4999
+
+
+def test_log_error_and_bits():
+    assert get_log_error(0.0) == -math.inf
+    assert get_log_error(2**-40) == -40
+    assert get_bits_of_security_from_log_error(-40) == 40
+    assert get_bits_of_security_from_log_error(-40.5) == 40
+    assert apply_grinding(-40, 16) == -56
+
+
+def test_many_queries_do_not_underflow():
+    regime = UniqueDecodingRegime(make_fri_config().field)
+
+    # (1 - δ)^t is far below the smallest float for t = 5000
+    fri = FRI(make_fri_config(num_queries=5000, grinding_query_phase=0))
+    bits = fri.get_pcs_security_levels(regime)["query phase"]
+    assert bits == math.floor(-5000 * math.log2(1 - regime.get_proximity_parameter(fri.rho, fri.get_dimension())))
+    assert bits > 1000
+
+
+def test_zero_error_is_capped():
+    """A zero error (log2 error -inf) maps to MAX_SECURITY_BITS instead of overflowing."""
+    assert get_bits_of_security_from_log_error(-math.inf) == MAX_SECURITY_BITS
+    assert get_bits_of_security_from_log_error(log2_sum(-math.inf, -math.inf)) == MAX_SECURITY_BITS
+
+    # Batching a single function with powers has no error
+    fri = FRI(make_fri_config(batch_size=1))
+    levels = fri.get_pcs_security_levels(UniqueDecodingRegime(fri.field))
+    assert levels["batching"] == MAX_SECURITY_BITS
+    assert levels["query phase"] < MAX_SECURITY_BITS
+
+
+def test_log_errors_vectorize():
+    np = pytest.importorskip("numpy")
+
+    num_queries = np.arange(1, 6001)
+    log_errors = apply_grinding(num_queries * math.log2(0.75), np.full(len(num_queries), 16))
+    bits = get_bits_of_security_from_log_error(log_errors)
+    # Matches the scalar path, and thousands of queries do not underflow
+    assert list(bits) == [get_bits_of_security_from_log_error(q * math.log2(0.75) - 16) for q in range(1, 6001)]
+    assert bits[-1] > 2000
+
+    summed = log2_sum(log_errors, -20, np.full(len(num_queries), -math.inf))
+    assert math.isclose(summed[0], log2_sum(math.log2(0.75) - 16, -20))
+    assert math.isclose(summed[-1], -20)
+
+    assert list(get_log_error(np.array([0.0, 0.25]))) == [-math.inf, -2]
@@ -0,0 +1,141 @@
+# tests/test_merkle.py
+"""Tests for the Merkle tree proof size and hash count estimates."""
+
+import random
+from dataclasses import replace
+from pathlib import Path
+
+from soundcalc.common.utils import (
+    get_merkle_cap_size_bits,
+    get_merkle_tree_depth,
+    get_num_merkle_multi_proof_compressions,
+    get_num_merkle_multi_proof_hashes_expected,
+    get_num_merkle_tree_inner_nodes,
+    get_optimal_merkle_cap_height,
+    get_size_of_merkle_multi_proof_bits,
+    get_size_of_merkle_proof_bits,
+    resolve_merkle_cap_height,
+)
+from soundcalc.pcs.fri import FRI
+from soundcalc.pcs.whir import WHIR
+from soundcalc.zkvms.zkvm import zkVM
+from tests.conftest import make_fri_config
+
+
+def _simulate_num_sibling_hashes(num_leafs: int, num_openings: int, arity: int, trials: int) -> float:
+    """Average number of siblings that are not on any opened path, over random openings."""
+    rng = random.Random(0)
+    depth = get_merkle_tree_depth(num_leafs, arity)
+    total = 0
+    for _ in range(trials):
+        level = {rng.randrange(num_leafs) for _ in range(num_openings)}
+        for _ in range(depth):
+            parents = {node // arity for node in level}
+            total += len(parents) * arity - len(level)
+            level = parents
+    return total / trials
+
+
+def test_tree_shape():
+    assert get_merkle_tree_depth(2**12, 2) == 12
+    assert get_merkle_tree_depth(2**12, 4) == 6
+    assert get_merkle_tree_depth(2**12, 8) == 4
+    assert get_merkle_tree_depth(2**12, 16) == 3
+    assert get_num_merkle_tree_inner_nodes(2**12, 2) == 2**12 - 1
+    assert get_num_merkle_tree_inner_nodes(4**6, 4) == (4**6 - 1) // 3
+
+
+def test_k_ary_merkle_path():
+    # 4096 leaves of 2 elements of 8 bits, 16-bit hashes, 8-ary tree of depth 4:
+    # the leaf, 7 sibling leaves (hashed, since 16 bits <= 16 bits) and 3 levels of 7 sibling hashes
+    assert get_size_of_merkle_proof_bits(2**12, 2, 8, 16, arity=8) == 16 + 7 * 16 + 3 * 7 * 16
+    # Binary trees are the default
+    assert get_size_of_merkle_proof_bits(2**12, 2, 8, 16) == get_size_of_merkle_proof_bits(2**12, 2, 8, 16, arity=2)
+
+
+def test_expected_k_ary_multi_proof_matches_simulation():
+    for arity in (2, 4, 8, 16):
+        num_leafs = arity ** (12 // (arity.bit_length() - 1))
+        expected = get_num_merkle_multi_proof_hashes_expected(num_leafs, 50, arity)
+        simulated = _simulate_num_sibling_hashes(num_leafs, 50, arity, trials=200)
+        # The estimate rounds up per level, so it can only be slightly larger
+        assert simulated <= expected <= simulated * 1.05 + 12
+
+
+def test_expected_is_at_most_worst_case():
+    for arity in (2, 4, 16):
+        worst = get_size_of_merkle_multi_proof_bits(2**16, 80, 4, 64, 256, expected=False, arity=arity)
+        expected = get_size_of_merkle_multi_proof_bits(2**16, 80, 4, 64, 256, expected=True, arity=arity)
+        assert expected <= worst
+
+
+def test_wider_trees_trade_proof_size_for_hashes():
+    binary = FRI(make_fri_config())
+    wide = FRI(make_fri_config(merkle_arity=16))
+
+    # Wider trees have shorter paths, but more siblings per level
+    assert wide.get_proof_size_bits() > binary.get_proof_size_bits()
+    # ... while the prover computes fewer (wider) inner nodes, and stores fewer digests
+    assert wide.get_prover_cost().merkle_node_compressions < binary.get_prover_cost().merkle_node_compressions
+    assert wide.get_prover_memory().merkle_bits < binary.get_prover_memory().merkle_bits
+
+
+def test_merkle_cap_shortens_paths():
+    assert get_merkle_cap_size_bits(2**12, 256) == 256
+    assert get_merkle_cap_size_bits(2**12, 256, cap_height=3) == 8 * 256
+    # Cap heights beyond the depth of the tree are clamped
+    assert get_merkle_cap_size_bits(2**4, 256, cap_height=10) == 16 * 256
+
+    full_path = get_size_of_merkle_proof_bits(2**12, 4, 64, 256)
+    assert get_size_of_merkle_proof_bits(2**12, 4, 64, 256, cap_height=3) == full_path - 3 * 256
+    # With the whole tree as the cap, only the leaf remains
+    assert get_size_of_merkle_proof_bits(2**12, 4, 64, 256, cap_height=12) == 4 * 64
+
+
+def test_auto_cap_height_minimizes_expected_size():
+    fri_sizes = {}
+    for cap_height in range(12):
+        fri_sizes[cap_height] = FRI(make_fri_config(merkle_cap_height=cap_height)).get_expected_proof_size_bits()
+    auto = FRI(make_fri_config(merkle_cap_height="auto")).get_expected_proof_size_bits()
+    # "auto" picks the height per tree, so it is at least as good as any single height
+    assert auto <= min(fri_sizes.values())
+
+    # The top of the tree is already shared between the paths of a multi-proof,
+    # so a cap does not pay off in the expected case
+    assert get_optimal_merkle_cap_height(2**10, 1, 1, 64, 256) == 0
+    assert get_optimal_merkle_cap_height(2**10, 1000, 1, 64, 256) == 0
+
+
+def test_auto_cap_height_matches_proof_size_in_verifier_cost():
+    fri = FRI(make_fri_config(batch_size=40, merkle_cap_height="auto"))
+    ext_field_bits = fri.field.extension_field_element_size_bits()
+
+    # Resolve every tree's cap as the proof size does, then count the verifier's compressions with it
+    n = int(fri.D)
+    trees = [(n, fri.batch_size)]
+    for folding_factor in fri.FRI_folding_factors:
+        n //= folding_factor
+        trees.append((n, folding_factor))
+    compressions = 0
+    for num_leafs, tuple_size in trees:
+        cap_height = resolve_merkle_cap_height(
+            "auto", num_leafs, fri.num_queries, tuple_size, ext_field_bits, fri.hash_size_bits)
+        compressions += get_num_merkle_multi_proof_compressions(
+            num_leafs, fri.num_queries, tuple_size, ext_field_bits, fri.hash_size_bits, False, 2, cap_height)
+    assert fri.get_verifier_cost(expected=False).hash_compressions == compressions
+
+
+def test_merkle_cap_in_worst_case_proof_size():
+    binary = FRI(make_fri_config())
+    capped = FRI(make_fri_config(merkle_cap_height=4))
+    assert capped.get_proof_size_bits() < binary.get_proof_size_bits()
+    assert capped.get_verifier_cost(expected=False).hash_compressions < binary.get_verifier_cost(expected=False).hash_compressions
+
+
+def test_merkle_cap_for_whir():
+    toml_path = Path(__file__).parent.parent / "soundcalc" / "zkvms" / "dummy_whir" / "dummy_whir.toml"
+    whir = zkVM.load_from_toml(toml_path).get_circuits()[0].pcs
+
+    capped = WHIR(replace(whir.config, merkle_cap_height=4))
+    assert capped.get_proof_size_bits() < whir.get_proof_size_bits()
+    assert sum(capped.get_proof_size_breakdown(expected=True).values()) == capped.get_expected_proof_size_bits()
@@ -0,0 +1,67 @@
+# tests/test_pipeline.py
+"""Tests for recursion/aggregation pipelines."""
+
+from pathlib import Path
+
+import pytest
+
+from soundcalc.zkvms.pipeline import Pipeline, PipelineLayer
+from soundcalc.zkvms.zkvm import zkVM
+
+
+DUMMY_WHIR_TOML = Path(__file__).parent.parent / "soundcalc" / "zkvms" / "dummy_whir" / "dummy_whir.toml"
+
+
+def _load_dummy_whir() -> zkVM:
+    return zkVM.load_from_toml(DUMMY_WHIR_TOML)
+
+
+def test_pipeline_is_loaded_from_toml():
+    zkvm = _load_dummy_whir()
+    pipeline = zkvm.pipeline
+    assert pipeline is not None
+    assert [layer.get_name() for layer in pipeline.get_layers()] == ["riscv", "convert", "combine", "embed"]
+    assert zkvm.get_final_circuit().get_name() == "embed"
+
+
+def test_num_proofs_per_layer():
+    pipeline = _load_dummy_whir().pipeline
+    assert pipeline.get_num_proofs() == [1, 1, 1, 1]
+    # 16 segments: 16 convert proofs, a binary tree of 8 + 4 + 2 + 1 combine proofs, one embed proof
+    assert pipeline.get_num_proofs(16) == [16, 16, 15, 1]
+    assert pipeline.get_num_proofs(5) == [5, 5, 3 + 2 + 1, 1]
+
+
+def test_end_to_end_figures():
+    zkvm = _load_dummy_whir()
+    pipeline = zkvm.pipeline
+    circuits = zkvm.get_circuits()
+
+    assert pipeline.get_final_proof_size_bits() == circuits[-1].get_proof_size_bits()
+    assert pipeline.get_prover_seconds() == pytest.approx(sum(c.get_prover_seconds() for c in circuits))
+
+    seconds = pipeline.get_layer_prover_seconds(num_segments=4)
+    assert seconds[0] == pytest.approx(4 * circuits[0].get_prover_seconds())
+
+    regime, bits, circuit_name = pipeline.get_weakest_link()
+    assert bits == min(c.get_security_levels()[regime]["total"] for c in circuits)
+    assert circuit_name in [c.get_name() for c in circuits]
+
+
+def test_arithmetized_verifier_cost():
+    pipeline = _load_dummy_whir().pipeline
+    layers = pipeline.get_layers()
+    assert pipeline.get_arithmetized_verifier_cost(0) is None
+    assert pipeline.get_arithmetized_verifier_cost(1) == layers[0].circuit.get_verifier_cost()
+    combine = pipeline.get_arithmetized_verifier_cost(2)
+    assert combine.hash_compressions >= 2 * layers[1].circuit.get_verifier_cost().hash_compressions
+
+
+def test_invalid_pipelines_are_rejected():
+    circuits = _load_dummy_whir().get_circuits()
+    with pytest.raises(ValueError):
+        Pipeline.from_toml_config({"layers": [{"circuit": "does_not_exist"}]}, circuits)
+    with pytest.raises(ValueError):
+        Pipeline([PipelineLayer(circuits[0]), PipelineLayer(circuits[1], arity=1, recursive=True)])
+    with pytest.raises(ValueError):
+        Pipeline([])
@@ -0,0 +1,23 @@
+# tests/test_proof_size.py
+"""The per-component proof size breakdown must add up to the proof size."""
+
+from pathlib import Path
+
+import pytest
+
+from soundcalc.zkvms.zkvm import zkVM
+
+
+ZKVMS_DIR = Path(__file__).parent.parent / "soundcalc" / "zkvms"
+
+
+@pytest.mark.parametrize("name", ["dummy_whir", "dummy_stir", "pico", "sp1"])
+def test_breakdown_sums_to_proof_size(name):
+    zkvm = zkVM.load_from_toml(ZKVMS_DIR / name / f"{name}.toml")
+    for circuit in zkvm.get_circuits():
+        worst = circuit.get_proof_size_breakdown(expected=False)
+        expected = circuit.get_proof_size_breakdown(expected=True)
+        assert list(worst) == list(expected)
+        assert sum(worst.values()) == circuit.get_proof_size_bits()
+        assert sum(expected.values()) == circuit.get_expected_proof_size_bits()
+        assert all(bits >= 0 for bits in worst.values())
@@ -0,0 +1,65 @@
+# tests/test_rate_advisor.py
+"""Tests for the rate advisor."""
+
+from dataclasses import replace
+
+import pytest
+
+from soundcalc.pcs.fri import FRI
+from soundcalc.zkvms.circuit import Circuit
+from soundcalc.zkvms import dummy_stir, dummy_whir
+from soundcalc.zkvms.rate_advisor import advise_rate, solve_min_num_queries
+from tests.conftest import make_circuit
+
+
+def _total_bits(option, regime) -> int:
+    return option.circuit.get_security_levels()[regime]["total"]
+
+
+def test_fri_num_queries_is_minimal():
+    circuit = make_circuit()
+    advice = advise_rate(circuit, log_inv_rates=[1, 2, 3])
+
+    assert advice.regime == "JBR"
+    assert advice.target_bits == circuit.get_security_levels()["JBR"]["total"]
+    for option in advice.options:
+        [num_queries] = option.num_queries
+        assert _total_bits(option, "JBR") >= advice.target_bits
+        pcs = FRI(replace(option.circuit.pcs.config, num_queries=num_queries - 1))
+        fewer = Circuit(replace(option.circuit.config, pcs=pcs))
+        assert fewer.get_security_levels()["JBR"]["total"] < advice.target_bits
+
+    # Lower rates need fewer queries
+    counts = [option.num_queries[0] for option in advice.options]
+    assert counts == sorted(counts, reverse=True)
+
+
+def test_configured_rate_needs_at_most_configured_queries():
+    circuit = make_circuit()
+    [num_queries] = solve_min_num_queries(circuit, circuit.pcs.k, "JBR", circuit.get_security_levels()["JBR"]["total"])
+    assert num_queries <= circuit.pcs.num_queries
+
+
+def test_whir_num_queries_per_iteration():
+    circuit = dummy_whir.load().get_circuits()[0]
+    target_bits = circuit.get_security_levels()["JBR"]["total"]
+    log_inv_rate = circuit.pcs.config.log_inv_rate
+
+    num_queries = solve_min_num_queries(circuit, log_inv_rate, "JBR", target_bits)
+    assert len(num_queries) == circuit.pcs.num_iterations
+    assert all(solved <= configured for solved, configured in zip(num_queries, circuit.pcs.num_queries))
+
+
+def test_weights_pick_recommendation():
+    circuit = make_circuit()
+
+    smallest_proof = advise_rate(circuit, domain_size_weight=0)
+    assert smallest_proof.get_recommended().get_proof_size_bits() == min(o.get_proof_size_bits() for o in smallest_proof.options)
+
+    smallest_domain = advise_rate(circuit, proof_size_weight=0)
+    assert smallest_domain.get_recommended().log_inv_rate == min(o.log_inv_rate for o in smallest_domain.options)
+
+
+def test_unsupported_pcs_is_rejected():
+    with pytest.raises(ValueError):
+        advise_rate(dummy_stir.load().get_circuits()[0])
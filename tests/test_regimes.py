@@ -0,0 +1,70 @@
+# tests/test_regimes.py
+"""Tests for configurable regimes."""
+
+from dataclasses import replace
+
+import pytest
+
+from soundcalc.common.fields import GOLDILOCKS_3
+from soundcalc.proxgaps.conjectured import ConjecturedRegime
+from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
+from soundcalc.proxgaps.regimes import parse_regime
+from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
+from soundcalc.zkvms import dummy_whir
+from soundcalc.zkvms.circuit import Circuit
+from tests.conftest import make_circuit
+
+
+def _make_circuit(regimes=None, udr_only=False) -> Circuit:
+    return Circuit(replace(make_circuit(udr_only=udr_only).config, regimes=regimes))
+
+
+def test_parse_regime():
+    assert isinstance(parse_regime("UDR", GOLDILOCKS_3), UniqueDecodingRegime)
+    assert parse_regime("JBR", GOLDILOCKS_3, gap_to_radius=0.01).gap_to_radius == 0.01
+
+    regime = parse_regime("CONJ:0.01", GOLDILOCKS_3)
+    assert isinstance(regime, ConjecturedRegime)
+    assert regime.identifier() == "CONJ:0.01"
+    assert regime.eta == 0.01
+    assert not regime.is_proven()
+
+
+@pytest.mark.parametrize("regime_str", ["FOO", "UDR:1", "CONJ:x"])
+def test_parse_regime_rejects_invalid_strings(regime_str):
+    with pytest.raises(ValueError):
+        parse_regime(regime_str, GOLDILOCKS_3)
+
+
+def test_configured_regimes():
+    circuit = _make_circuit(regimes=["JBR", "CONJ"])
+    assert list(circuit.get_security_levels()) == ["JBR", "CONJ"]
+    assert list(circuit.get_security_levels(proven_only=True)) == ["JBR"]
+    assert circuit.get_reference_regime() == "JBR"
+
+    # Every regime gives the same levels as when analyzed on its own
+    for regime in circuit.regimes:
+        assert circuit.get_security_levels()[regime.identifier()] == circuit.get_regime_security_levels(regime)
+
+    assert _make_circuit().get_regime_ids() == ["UDR", "JBR"]
+    assert _make_circuit(udr_only=True, regimes=["UDR", "JBR", "CONJ"]).get_regime_ids() == ["UDR"]
+    assert _make_circuit(regimes=["CONJ"]).get_reference_regime() == "CONJ"
+
+
+def test_duplicate_regimes_are_rejected():
+    with pytest.raises(ValueError):
+        _make_circuit(regimes=["UDR", "UDR"])
+
+
+def test_zkvm_with_regimes():
+    zkvm = dummy_whir.load().with_regimes(["UDR", "CONJ"])
+    assert all(circuit.get_regime_ids() == ["UDR", "CONJ"] for circuit in zkvm.get_circuits())
+    # The pipeline refers to the new circuits
+    assert zkvm.get_final_circuit() in zkvm.get_circuits()
+    assert zkvm.pipeline.get_weakest_link()[0] == "UDR"
+
+
+def test_regime_classes_are_unchanged():
+    circuit = _make_circuit()
+    assert isinstance(circuit.regimes[0], UniqueDecodingRegime)
+    assert isinstance(circuit.regimes[1], JohnsonBoundRegime)
@@ -0,0 +1,65 @@
+# tests/test_stir.py
+"""Tests for the STIR PCS model."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from soundcalc.pcs.stir import STIR
+from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
+from soundcalc.zkvms.zkvm import zkVM
+
+ZKVMS_DIR = Path(__file__).parent.parent / "soundcalc" / "zkvms"
+
+
+def _load_stir_circuit():
+    return zkVM.load_from_toml(ZKVMS_DIR / "dummy_stir" / "dummy_stir.toml").get_circuits()[0]
+
+
+def test_stir_rates_shift_per_iteration():
+    pcs = _load_stir_circuit().pcs
+    assert isinstance(pcs, STIR)
+
+    # The degree shrinks by k = 16, the domain halves
+    assert pcs.log_degrees == [22, 18, 14, 10, 6]
+    assert pcs.log_domain_sizes == [26, 25, 24, 23, 22]
+    assert pcs.log_inv_rates == [4, 7, 10, 13, 16]
+
+
+def test_stir_security_levels():
+    circuit = _load_stir_circuit()
+    levels = circuit.get_security_levels()
+
+    assert levels["JBR"]["total"] >= 128
+    assert levels["UDR"]["total"] < levels["JBR"]["total"]
+    assert set(levels["JBR"]) >= {"batching", "fold(i=0)", "OOD(i=1)", "Shift(i=1)", "fold(i=4)", "fin"}
+
+
+def test_stir_more_queries_more_security():
+    pcs = _load_stir_circuit().pcs
+    regime = JohnsonBoundRegime(pcs.field)
+    more_queries = STIR(replace(pcs.config, num_queries=[q + 10 for q in pcs.num_queries]))
+
+    assert more_queries.get_pcs_security_levels(regime)["fin"] > pcs.get_pcs_security_levels(regime)["fin"]
+    assert more_queries.get_proof_size_bits() > pcs.get_proof_size_bits()
+
+
+def test_stir_matches_whir_tree_sizes():
+    """STIR and WHIR commit to f_0 in the same way, so the initial openings agree."""
+    stir = _load_stir_circuit()
+    whir = zkVM.load_from_toml(ZKVMS_DIR / "dummy_whir" / "dummy_whir.toml").get_circuits()[0]
+
+    for expected in (False, True):
+        stir_breakdown = stir.get_proof_size_breakdown(expected)
+        whir_breakdown = whir.get_proof_size_breakdown(expected)
+        assert stir_breakdown["initial openings"] == whir_breakdown["initial openings"]
+
+
+def test_stir_invalid_config():
+    pcs = _load_stir_circuit().pcs
+    with pytest.raises(AssertionError):
+        STIR(replace(pcs.config, num_queries=pcs.num_queries[:-1]))
+    with pytest.raises(AssertionError):
+        # Folding 22 log degree 6 times by 4 is too much
+        STIR(replace(pcs.config, num_iterations=5))
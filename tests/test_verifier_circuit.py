@@ -0,0 +1,100 @@
+# tests/test_verifier_circuit.py
+"""Tests for the verifier-circuit size estimator."""
+
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from soundcalc import report_md
+from soundcalc.costs.verifier import VerifierCost
+from soundcalc.pcs.fri import FRI
+from soundcalc.zkvms.pipeline import Pipeline
+from soundcalc.zkvms.verifier_circuit import (
+    VerifierCircuitModel,
+    get_FRI_config_for_trace_length,
+    get_circuit_for_trace_length,
+    get_fixed_point_pipeline,
+)
+from soundcalc.zkvms.zkvm import zkVM
+
+from tests.conftest import make_fri_config
+
+
+PICO_TOML = Path(__file__).parent.parent / "soundcalc" / "zkvms" / "pico" / "pico.toml"
+DUMMY_WHIR_TOML = Path(__file__).parent.parent / "soundcalc" / "zkvms" / "dummy_whir" / "dummy_whir.toml"
+
+
+def test_model_rounds_up_to_power_of_two():
+    model = VerifierCircuitModel(rows_per_hash_compression=2, rows_per_ext_field_mult=1, fixed_rows=0)
+    assert model.get_trace_length(VerifierCost(hash_compressions=100, ext_field_mults=100)) == 512
+    assert model.get_trace_length(VerifierCost(hash_compressions=128, ext_field_mults=0)) == 256
+
+
+def test_resized_fri_config_keeps_final_domain():
+    config = make_fri_config()  # D = 2048, folded by [4, 4, 4] down to 32
+
+    larger = get_FRI_config_for_trace_length(config, 4096)
+    assert larger.FRI_folding_factors == [4, 4, 4, 4]
+    assert larger.FRI_early_stop_degree == 32
+
+    smaller = get_FRI_config_for_trace_length(config, 128)
+    assert smaller.FRI_folding_factors == [4, 2]
+    assert smaller.FRI_early_stop_degree == 32
+
+    # Must be accepted by FRI, which checks the folding schedule
+    FRI(larger)
+    FRI(smaller)
+
+
+def test_fixed_point_is_consistent():
+    model = VerifierCircuitModel()
+    pipeline = get_fixed_point_pipeline(zkVM.load_from_toml(PICO_TOML).pipeline, model)
+
+    for i, layer in enumerate(pipeline.get_layers()[1:], start=1):
+        expected = model.get_trace_length(pipeline.get_arithmetized_verifier_cost(i))
+        assert layer.circuit.pcs.get_trace_length() == expected
+
+
+def test_fewer_queries_shrink_the_recursion():
+    pipeline = zkVM.load_from_toml(PICO_TOML).pipeline
+
+    def with_queries(circuit, num_queries):
+        pcs = FRI(replace(circuit.pcs.config, num_queries=num_queries))
+        return get_circuit_for_trace_length(
+            type(circuit)(replace(circuit.config, pcs=pcs)), circuit.pcs.get_trace_length()
+        )
+
+    fewer = Pipeline([replace(layer, circuit=with_queries(layer.circuit, 20)) for layer in pipeline.get_layers()])
+
+    baseline = get_fixed_point_pipeline(pipeline)
+    reduced = get_fixed_point_pipeline(fewer)
+    for a, b in zip(baseline.get_layers()[1:], reduced.get_layers()[1:]):
+        assert b.circuit.pcs.get_trace_length() <= a.circuit.pcs.get_trace_length()
+    assert reduced.get_prover_seconds() < baseline.get_prover_seconds()
+
+
+def test_non_fri_circuits_are_rejected():
+    with pytest.raises(ValueError):
+        get_fixed_point_pipeline(zkVM.load_from_toml(DUMMY_WHIR_TOML).pipeline)
+
+
+def test_model_from_toml_config():
+    model = VerifierCircuitModel.from_toml_config(
+        {"rows_per_hash_compression": 24, "rows_per_ext_field_mult": 2, "fixed_rows": 2**10}
+    )
+    assert model == VerifierCircuitModel(rows_per_hash_compression=24, rows_per_ext_field_mult=2, fixed_rows=2**10)
+
+
+def test_report_shows_fixed_point_only_with_fitted_model():
+    label = "Estimated recursion trace lengths"
+    pipeline = zkVM.load_from_toml(PICO_TOML).pipeline
+    assert not any(label in line for line in report_md._build_pipeline_section(pipeline))
+
+    lines = report_md._build_pipeline_section(pipeline, verifier_circuit_model=VerifierCircuitModel())
+    assert any(label in line and "configured" in line for line in lines)
+
+    # Non-FRI recursion layers are not supported by the model
+    whir_pipeline = zkVM.load_from_toml(DUMMY_WHIR_TOML).pipeline
+    lines = report_md._build_pipeline_section(whir_pipeline, verifier_circuit_model=VerifierCircuitModel())
+    assert any(label in line and "n/a (FRI only)" in line for line in lines)
@@ -0,0 +1,57 @@
+# tests/test_whir_schedule.py
+"""Tests for the precomputed WHIR round schedule."""
+
+from pathlib import Path
+
+from soundcalc.pcs.whir import WHIR
+from soundcalc.proxgaps.johnson_bound import JohnsonBoundRegime
+from soundcalc.proxgaps.unique_decoding import UniqueDecodingRegime
+from soundcalc.zkvms.zkvm import zkVM
+
+ZKVMS_DIR = Path(__file__).parent.parent / "soundcalc" / "zkvms"
+
+
+def _load_whir():
+    circuit = zkVM.load_from_toml(ZKVMS_DIR / "dummy_whir" / "dummy_whir.toml").get_circuits()[0]
+    assert isinstance(circuit.pcs, WHIR)
+    return circuit.pcs
+
+
+def test_schedule_covers_all_iterations_and_rounds():
+    pcs = _load_whir()
+    schedule = pcs.round_schedule
+    k = pcs.folding_factor
+
+    assert len(schedule.rows) == pcs.num_iterations * (k + 1)
+    for i in range(pcs.num_iterations):
+        assert schedule.get_domain_size(i) == 2 ** (pcs.log_degrees[i] + pcs.log_inv_rates[i])
+        for s in range(k + 1):
+            row = schedule.get(i, s)
+            assert (row.iteration, row.round) == (i, s)
+            assert row.dimension == 2 ** (pcs.log_degrees[i] - s)
+            assert row.log_domain_size == pcs.log_degrees[i] + pcs.log_inv_rates[i] - s
+            assert row.delta is None and row.list_size is None
+
+
+def test_schedule_with_regime():
+    pcs = _load_whir()
+    regime = JohnsonBoundRegime(pcs.field)
+    schedule = pcs.get_round_schedule(regime)
+
+    assert schedule.regime == "JBR"
+    for i in range(pcs.num_iterations):
+        rows = [schedule.get(i, s) for s in range(pcs.folding_factor + 1)]
+        # delta_i is shared by all rounds of an iteration, and supported on all of them
+        assert len({row.delta for row in rows}) == 1
+        assert rows[0].delta == min(regime.get_proximity_parameter(row.rate, row.dimension) for row in rows)
+        for row in rows:
+            assert row.list_size == regime.get_max_list_size(row.rate, row.dimension)
+
+
+def test_schedule_export():
+    pcs = _load_whir()
+    dicts = pcs.get_round_schedule(UniqueDecodingRegime(pcs.field)).to_dicts()
+
+    assert len(dicts) == len(pcs.round_schedule.rows)
+    assert set(dicts[0]) >= {"iteration", "round", "rate", "dimension", "delta", "list_size"}
+    assert all(row["delta"] is not None for row in dicts)